@@ -0,0 +1,89 @@
+"""
+Compare the lookup-table easterify effect against the original per-pixel implementation.
+
+Run from the repository root with `python -m benchmarks.easterify`.
+"""
+import os
+import random
+import time
+from collections.abc import Callable
+from io import BytesIO
+
+os.environ.setdefault("CLIENT_TOKEN", "benchmark")
+
+from PIL import Image, ImageOps
+
+from bot.exts.avatar_modification._effects import PfpEffects
+
+ROUNDS = 3
+
+
+def legacy_easterify(image: Image.Image) -> Image.Image:
+    """The per-pixel easterify implementation that `EASTER_LUT` replaced, without the overlay."""
+    alpha = image.getchannel("A").getdata()
+    image = image.convert("RGB")
+    image = ImageOps.posterize(image, 6)
+
+    data = image.getdata()
+    easterified_data_set = {x: PfpEffects.closest(x) for x in set(data)}
+    new_pixel_data = [(*easterified_data_set[x], alpha[i]) for i, x in enumerate(data)]
+
+    im = Image.new("RGBA", image.size)
+    im.putdata(new_pixel_data)
+    return im
+
+
+def lut_easterify(image: Image.Image) -> Image.Image:
+    """The lookup-table easterify implementation, without the overlay."""
+    # A fully transparent overlay leaves the easterified pixels untouched.
+    return PfpEffects.easterify_effect(image, Image.new("RGBA", (1, 1)))
+
+
+def synthetic_avatars() -> dict[str, Image.Image]:
+    """Build a noisy worst case and a smooth gradient case, both at the size `apply_effect` works with."""
+    rng = random.Random(0)
+    noise = Image.frombytes("RGBA", (1024, 1024), rng.randbytes(1024 * 1024 * 4))
+
+    gradient = Image.merge("RGBA", (
+        Image.linear_gradient("L").resize((1024, 1024)),
+        Image.radial_gradient("L").resize((1024, 1024)),
+        Image.linear_gradient("L").rotate(90).resize((1024, 1024)),
+        Image.new("L", (1024, 1024), 255),
+    ))
+    return {"noise": noise, "gradient": gradient}
+
+
+def best_time(func: Callable[[Image.Image], Image.Image], image: Image.Image) -> tuple[float, Image.Image]:
+    """Return the fastest of `ROUNDS` runs of `func` and its last result."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = func(image.copy())
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def png_bytes(image: Image.Image) -> bytes:
+    """Encode the image the same way `PfpEffects.apply_effect` does."""
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def main() -> None:
+    """Time both implementations on each synthetic avatar and check their output is identical."""
+    for name, image in synthetic_avatars().items():
+        legacy_time, legacy_result = best_time(legacy_easterify, image)
+        lut_time, lut_result = best_time(lut_easterify, image)
+
+        if png_bytes(legacy_result) != png_bytes(lut_result):
+            raise SystemExit(f"{name}: lookup-table output differs from the per-pixel implementation.")
+
+        print(  # noqa: T201
+            f"{name:>10}: per-pixel {legacy_time * 1000:8.1f}ms | "
+            f"lookup table {lut_time * 1000:8.1f}ms | {legacy_time / lut_time:6.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Benchmark the bot's image-processing hot paths on synthetic inputs.
+
+Every case runs offline in its own subprocess, so that the peak RSS reported for it is its own.
+Wall time is the median of several rounds after a warm-up round, and output size is the size
+of the encoded image the bot would send.
+
+Run from the repository root:
+
+    python -m benchmarks.images                 # Run every case and compare against the baseline
+    python -m benchmarks.images --save          # Run every case and save the results as the new baseline
+    python -m benchmarks.images -k pfp_         # Only run the cases whose name contains `pfp_`
+
+The baseline is specific to the machine it was recorded on, so record one locally before comparing against it.
+The command exits with status 1 when a case is slower, uses more memory or produces a larger image
+than its baseline by more than `--threshold`.
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("CLIENT_TOKEN", "benchmark")
+
+import numpy as np
+from PIL import Image
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_ROUNDS = 5
+
+# Differences smaller than these are noise, whatever the threshold
+SECONDS_SLACK = 0.005
+RSS_SLACK_KIB = 2048
+SIZE_SLACK_BYTES = 256
+
+AVATAR_SIZE = 1024
+ANIMATED_AVATAR_SIZE = 512
+ANIMATED_AVATAR_FRAMES = 12
+
+Case = Callable[[], bytes]
+
+
+@functools.cache
+def synthetic_avatar(size: int = AVATAR_SIZE, seed: int = 0) -> Image.Image:
+    """Build a smooth avatar with some noise on top, which is harder to compress than a flat colour."""
+    rng = random.Random(seed)
+    gradient = Image.merge("RGB", (
+        Image.linear_gradient("L").resize((size, size)),
+        Image.radial_gradient("L").resize((size, size)),
+        Image.linear_gradient("L").rotate(90).resize((size, size)),
+    ))
+    noise = Image.frombytes("RGB", (size, size), rng.randbytes(size * size * 3))
+    return Image.blend(gradient, noise, 0.2).convert("RGBA")
+
+
+def png_bytes(image: Image.Image) -> bytes:
+    """Encode the image as a PNG, the way avatars arrive from Discord."""
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@functools.cache
+def avatar_bytes() -> bytes:
+    """The synthetic avatar encoded as a PNG."""
+    return png_bytes(synthetic_avatar())
+
+
+@functools.cache
+def animated_avatar_bytes() -> bytes:
+    """Build a GIF avatar whose frames are shifted copies of the synthetic avatar."""
+    base = synthetic_avatar(ANIMATED_AVATAR_SIZE).convert("RGB")
+    step = ANIMATED_AVATAR_SIZE // ANIMATED_AVATAR_FRAMES
+    frames = [
+        Image.fromarray(np.roll(base, i * step, axis=1)).quantize(256)
+        for i in range(ANIMATED_AVATAR_FRAMES)
+    ]
+    buffer = BytesIO()
+    frames[0].save(buffer, format="GIF", save_all=True, append_images=frames[1:], duration=40, loop=0)
+    return buffer.getvalue()
+
+
+def pfp_cases() -> dict[str, Case]:
+    """A case for every avatar effect, plus the animated variant of every effect that supports it."""
+    from bot.exts.avatar_modification._effects import EFFECTS, PfpEffects
+    from bot.exts.avatar_modification.avatar_modify import ANIMATED_EFFECTS, PIPELINE_STAGES
+
+    cases = {}
+    for effect in EFFECTS:
+        args = PIPELINE_STAGES[effect]
+        cases[f"pfp_{effect}"] = (
+            lambda effect=effect, args=args: PfpEffects.apply_effect(avatar_bytes(), effect, *args)
+        )
+    for effect in sorted(ANIMATED_EFFECTS):
+        args = PIPELINE_STAGES[effect]
+        cases[f"pfp_animated_{effect}"] = (
+            lambda effect=effect, args=args: PfpEffects.apply_animated_effect(animated_avatar_bytes(), effect, *args)
+        )
+    cases["pfp_pipeline"] = lambda: PfpEffects.apply_pipeline(
+        avatar_bytes(), [(effect, PIPELINE_STAGES[effect]) for effect in ("easterify", "pride", "mosaic")]
+    )[0]
+    return cases
+
+
+def spookification_cases() -> dict[str, Case]:
+    """A case for each of the spooky avatar effects."""
+    from bot.utils.halloween import spookifications
+    from bot.utils.images import ImageKind, encode_image
+
+    return {
+        f"spookify_{effect.__name__}": (
+            lambda effect=effect: encode_image(effect(synthetic_avatar().copy()), ImageKind.PHOTO)
+        )
+        for effect in (spookifications.inversion, spookifications.pentagram, spookifications.bat)
+    }
+
+
+def snake_cases() -> dict[str, Case]:
+    """Cases for the snake card, the snek drawing and the snakes and ladders board."""
+    from bot.exts.fun.snakes import _utils as utils
+    from bot.exts.fun.snakes._snakes_cog import Snakes
+    from bot.utils.images import ImageKind, encode_image
+
+    content = {
+        "name": "Benchmark Python",
+        "info": (
+            "The benchmark python is a large, nonvenomous snake found only in synthetic inputs. "
+            "It is known for holding very still while being measured. It has never bitten anyone."
+        ),
+    }
+
+    def snek_frame() -> bytes:
+        factory = utils.PerlinNoiseFactory(dimension=1, octaves=2)
+        frame = utils.create_snek_frame(factory, text="Benchmarks never lie, but they do exaggerate.")
+        return encode_image(frame, ImageKind.FLAT)
+
+    def ladders_board() -> bytes:
+        # The board only needs the players, their tiles and their avatars
+        game = utils.SnakeAndLaddersGame(snakes=None, context=SimpleNamespace(channel=None, author=None))
+        for player_id in range(utils.MAX_PLAYERS):
+            game.players.append(SimpleNamespace(id=player_id))
+            game.player_tiles[player_id] = 1 + player_id * 17
+            game.avatar_images[player_id] = synthetic_avatar(utils.BOARD_PLAYER_SIZE, seed=player_id)
+        return encode_image(game.render_board(), ImageKind.PHOTO)
+
+    return {
+        "snakes_card": lambda: Snakes._generate_card(BytesIO(avatar_bytes()), content).getvalue(),
+        "snakes_snek_frame": snek_frame,
+        "snakes_ladders_board": ladders_board,
+    }
+
+
+def misc_cases() -> dict[str, Case]:
+    """Cases for the duck game board, egg decorating and the colour thumbnail."""
+    from bot.exts.fun.duck_game import DuckGame, assemble_board_image
+    from bot.exts.holidays.easter.egg_decorating import DESIGNS, decorate_egg
+    from bot.exts.utilities.colour import Colour
+    from bot.utils.images import ImageKind, encode_image
+
+    design = next(iter(DESIGNS))
+    colours = ((255, 0, 0), (0, 200, 0), (0, 0, 255), (255, 255, 0))
+
+    def duck_game_board() -> bytes:
+        random.seed(0)
+        game = DuckGame()
+        return encode_image(assemble_board_image(game.board, game.rows, game.columns), ImageKind.FLAT)
+
+    return {
+        "duck_game_board": duck_game_board,
+        # Skip the memoization, so the decoration itself is measured
+        "egg_decorating": lambda: decorate_egg.__wrapped__(design, colours)[1],
+        "colour_thumbnail": lambda: Colour.create_thumbnail((114, 137, 218)).fp.getvalue(),
+    }
+
+
+CASE_GROUPS = (pfp_cases, spookification_cases, snake_cases, misc_cases)
+
+
+def build_cases() -> dict[str, Case]:
+    """
+    Collect the cases from every group.
+
+    Cases build their inputs when they first run, so collecting them is cheap.
+    """
+    cases = {}
+    for group in CASE_GROUPS:
+        cases.update(group())
+    return cases
+
+
+def run_case(name: str, rounds: int) -> dict[str, float]:
+    """Run a single case in this process and measure it."""
+    case = build_cases()[name]
+
+    # Build the inputs and fill the caches the bot would have warm
+    random.seed(0)
+    case()
+
+    timings = []
+    size = 0
+    for _ in range(rounds):
+        # The effects that use `random` should do the same work every round
+        random.seed(0)
+        start = time.perf_counter()
+        size = len(case())
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "seconds": statistics.median(timings),
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "output_bytes": size,
+    }
+
+
+def run_isolated(name: str, rounds: int) -> dict[str, float]:
+    """Run a single case in a fresh interpreter, so its peak RSS isn't inflated by the other cases."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmarks.images", "--run-case", name, "--rounds", str(rounds)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def regressions(name: str, result: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Describe every way the result is worse than the baseline by more than the threshold."""
+    slack = {"seconds": SECONDS_SLACK, "peak_rss_kib": RSS_SLACK_KIB, "output_bytes": SIZE_SLACK_BYTES}
+    problems = []
+    for metric, allowed_slack in slack.items():
+        old, new = baseline[metric], result[metric]
+        if new > old * (1 + threshold) and new - old > allowed_slack:
+            problems.append(f"{name}: {metric} regressed from {old:g} to {new:g} ({new / old - 1:+.0%})")
+    return problems
+
+
+def main() -> None:
+    """Run the selected cases, print a table of the results and compare them against the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the bot's image-processing hot paths.")
+    parser.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="The JSON baseline to use.")
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baseline.")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="The fraction a metric may grow by before it counts as a regression.",
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="The number of timed rounds per case.")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case, args.rounds)))  # noqa: T201
+        return
+
+    names = [name for name in build_cases() if args.filter in name]
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results = {}
+    problems = []
+
+    print(f"{'case':<28} {'time (ms)':>10} {'peak RSS (MiB)':>15} {'output (KiB)':>13}")  # noqa: T201
+    for name in names:
+        result = results[name] = run_isolated(name, args.rounds)
+        print(  # noqa: T201
+            f"{name:<28} {result['seconds'] * 1000:>10.1f} {result['peak_rss_kib'] / 1024:>15.1f} "
+            f"{result['output_bytes'] / 1024:>13.1f}"
+        )
+        if name in baseline and not args.save:
+            problems += regressions(name, result, baseline[name], args.threshold)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(baseline | results, indent=4, sort_keys=True) + "\n")
+        print(f"\nSaved {len(results)} results to {args.baseline}.")  # noqa: T201
+        return
+
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}, run with --save to create one.")  # noqa: T201
+    if problems:
+        print("\n" + "\n".join(problems))  # noqa: T201
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Count how often seasonal tasks wake up over a year, with a loop per task and with the seasonal scheduler.
+
+Each loop of the original `seasonal_task` woke up once every sleep time all year, and only ran its task
+in the allowed months. The scheduler wakes once per run for all the tasks that share a schedule,
+and sleeps through the months its schedules don't run in.
+
+Run from the repository root with `python -m benchmarks.seasonal`.
+"""
+import importlib
+import os
+from datetime import UTC, datetime, timedelta
+
+os.environ.setdefault("CLIENT_TOKEN", "benchmark")
+
+from bot.constants import Client, Month
+from bot.utils.lazy_extensions import _extension_cogs, read_manifest
+from bot.utils.seasonal import SeasonalSchedule, seasonal_tasks
+
+YEAR_START = datetime(2026, 1, 1, tzinfo=UTC)
+YEAR_END = datetime(2027, 1, 1, tzinfo=UTC)
+
+
+def find_schedules() -> dict[str, SeasonalSchedule]:
+    """Find every seasonal task of every extension, by its qualified name."""
+    schedules = {}
+    for extension in read_manifest():
+        importlib.import_module(extension)
+        for cog in _extension_cogs(extension):
+            for name, schedule in seasonal_tasks(cog).items():
+                schedules[f"{cog.__name__}.{name}"] = schedule
+    return schedules
+
+
+def scheduled_runs(schedule: SeasonalSchedule) -> list[datetime]:
+    """Return every run of the schedule in the year."""
+    runs = []
+    run = schedule.next_run(YEAR_START - timedelta(microseconds=1))
+    while run is not None and run < YEAR_END:
+        runs.append(run)
+        run = schedule.next_run(run)
+    return runs
+
+
+def loop_wakeups(schedule: SeasonalSchedule) -> tuple[int, int]:
+    """Return how many times a loop for the schedule woke up in the year, and how many of those ran its task."""
+    wakeups = runs = 0
+    time = YEAR_START
+    while time < YEAR_END:
+        wakeups += 1
+        runs += Month(time.month) in schedule.months
+        time += timedelta(seconds=schedule.interval)
+    return wakeups, runs
+
+
+def main() -> None:
+    """Count the wakeups of both implementations, after checking they run each task equally often."""
+    Client.month_override = None
+    schedules = find_schedules()
+    total_loop_wakeups = 0
+    for name, schedule in schedules.items():
+        runs = scheduled_runs(schedule)
+        wakeups, loop_runs = loop_wakeups(schedule)
+        if len(runs) != loop_runs:
+            raise SystemExit(f"{name}: the scheduler runs it {len(runs)} times, a loop ran it {loop_runs} times.")
+        total_loop_wakeups += wakeups
+        print(f"{name:>40}: {schedule!s:<40} {len(runs):>5} runs")  # noqa: T201
+
+    scheduler_wakeups = sum(len(scheduled_runs(schedule)) for schedule in set(schedules.values()))
+    print(  # noqa: T201
+        f"\nWakeups in a year: a loop per task {total_loop_wakeups} | scheduler {scheduler_wakeups} | "
+        f"{total_loop_wakeups - scheduler_wakeups} idle wakeups avoided"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compare the waiter registry against `discord.Client.wait_for` with many games waiting at once.
+
+Every game waits for its player's reaction on its own board message, the way tic-tac-toe and connect four do.
+The timed events are reactions on random boards by someone other than the player, so no wait is resolved
+and every round sees the same number of pending waits. Afterwards, each game's player reacts once,
+to check that both implementations resolve every wait.
+
+Run from the repository root with `python -m benchmarks.waiters`.
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+
+os.environ.setdefault("CLIENT_TOKEN", "benchmark")
+
+import discord
+
+from bot.utils.waiters import WaiterRegistry
+
+DEFAULT_GAMES = (10, 100, 300, 1000)
+EVENTS = 2000
+PLAYER_OFFSET = 1_000_000
+SPECTATOR_ID = 1
+EMOJI = "\N{DIGIT ONE}\N{COMBINING ENCLOSING KEYCAP}"
+
+
+def reaction(board: int, user_id: int) -> tuple[SimpleNamespace, SimpleNamespace]:
+    """Build the arguments of a reaction event on a game's board by the user."""
+    message = SimpleNamespace(id=board, channel=SimpleNamespace(id=board))
+    return SimpleNamespace(message=message, emoji=EMOJI), SimpleNamespace(id=user_id)
+
+
+def move_check(board: int) -> Callable[[SimpleNamespace, SimpleNamespace], bool]:
+    """Build a check like tic-tac-toe's, for a move by the game's player on its board."""
+    def check(reaction: SimpleNamespace, user: SimpleNamespace) -> bool:
+        return user.id == board + PLAYER_OFFSET and reaction.message.id == board and reaction.emoji == EMOJI
+    return check
+
+
+async def time_events(
+    games: int, start_wait: Callable[[int], Awaitable], dispatch: Callable[..., None]
+) -> float:
+    """Return the mean time to dispatch a reaction with every game waiting, after checking every wait resolves."""
+    waits = [asyncio.create_task(start_wait(board)) for board in range(games)]
+    # Let every wait register itself
+    await asyncio.sleep(0)
+
+    rng = random.Random(0)
+    events = [reaction(rng.randrange(games), SPECTATOR_ID) for _ in range(EVENTS)]
+    start = time.perf_counter()
+    for event in events:
+        dispatch("reaction_add", *event)
+    elapsed = time.perf_counter() - start
+
+    for board in range(games):
+        dispatch("reaction_add", *reaction(board, board + PLAYER_OFFSET))
+    results = await asyncio.wait_for(asyncio.gather(*waits), timeout=5)
+    if [user.id for _, user in results] != [board + PLAYER_OFFSET for board in range(games)]:
+        raise SystemExit(f"{games} games: a wait was resolved by the wrong event.")
+
+    return elapsed / EVENTS
+
+
+async def main() -> None:
+    """Time dispatching reactions with each number of games waiting, with both implementations."""
+    parser = argparse.ArgumentParser(description="Benchmark the waiter registry against discord.py's wait_for.")
+    parser.add_argument(
+        "--games", type=int, nargs="+", default=DEFAULT_GAMES, help="The numbers of concurrent games to run."
+    )
+    args = parser.parse_args()
+
+    async with discord.Client(intents=discord.Intents.none()) as client:
+        registry = WaiterRegistry()
+        for games in args.games:
+            client_time = await time_events(
+                games,
+                lambda board: client.wait_for("reaction_add", check=move_check(board)),
+                client.dispatch,
+            )
+            registry_time = await time_events(
+                games,
+                lambda board: registry.wait_for("reaction_add", message=board, check=move_check(board)),
+                registry.dispatch,
+            )
+            print(  # noqa: T201
+                f"{games:>5} games: wait_for {client_time * 1e6:8.1f}µs | "
+                f"registry {registry_time * 1e6:6.1f}µs per event | {client_time / registry_time:6.1f}x faster"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+"""
+Compare the precomputed whitelist policies against the original per-invocation merging of overrides.
+
+Every case is a context the global whitelist check sees on each command invocation. Both implementations
+are checked to agree on every case before they're timed, with logging at the level it has in production.
+
+Run from the repository root with `python -m benchmarks.whitelist`.
+"""
+import logging
+import os
+import time
+from collections.abc import Callable, Container
+from types import SimpleNamespace
+
+os.environ.setdefault("CLIENT_TOKEN", "benchmark")
+
+from discord.ext import commands
+from pydis_core.utils.logging import get_logger
+
+from bot import constants
+from bot.utils.checks import in_whitelist_check
+from bot.utils.decorators import InChannelCheckFailure, whitelist_check, whitelist_override
+
+CALLS = 20_000
+ROUNDS = 5
+
+DEFAULTS = {"channels": constants.WHITELISTED_CHANNELS, "roles": constants.STAFF_ROLES}
+GUILD = SimpleNamespace(id=constants.Client.guild)
+MEMBER = SimpleNamespace(roles=[SimpleNamespace(id=role) for role in (constants.Roles.everyone, 1, 2, 3, 4)])
+OFF_TOPIC = SimpleNamespace(id=1, category_id=2)
+PLAYGROUND = SimpleNamespace(id=constants.Channels.sir_lancebot_playground, category_id=3)
+
+log = get_logger(__name__)
+
+
+def legacy_whitelist_check(**default_kwargs: Container[int]) -> Callable[[commands.Context], bool]:
+    """The whitelist check that merged each command's overrides on every invocation, without its error message."""
+    def predicate(ctx: commands.Context) -> bool:
+        kwargs = default_kwargs.copy()
+        allow_dms = False
+
+        overridden_command: commands.Command | None = None
+        for command in [ctx.command, *ctx.command.parents]:
+            if hasattr(command.callback, "override"):
+                overridden_command = command
+                break
+        if overridden_command is not None:
+            log.debug(f"Command {overridden_command} has overrides")
+            if overridden_command is not ctx.command:
+                log.debug(
+                    f"Command '{ctx.command.qualified_name}' inherited overrides "
+                    "from parent command '{overridden_command.qualified_name}'"
+                )
+
+        if overridden_command:
+            allow_dms = overridden_command.callback.override_dm
+            if overridden_command.callback.override_reset:
+                kwargs = {}
+                log.debug(f"{ctx.author} called the '{ctx.command.name}' command and overrode default checks.")
+
+            for arg in overridden_command.callback.override:
+                default_value = kwargs.get(arg)
+                new_value = overridden_command.callback.override[arg]
+                if default_value is None or isinstance(arg, int):
+                    kwargs[arg] = new_value
+                elif isinstance(default_value, Container):
+                    if isinstance(new_value, Container):
+                        kwargs[arg] = (*default_value, *new_value)
+                    else:
+                        kwargs[arg] = new_value
+
+            log.debug(f"Updated default check arguments for '{ctx.command.name}' invoked by {ctx.author}.")
+
+        if ctx.guild is None:
+            log.debug(f"{ctx.author} tried using the '{ctx.command.name}' command from a DM.")
+            result = allow_dms
+        else:
+            log.trace(f"Calling whitelist check for {ctx.author} for command {ctx.command.name}.")
+            result = in_whitelist_check(ctx, fail_silently=True, **kwargs)
+
+        if result:
+            log.debug(
+                f"{ctx.author} tried to call the '{ctx.command.name}' command "
+                f"and the command was used in an overridden context."
+            )
+            return result
+
+        log.debug(f"{ctx.author} tried to call the '{ctx.command.name}' command. The whitelist check failed.")
+        raise InChannelCheckFailure("Sorry, but you may not use this command.")
+
+    return predicate
+
+
+def build_commands() -> dict[str, commands.Command]:
+    """Build a plain command, a command with overrides, and a subcommand that inherits its group's overrides."""
+    @commands.command()
+    async def plain(ctx: commands.Context) -> None:
+        """Do nothing."""
+
+    @commands.command()
+    @whitelist_override(channels=(OFF_TOPIC.id,))
+    async def override(ctx: commands.Context) -> None:
+        """Do nothing."""
+
+    @commands.group()
+    @whitelist_override(roles=(constants.Roles.everyone,))
+    async def group(ctx: commands.Context) -> None:
+        """Do nothing."""
+
+    @group.command()
+    async def subcommand(ctx: commands.Context) -> None:
+        """Do nothing."""
+
+    return {"plain": plain, "override": override, "inherited": subcommand}
+
+
+def build_cases() -> dict[str, SimpleNamespace]:
+    """Build contexts that are allowed in different ways, and one that is denied."""
+    built = build_commands()
+    return {
+        "whitelisted channel": SimpleNamespace(command=built["plain"], guild=GUILD, channel=PLAYGROUND, author=MEMBER),
+        "override channel": SimpleNamespace(command=built["override"], guild=GUILD, channel=OFF_TOPIC, author=MEMBER),
+        "inherited role": SimpleNamespace(command=built["inherited"], guild=GUILD, channel=OFF_TOPIC, author=MEMBER),
+        "denied": SimpleNamespace(command=built["plain"], guild=GUILD, channel=OFF_TOPIC, author=MEMBER),
+        "direct message": SimpleNamespace(command=built["plain"], guild=None, channel=OFF_TOPIC, author=MEMBER),
+    }
+
+
+def outcome(check: Callable[[SimpleNamespace], bool], ctx: SimpleNamespace) -> bool:
+    """Run the check, counting a check failure as denied."""
+    try:
+        return check(ctx)
+    except InChannelCheckFailure:
+        return False
+
+
+def best_time(check: Callable[[SimpleNamespace], bool], ctx: SimpleNamespace) -> float:
+    """Return the fastest time per call of `ROUNDS` runs of `CALLS` calls."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            outcome(check, ctx)
+        timings.append((time.perf_counter() - start) / CALLS)
+    return min(timings)
+
+
+def main() -> None:
+    """Time both implementations on each case, after checking they agree."""
+    logging.getLogger().setLevel(logging.INFO)
+
+    legacy = legacy_whitelist_check(**DEFAULTS)
+    precomputed = whitelist_check(**DEFAULTS)
+    cases = build_cases()
+    for ctx in cases.values():
+        precomputed.policies[ctx.command] = precomputed.resolve(ctx.command)
+
+    for name, ctx in cases.items():
+        if outcome(legacy, ctx) != outcome(precomputed, ctx):
+            raise SystemExit(f"{name}: the precomputed policy disagrees with the original check.")
+
+        legacy_time = best_time(legacy, ctx)
+        precomputed_time = best_time(precomputed, ctx)
+        print(  # noqa: T201
+            f"{name:>20}: per-invocation {legacy_time * 1e6:6.2f}µs | "
+            f"precomputed {precomputed_time * 1e6:5.2f}µs | {legacy_time / precomputed_time:5.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
+import argparse
 import asyncio
+import tracemalloc
 
 import aiohttp
 import discord
@@ -17,6 +19,9 @@ from bot.utils.decorators import whitelist_check
 log = get_logger(__name__)
 setup_sentry()
 
+# How long an extension may take to load while profiling, for those that wait on something that never comes
+PROFILE_EXTENSION_TIMEOUT = 10
+
 
 async def _create_redis_session() -> RedisSession:
     """Create and connect to a redis session."""
@@ -40,18 +45,46 @@ async def test_bot_in_ci(bot: Bot) -> None:
     Attempt to import all extensions and then return.
 
     This is to ensure that all extensions can at least be
-    imported and have a setup function within our CI.
+    imported and have a setup function within our CI,
+    and that the lazy loading manifest describes them.
     """
     from pydis_core.utils._extensions import walk_extensions
 
     from bot import exts
+    from bot.utils.lazy_extensions import MANIFEST_PATH, build_manifest, read_manifest
 
     for _ in walk_extensions(exts):
         # walk_extensions does all the heavy lifting within the generator.
         pass
 
+    if build_manifest() != read_manifest():
+        raise RuntimeError(f"{MANIFEST_PATH} is out of date, regenerate it with `uv run task manifest`.")
+
+
+async def profile_startup(bot: Bot) -> None:
+    """
+    Load every extension one at a time without connecting to Discord, and print how long each phase took.
+
+    Memory is traced while profiling, so the memory each extension allocated is included in the report.
+    Extensions are loaded in sequence so the memory can be attributed to them.
+    """
+    from bot.utils.extension_profiling import format_report
+    from bot.utils.lazy_extensions import read_manifest
+
+    tracemalloc.start()
+    for extension in read_manifest():
+        try:
+            await asyncio.wait_for(bot.load_extension(extension), timeout=PROFILE_EXTENSION_TIMEOUT)
+        except TimeoutError:
+            bot.extension_profiles[extension].error = f"Timed out after {PROFILE_EXTENSION_TIMEOUT}s"
+        except Exception as e:
+            log.debug(f"{extension} failed to load while profiling: {e}")
+    tracemalloc.stop()
+
+    print(format_report(bot.extension_profiles))  # noqa: T201
 
-async def main() -> None:
+
+async def main(*, profile: bool = False) -> None:
     """Entry async method for starting the bot."""
     allowed_roles = list({discord.Object(id_) for id_ in constants.MODERATION_ROLES})
     intents = discord.Intents.default()
@@ -82,8 +115,18 @@ async def main() -> None:
             ))
             if constants.Client.in_ci:
                 await test_bot_in_ci(_bot)
+            elif profile:
+                await profile_startup(_bot)
             else:
                 await _bot.start(constants.Client.token.get_secret_value())
 
 
-asyncio.run(main())
+parser = argparse.ArgumentParser(prog="python -m bot", description="Run Sir Lancebot.")
+parser.add_argument(
+    "--profile-startup",
+    action="store_true",
+    help="Load every extension without connecting to Discord, then print how long each took and exit.",
+)
+args = parser.parse_args()
+
+asyncio.run(main(profile=args.profile_startup))
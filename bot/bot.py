@@ -1,11 +1,27 @@
+import asyncio
+import graphlib
+import time
+import types
+from collections.abc import Collection, Mapping
+from importlib.machinery import ModuleSpec
+
 import discord
 from discord import DiscordException, Embed
 from discord.ext import commands
 from pydis_core import BotBase
 from pydis_core.utils import scheduling
+from pydis_core.utils._extensions import walk_extensions
 from pydis_core.utils.logging import get_logger
 
 from bot import constants, exts
+from bot.utils.decorators import WhitelistCheck
+from bot.utils.extension_profiling import ExtensionProfile, TimedLoader, loading_extension, traced_memory
+from bot.utils.github import GitHubClient
+from bot.utils.http_cache import HTTPCache, RedisTier
+from bot.utils.lazy_extensions import LazyCommand, LazyExtension, MANIFEST_PATH, read_manifest
+from bot.utils.message_router import MessageRouter
+from bot.utils.seasonal import SeasonalScheduler
+from bot.utils.waiters import WaiterRegistry
 
 log = get_logger(__name__)
 
@@ -23,6 +39,35 @@ class Bot(BotBase):
 
     name = constants.Client.name
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Extensions waiting for the first use of one of their commands or listeners
+        self.lazy_extensions: dict[str, LazyExtension] = {}
+        # How long each extension took to load the last time it was loaded
+        self.extension_profiles: dict[str, ExtensionProfile] = {}
+        # Routes messages to the handlers of cogs, instead of each cog listening for every message
+        self.message_router = MessageRouter()
+        self.add_listener(self.message_router.on_message)
+        self.add_listener(self.message_router.on_message_edit)
+        # Waits for events concerning a particular message, channel or user
+        self.waiters = WaiterRegistry()
+        # Runs the seasonal tasks of cogs, sleeping through the months they don't run in
+        self.seasonal_scheduler = SeasonalScheduler()
+        # Makes requests through the HTTP session, caching the responses of the endpoints cogs register
+        redis_session = getattr(self, "redis_session", None)
+        self.http_cache = HTTPCache(
+            self.http_session,
+            max_bytes=constants.Client.http_cache_bytes,
+            redis_tier=RedisTier(redis_session) if redis_session else None,
+        )
+        # Makes requests to the GitHub API, keeping within the rate limits of the bot's token
+        self.github = GitHubClient(
+            self.http_session,
+            self.http_cache,
+            token=constants.Tokens.github.get_secret_value(),
+            background_reserve=constants.GitHub.background_reserve,
+        )
+
     @property
     def member(self) -> discord.Member | None:
         """Retrieves the guild member object for the bot."""
@@ -31,6 +76,11 @@ class Bot(BotBase):
             return None
         return guild.me
 
+    def dispatch(self, event_name: str, /, *args, **kwargs) -> None:
+        """Dispatch the event as normal, then resolve the waits registered for what it concerns."""
+        super().dispatch(event_name, *args, **kwargs)
+        self.waiters.dispatch(event_name, *args)
+
     async def on_command_error(self, context: commands.Context, exception: DiscordException) -> None:
         """Check command errors for UserInputError and reset the cooldown if thrown."""
         if isinstance(exception, commands.UserInputError):
@@ -50,9 +100,211 @@ class Bot(BotBase):
 
         await devlog.send(embed=embed)
 
+    async def _load_extensions(self, module: types.ModuleType) -> None:
+        """
+        Load the extensions in the module, each after the extensions it depends on.
+
+        Cogs declare the extensions they depend on in an `extension_dependencies` class attribute,
+        which is collected into the extension manifest.
+
+        When lazy loading is enabled, the extensions that can wait until they're used are deferred instead.
+        """
+        log.info(f"Waiting for guild {self.guild_id} to be available before loading extensions.")
+        await self.wait_until_guild_available()
+
+        manifest = read_manifest() if MANIFEST_PATH.exists() else {}
+        if constants.Client.lazy_extensions:
+            self.all_extensions = frozenset(manifest)
+            eager_extensions = {extension for extension, entry in manifest.items() if entry["eager"]}
+
+            # The dependencies of extensions loaded now have to be loaded now too
+            waiting = list(eager_extensions)
+            while waiting:
+                for dependency in manifest[waiting.pop()]["dependencies"]:
+                    if dependency in manifest and dependency not in eager_extensions:
+                        eager_extensions.add(dependency)
+                        waiting.append(dependency)
+
+            for extension, entry in manifest.items():
+                if extension in eager_extensions:
+                    log.trace(f"Loading {extension} now, it {entry['eager'] or 'is a dependency'}.")
+                else:
+                    lazy_extension = self.lazy_extensions[extension] = LazyExtension(self, extension, entry)
+                    lazy_extension.install()
+            log.info(f"Deferring {len(self.lazy_extensions)} extensions until they're first used.")
+        else:
+            self.all_extensions = eager_extensions = walk_extensions(module)
+
+        await self._load_extension_graph({
+            extension: manifest.get(extension, {}).get("dependencies", ())
+            for extension in eager_extensions
+        })
+
+    async def _load_extension_graph(self, dependencies: Mapping[str, Collection[str]]) -> None:
+        """
+        Load the extensions concurrently, starting each one once the extensions it depends on have loaded.
+
+        At most `Client.extension_load_concurrency` extensions are loaded at once. An extension that fails
+        to load is logged and skipped, along with the extensions that depend on it, without affecting the rest.
+        """
+        graph = {}
+        for extension, extension_dependencies in dependencies.items():
+            graph[extension] = set()
+            for dependency in extension_dependencies:
+                if dependency in dependencies:
+                    graph[extension].add(dependency)
+                elif dependency not in self.extensions:
+                    log.warning(f"{extension} depends on {dependency}, which isn't being loaded.")
+
+        while True:
+            try:
+                graphlib.TopologicalSorter(graph).prepare()
+                break
+            except graphlib.CycleError as e:
+                dropped = set(e.args[1])
+                log.error(f"Not loading {', '.join(sorted(dropped))}, their dependencies form a cycle.")
+                # The extensions that depend on dropped extensions can't be loaded either
+                while dropped:
+                    for extension in dropped:
+                        del graph[extension]
+                    dependants = {extension for extension, dependencies in graph.items() if dependencies & dropped}
+                    for extension in sorted(dependants):
+                        missing = ", ".join(sorted(graph[extension] & dropped))
+                        log.error(f"Not loading {extension}, it depends on {missing}, which isn't being loaded.")
+                    dropped = dependants
+
+        semaphore = asyncio.Semaphore(constants.Client.extension_load_concurrency)
+        loads: dict[str, asyncio.Task[bool]] = {}
+
+        async def load(extension: str) -> bool:
+            for dependency in graph[extension]:
+                if not await loads[dependency]:
+                    log.error(f"Not loading {extension}, its dependency {dependency} failed to load.")
+                    return False
+
+            async with semaphore:
+                try:
+                    await self.load_extension(extension)
+                except Exception:
+                    log.exception(f"Failed to load {extension}.")
+                    return False
+
+            log.info(f"Loaded {extension} in {self.extension_profiles[extension].summary()}.")
+            return True
+
+        start = time.perf_counter()
+        for extension in graph:
+            loads[extension] = asyncio.create_task(load(extension))
+        results = await asyncio.gather(*loads.values())
+
+        elapsed = time.perf_counter() - start
+        log.info(f"Loaded {sum(results)} of {len(results)} extensions in {elapsed:.2f}s.")
+
+    async def load_extension(self, name: str, *, package: str | None = None) -> None:
+        """Load the extension, replacing its placeholders if it was waiting to be loaded lazily."""
+        if lazy_extension := self.lazy_extensions.pop(name, None):
+            lazy_extension.uninstall()
+        await super().load_extension(name, package=package)
+
+    async def unload_extension(self, name: str, *, package: str | None = None) -> None:
+        """Unload the extension, or stop it from being loaded if it was waiting to be loaded lazily."""
+        if lazy_extension := self.lazy_extensions.pop(name, None):
+            lazy_extension.uninstall()
+            return
+        await super().unload_extension(name, package=package)
+
+    async def _load_from_module_spec(self, spec: ModuleSpec, key: str) -> None:
+        """Load the extension as normal, profiling its import, `setup()` and `cog_load` times."""
+        profile = self.extension_profiles[key] = ExtensionProfile()
+        spec.loader = TimedLoader(spec.loader, profile)
+        token = loading_extension.set(profile)
+        memory_before = traced_memory()
+        start = time.perf_counter()
+
+        try:
+            await super()._load_from_module_spec(spec, key)
+        except Exception as e:
+            original = getattr(e, "original", e)
+            profile.error = f"{original.__class__.__name__}: {original}"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            profile.setup_seconds = elapsed - profile.import_seconds - profile.cog_load_seconds
+            if memory_before is not None and (memory_after := traced_memory()) is not None:
+                profile.allocated_bytes = memory_after - memory_before
+            loading_extension.reset(token)
+
+    async def add_cog(self, cog: commands.Cog) -> None:
+        """
+        Add the cog as normal, then route messages to it, schedule its seasonal tasks and resolve its whitelists.
+
+        The time the cog's `cog_load` took is attributed to the extension being loaded.
+        """
+        start = time.perf_counter()
+        try:
+            await super().add_cog(cog)
+        finally:
+            if profile := loading_extension.get():
+                profile.cog_load_seconds += time.perf_counter() - start
+        self.message_router.add_cog(cog)
+        self.seasonal_scheduler.add_cog(cog)
+        for check in self._whitelist_checks():
+            check.add_cog(cog)
+
+    async def remove_cog(self, name: str, /, **kwargs) -> commands.Cog | None:
+        """Remove the cog as normal, then stop routing messages to it, cancel its tasks and forget its whitelists."""
+        cog = await super().remove_cog(name, **kwargs)
+        if cog:
+            self.message_router.remove_cog(cog)
+            self.seasonal_scheduler.remove_cog(cog)
+            for check in self._whitelist_checks():
+                check.remove_cog(cog)
+        return cog
+
+    def _whitelist_checks(self) -> list[WhitelistCheck]:
+        """Return the global checks that keep a whitelist policy for each command."""
+        return [check for check in self._checks if isinstance(check, WhitelistCheck)]
+
+    async def load_lazy_extensions(self, query: str | None = None) -> None:
+        """
+        Load the lazily loaded extensions that provide the command, cog or help category named by `query`.
+
+        A subcommand is provided by the extension of its top-level command. If no query is given,
+        every extension still waiting is loaded, and if nothing matches the query, none are.
+        """
+        if query is None:
+            waiting = list(self.lazy_extensions.values())
+        elif isinstance(command := self.get_command(query.split()[0]), LazyCommand):
+            waiting = [command.lazy_extension]
+        elif command is None:
+            waiting = [extension for extension in self.lazy_extensions.values() if query in extension.categories]
+        else:
+            return
+
+        for lazy_extension in waiting:
+            await self._load_lazy_extension(lazy_extension)
+
+    async def _load_lazy_extension(self, lazy_extension: LazyExtension) -> None:
+        """Load the lazily loaded extension, logging rather than raising any error."""
+        try:
+            await lazy_extension.load()
+        except commands.ExtensionError:
+            log.exception(f"Failed to load {lazy_extension.name} on first use.")
+
+    async def get_context(
+        self, origin: discord.Message | discord.Interaction, /, *, cls: type = commands.Context
+    ) -> commands.Context:
+        """Create the context as normal, loading the command's extension first if it's still a placeholder."""
+        ctx = await super().get_context(origin, cls=cls)
+        if isinstance(ctx.command, LazyCommand):
+            await self._load_lazy_extension(ctx.command.lazy_extension)
+            ctx = await super().get_context(origin, cls=cls)
+        return ctx
+
     async def setup_hook(self) -> None:
         """Default async initialisation method for discord.py."""
         await super().setup_hook()
+        scheduling.create_task(self.http_cache.listen_for_invalidations(), name="HTTP cache invalidations")
 
         # This is not awaited to avoid a deadlock with any cogs that have
         # wait_until_guild_available in their cog_load method.
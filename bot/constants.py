@@ -1,6 +1,7 @@
 import enum
 from os import environ
 from types import MappingProxyType
+from typing import Literal
 
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
@@ -14,11 +15,13 @@ __all__ = (
     "PYTHON_PREFIX",
     "STAFF_ROLES",
     "WHITELISTED_CHANNELS",
+    "AvatarEffects",
     "Categories",
     "Channels",
     "Client",
     "Colours",
     "Emojis",
+    "GitHub",
     "Icons",
     "Logging",
     "Month",
@@ -82,6 +85,12 @@ class _Client(EnvConfig, env_prefix="client_"):
     token: SecretStr
     debug: bool = True
     in_ci: bool = False
+    # Defer importing extensions until one of their commands or listeners is used
+    lazy_extensions: bool = False
+    # How many extensions may be loading at the same time
+    extension_load_concurrency: int = 8
+    # How many bytes of HTTP responses may be cached in memory
+    http_cache_bytes: int = 32 * 1024 * 1024
     github_repo: str = "https://github.com/python-discord/sir-lancebot"
     # Override seasonal locks: 1 (January) to 12 (December)
     month_override: int | None = None
@@ -285,6 +294,16 @@ class _Wolfram(EnvConfig, env_prefix="wolfram_"):
 Wolfram = _Wolfram()
 
 
+class _GitHub(EnvConfig, env_prefix="github_"):
+    # Resolve the issues linked in a message with a single GraphQL query, which needs a GitHub token
+    graphql_batching: bool = False
+    # The share of each rate limit budget kept for commands, which background requests stop at
+    background_reserve: float = 0.2
+
+
+GitHub = _GitHub()
+
+
 class _Redis(EnvConfig, env_prefix="redis_"):
     host: str = "redis.databases.svc.cluster.local"
     port: int = 6379
@@ -306,6 +325,33 @@ class _Reddit(EnvConfig, env_prefix="reddit_"):
 
 Reddit = _Reddit()
 
+
+class _AvatarEffects(EnvConfig, env_prefix="avatar_effects_"):
+    # "thread" renders every effect in a thread pool. Every effect's pixel work is done by NumPy or Pillow,
+    # which release the GIL, so none of them need a process. "process" is opt-in, and sends the `process_effects`
+    # to worker processes, for effects that turn out to hold the GIL
+    executor_backend: Literal["thread", "process"] = "thread"
+    # Defaults to the number of CPUs when not set
+    process_pool_size: int | None = None
+    thread_pool_size: int = 10
+    # The effects rendered in worker processes with the process backend
+    process_effects: tuple[str, ...] = ()
+
+    # Size limits of the downloaded avatar and rendered effect caches
+    avatar_cache_bytes: int = 32 * 1024 * 1024
+    result_cache_bytes: int = 64 * 1024 * 1024
+
+    # Animated avatars are rendered frame by frame at this size, within the frame, pixel and output size budget.
+    # Ones over budget only have their first frame rendered. The slowest effect takes about 65ms a frame.
+    animated_size: int = 512
+    max_animated_frames: int = 60
+    max_animated_pixels: int = 60 * 512 * 512
+    # Kept under the smallest upload limit of a guild, so the rendered GIF can always be sent
+    max_animated_bytes: int = 8 * 1024 * 1024
+
+
+AvatarEffects = _AvatarEffects()
+
 # Default role combinations
 MODERATION_ROLES = {Roles.moderation_team, Roles.admins, Roles.owners}
 STAFF_ROLES = {Roles.helpers, Roles.moderation_team, Roles.admins, Roles.owners}
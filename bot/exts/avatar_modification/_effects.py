@@ -1,13 +1,97 @@
+import functools
 import math
 import random
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 from io import BytesIO
 from pathlib import Path
 
-import discord
-from PIL import Image, ImageDraw, ImageOps
+import numpy as np
+from PIL import GifImagePlugin, Image, ImageDraw, ImageOps, ImageSequence
 
-from bot.constants import Colours
+from bot.constants import AvatarEffects, Colours
+from bot.utils.halloween import spookifications
+from bot.utils.images import ImageKind, encode_image
+
+
+def _build_easter_lut() -> np.ndarray:
+    """
+    Precompute the easterified colour for every colour that survives a 6-bit posterize.
+
+    The returned array is indexed by `(r >> 2) << 12 | (g >> 2) << 6 | (b >> 2)` and holds the
+    merged RGB value that `PfpEffects.closest` would return for that posterized colour.
+    Ties are broken in favour of the earliest easter colour, the same as the stable sort in `closest`.
+    """
+    levels = np.arange(0, 256, 4, dtype=np.int32)
+    cube = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    best_distance = np.full(len(cube), np.iinfo(np.int32).max, dtype=np.int32)
+    best_colour = np.zeros_like(cube)
+    for colour in np.array(Colours.easter_like_colours, dtype=np.int32):
+        distance = ((cube - colour) ** 2).sum(axis=1)
+        closer = distance < best_distance
+        best_distance[closer] = distance[closer]
+        best_colour[closer] = colour
+
+    return ((cube + best_colour) // 2).astype(np.uint8)
+
+
+EASTER_LUT = _build_easter_lut()
+
+PRIDE_FLAGS_DIRECTORY = Path("bot/resources/holidays/pride/flags")
+
+# The size avatars are rendered at, which arguments given in pixels are relative to.
+# Effects also work at other sizes, which they scale those arguments to.
+EFFECT_SIZE = 1024
+
+# The palette index used for transparent pixels in animated output
+GIF_TRANSPARENCY_INDEX = 255
+
+
+class AnimationTooLargeError(Exception):
+    """Raised when an animated image has more frames or pixels than the `AvatarEffects` budget allows."""
+
+
+@functools.lru_cache(maxsize=64)
+def _pride_flag(flag: str, size: tuple[int, int]) -> Image.Image:
+    """
+    Loads the given pride flag, resized to cover a whole avatar of the given size.
+
+    There are only a couple dozen flags, so each one is kept once it has been read from disk.
+    The flag is kept in its original mode, which is much smaller than RGBA for the palette based flags.
+    """
+    with Image.open(PRIDE_FLAGS_DIRECTORY / f"{flag}.png") as image:
+        return image.resize(size)
+
+
+@functools.lru_cache(maxsize=4)
+def _circle_mask(size: tuple[int, int]) -> Image.Image:
+    """Returns a mask of the circle inscribed in an image of the given size."""
+    mask = Image.new("L", size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0) + size, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=16)
+def _ring_mask(size: tuple[int, int], px: int) -> Image.Image:
+    """Returns a mask of a `px` thick ring along the edge of the circle inscribed in an image of the given size."""
+    mask = _circle_mask(size).copy()
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((px, px, size[0]-px, size[1]-px), fill=0)
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _pride_ring(flag: str, px: int, size: tuple[int, int]) -> Image.Image:
+    """
+    Returns the given flag cropped to a `px` thick ring, ready to be composited over an avatar of the given size.
+
+    Only the most recently used flag, thickness and size combinations are kept, as each ring is a full RGBA image.
+    """
+    ring = _pride_flag(flag, size).convert("RGBA")
+    ring.putalpha(_ring_mask(ring.size, px))
+    return ring
 
 
 class PfpEffects:
@@ -18,18 +102,123 @@ class PfpEffects:
     """
 
     @staticmethod
-    def apply_effect(image_bytes: bytes, effect: Callable, filename: str, *args) -> discord.File:
-        """Applies the given effect to the image passed to it."""
+    def apply_effect(image_bytes: bytes, effect: str, *args) -> bytes:
+        """
+        Applies the effect registered under the given name in `EFFECTS` to the image passed to it.
+
+        The effect is referenced by name and the result is returned encoded for the effect's `image_kind`,
+        so that this can be ran in a worker process as well as in a thread.
+        """
+        im = Image.open(BytesIO(image_bytes))
+        im = im.convert("RGBA")
+        im = im.resize((EFFECT_SIZE, EFFECT_SIZE))
+        im = EFFECTS[effect](im, *args)
+
+        return encode_image(im, image_kind(effect))
+
+    @staticmethod
+    def apply_animated_effect(image_bytes: bytes, effect: str, *args) -> bytes:
+        """
+        Applies the effect registered under the given name in `EFFECTS` to every frame of the animated image.
+
+        Frames are decoded one at a time, and each one is written out as soon as the effect has been applied,
+        so only a couple of frames are held in memory at once. The effect is applied at the output size rather
+        than at `EFFECT_SIZE`, which is a quarter of the pixels at the default size. The animation's frame count
+        and size are checked against the `AvatarEffects` budget before any work is done, and the size of the GIF
+        after each frame is written, raising `AnimationTooLargeError` if either is over.
+
+        Returns the result as GIF bytes, at `AvatarEffects.animated_size`.
+        """
+        size = AvatarEffects.animated_size
+        with Image.open(BytesIO(image_bytes)) as source:
+            frames = getattr(source, "n_frames", 1)
+            if frames > AvatarEffects.max_animated_frames:
+                raise AnimationTooLargeError(f"the animation has {frames} frames")
+            if frames * source.width * source.height > AvatarEffects.max_animated_pixels:
+                raise AnimationTooLargeError(f"the animation has {frames} frames of {source.width}x{source.height}")
+
+            bufferedio = BytesIO()
+            for index, frame in enumerate(ImageSequence.Iterator(source)):
+                duration = frame.info.get("duration", 100)
+
+                im = frame.convert("RGBA")
+                im = im.resize((size, size))
+                im = EFFECTS[effect](im, *args)
+                im = PfpEffects.to_gif_frame(im)
+
+                if index == 0:
+                    header, _ = GifImagePlugin.getheader(im, info={"loop": 0})
+                    bufferedio.write(b"".join(header))
+
+                frame_data = GifImagePlugin.getdata(
+                    im,
+                    duration=duration,
+                    disposal=2,
+                    transparency=GIF_TRANSPARENCY_INDEX,
+                    include_color_table=True,
+                )
+                bufferedio.write(b"".join(frame_data))
+                if bufferedio.tell() > AvatarEffects.max_animated_bytes:
+                    raise AnimationTooLargeError(f"the GIF is over {AvatarEffects.max_animated_bytes} bytes")
+
+        bufferedio.write(b";")  # GIF trailer
+        return bufferedio.getvalue()
+
+    @staticmethod
+    def to_gif_frame(image: Image.Image) -> Image.Image:
+        """
+        Converts a frame to a palette image for GIF output, at `AvatarEffects.animated_size`.
+
+        The frame is reduced to 255 colours, which leaves `GIF_TRANSPARENCY_INDEX` free for the pixels
+        that are mostly transparent.
+        """
+        size = AvatarEffects.animated_size
+        image = image.convert("RGBA")
+        if image.size != (size, size):
+            image = image.resize((size, size))
+
+        frame = image.convert("RGB").quantize(GIF_TRANSPARENCY_INDEX)
+        palette = frame.getpalette()
+        frame.putpalette(palette + [0] * (768 - len(palette)))
+
+        transparent = image.getchannel("A").point(lambda alpha: 255 if alpha < 128 else 0, "1")
+        frame.paste(GIF_TRANSPARENCY_INDEX, mask=transparent)
+        return frame
+
+    @staticmethod
+    def apply_pipeline(
+        image_bytes: bytes,
+        stages: Sequence[tuple[str, tuple]]
+    ) -> tuple[bytes, list[tuple[str, float]]]:
+        """
+        Applies a chain of (effect name, arguments) stages to the image, decoding and encoding it only once.
+
+        Between stages the image is brought back to an `EFFECT_SIZE` RGBA image, which is what every effect expects.
+        Returns the result encoded for the `image_kind` of the last stage, along with how long decoding,
+        each stage and encoding took in seconds.
+        """
+        timings = []
+        start = time.perf_counter()
+
         im = Image.open(BytesIO(image_bytes))
         im = im.convert("RGBA")
-        im = im.resize((1024, 1024))
-        im = effect(im, *args)
+        im = im.resize((EFFECT_SIZE, EFFECT_SIZE))
+        timings.append(("decode", time.perf_counter() - start))
+
+        for effect, args in stages:
+            start = time.perf_counter()
+            if im.mode != "RGBA":
+                im = im.convert("RGBA")
+            if im.size != (EFFECT_SIZE, EFFECT_SIZE):
+                im = im.resize((EFFECT_SIZE, EFFECT_SIZE))
+            im = EFFECTS[effect](im, *args)
+            timings.append((effect, time.perf_counter() - start))
 
-        bufferedio = BytesIO()
-        im.save(bufferedio, format="PNG")
-        bufferedio.seek(0)
+        start = time.perf_counter()
+        image = encode_image(im, image_kind(stages[-1][0]))
+        timings.append(("encode", time.perf_counter() - start))
 
-        return discord.File(bufferedio, filename=filename)
+        return image, timings
 
     @staticmethod
     def closest(x: tuple[int, int, int]) -> tuple[int, int, int]:
@@ -56,32 +245,26 @@ class PfpEffects:
     @staticmethod
     def crop_avatar_circle(avatar: Image.Image) -> Image.Image:
         """Crop the avatar given into a circle."""
-        mask = Image.new("L", avatar.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0) + avatar.size, fill=255)
-        avatar.putalpha(mask)
+        avatar.putalpha(_circle_mask(avatar.size))
         return avatar
 
     @staticmethod
     def crop_ring(ring: Image.Image, px: int) -> Image.Image:
         """Crop the given ring into a circle."""
-        mask = Image.new("L", ring.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0) + ring.size, fill=255)
-        draw.ellipse((px, px, 1024-px, 1024-px), fill=0)
-        ring.putalpha(mask)
+        ring.putalpha(_ring_mask(ring.size, px))
         return ring
 
     @staticmethod
     def pridify_effect(image: Image.Image, pixels: int, flag: str) -> Image.Image:
-        """Applies the given pride effect to the given image."""
-        image = PfpEffects.crop_avatar_circle(image)
-
-        ring = Image.open(Path(f"bot/resources/holidays/pride/flags/{flag}.png")).resize((1024, 1024))
-        ring = ring.convert("RGBA")
-        ring = PfpEffects.crop_ring(ring, pixels)
+        """
+        Applies the given pride effect to the given image.
 
-        image.alpha_composite(ring, (0, 0))
+        The ring is `pixels` thick at `EFFECT_SIZE`, and proportionally as thick at other sizes.
+        The resized flags and the ring cut out of them are cached, so this is usually just a composite.
+        """
+        image = PfpEffects.crop_avatar_circle(image)
+        pixels = round(pixels * image.width / EFFECT_SIZE)
+        image.alpha_composite(_pride_ring(flag, pixels, image.size), (0, 0))
         return image
 
     @staticmethod
@@ -89,11 +272,12 @@ class PfpEffects:
         """
         Applies the 8bit effect to the given image.
 
-        This is done by reducing the image to 32x32 and then back up to 1024x1024.
+        This is done by reducing the image to 32x32 and then back up to its original size.
         We then quantize the image before returning too.
         """
+        size = image.size
         image = image.resize((32, 32), resample=Image.NEAREST)
-        image = image.resize((1024, 1024), resample=Image.NEAREST)
+        image = image.resize(size, resample=Image.NEAREST)
         return image.quantize()
 
     @staticmethod
@@ -113,9 +297,11 @@ class PfpEffects:
         Applies the easter effect to the given image.
 
         This is done by getting the closest "easter" colour to each pixel and changing the colour
-        to the half-way RGB value.
+        to the half-way RGB value. The colours are posterized to 6 bits first, so the result for
+        every possible colour is looked up from `EASTER_LUT` rather than calculated per pixel.
 
         We also then add an overlay image on top in middle right, a chocolate bunny by default.
+        The overlay is sized for `EFFECT_SIZE`, and scaled along with images of other sizes.
         """
         if overlay_image:
             ratio = 64 / overlay_image.height
@@ -126,25 +312,23 @@ class PfpEffects:
             overlay_image = overlay_image.convert("RGBA")
         else:
             overlay_image = Image.open(Path("bot/resources/holidays/easter/chocolate_bunny.png"))
+        if image.width != EFFECT_SIZE:
+            # Keep the overlay the same size relative to the avatar
+            scale = image.width / EFFECT_SIZE
+            overlay_image = overlay_image.resize((
+                max(1, round(overlay_image.width * scale)),
+                max(1, round(overlay_image.height * scale))
+            ))
 
-        alpha = image.getchannel("A").getdata()
-        image = image.convert("RGB")
-        image = ImageOps.posterize(image, 6)
-
-        data = image.getdata()
-        data_set = set(data)
-        easterified_data_set = {}
+        pixels = np.asarray(image)
+        rgb = pixels[..., :3] >> 2
+        lut_index = (rgb[..., 0].astype(np.intp) << 12) | (rgb[..., 1].astype(np.intp) << 6) | rgb[..., 2]
 
-        for x in data_set:
-            easterified_data_set[x] = PfpEffects.closest(x)
-        new_pixel_data = [
-            (*easterified_data_set[x], alpha[i])
-            if x in easterified_data_set else x
-            for i, x in enumerate(data)
-        ]
+        easterified = np.empty_like(pixels)
+        easterified[..., :3] = EASTER_LUT[lut_index]
+        easterified[..., 3] = pixels[..., 3]
 
-        im = Image.new("RGBA", image.size)
-        im.putdata(new_pixel_data)
+        im = Image.fromarray(easterified)
         im.alpha_composite(
             overlay_image,
             (im.width - overlay_image.width, (im.height - overlay_image.height) // 2)
@@ -152,145 +336,68 @@ class PfpEffects:
         return im
 
     @staticmethod
-    def split_image(img: Image.Image, squares: int) -> list:
-        """
-        Split an image into a selection of squares, specified by the squares argument.
-
-        Explanation:
-
-        1. It gets the width and the height of the Image passed to the function.
-
-        2. It gets the root of a number of squares (number of squares) passed, which is called xy. Reason: if let's say
-        25 squares (number of squares) were passed, that is the total squares (split pieces) that the image is supposed
-        to be split into. As it is known, a 2D shape has a height and a width, and in this case the program thinks of it
-        as rows and columns. Rows multiplied by columns is equal to the passed squares (number of squares). To get rows
-        and columns, since in this case, each square (split piece) is identical, rows are equal to columns and the
-        program treats the image as a square-shaped, it gets the root out of the squares (number of squares) passed.
-
-        3. Now width and height are both of the original Image, Discord PFP, so when it comes to forming the squares,
-        the program divides the original image's height and width by the xy. In a case of 25 squares (number of squares)
-        passed, xy would be 5, so if an image was 250x300, x_frac would be 50 and y_frac - 60. Note:
-        x_frac stands for a fracture of width. The reason it's called that is because it is shorter to use x for width
-        in mind and then it's just half of the word fracture, same applies to y_frac, just height instead of width.
-        x_frac and y_frac are width and height of a single square (split piece).
-
-        4. With left, top, right, bottom, = 0, 0, x_frac, y_frac, the program sets these variables to create the initial
-        square (split piece). Explanation: all of these 4 variables start at the top left corner of the Image, by adding
-        value to right and bottom, it's creating the initial square (split piece).
-
-        5. In the for loop, it keeps adding those squares (split pieces) in a row and once (index + 1) % xy == 0 is
-        True, it adds to top and bottom to lower them and reset right and left to recreate the initial space between
-        them, forming a square (split piece), it also adds the newly created square (split piece) into the new_imgs list
-        where it stores them. The program keeps repeating this process till all 25 squares get added to the list.
-
-        6. It returns new_imgs, a list of squares (split pieces).
+    def mosaic_effect(image: Image.Image, squares: int) -> Image.Image:
         """
-        width, heigth = img.size
-
-        xy = math.sqrt(squares)
-
-        x_frac = width // xy
-        y_frac = heigth // xy
-
-        left, top, right, bottom, = 0, 0, x_frac, y_frac
-
-        new_imgs = []
-
-        for index in range(squares):
-            new_img = img.crop((left, top, right, bottom))
-            new_imgs.append(new_img)
-
-            if (index + 1) % xy == 0:
-                top += y_frac
-                bottom += y_frac
-                left = 0
-                right = x_frac
-            else:
-                left += x_frac
-                right += x_frac
-
-        return new_imgs
+        Applies a mosaic effect to the given image.
 
-    @staticmethod
-    def join_images(images: list[Image.Image]) -> Image.Image:
-        """
-        Stitches all the image squares into a new image.
+        The "squares" argument specifies the number of squares to split
+        the image into. This should be a square number.
 
         Explanation:
 
-        1. Shuffles the passed images to randomize the pieces.
-
-        2. The program gets a single square (split piece) out of the list and defines single_width as the square's width
-        and single_height as the square's height.
+        1. The image is split into a grid of `sqrt(squares)` rows and columns of equally sized pieces. When the image
+        size isn't divisible by the number of rows, the leftover pixels along the right and bottom edges are dropped.
 
-        3. It gets the root of type integer of the number of images (split pieces) in the list and calls it multiplier.
-        Program then proceeds to calculate total height and width of the new image that it's creating using the same
-        multiplier.
+        2. Rather than cropping every piece into its own image, the pixel array is reshaped into a view of shape
+        (rows, columns, piece height, piece width, channels) and flattened into a list of pieces.
 
-        4. The program then defines new_image as the image that it's creating, using the previously obtained total_width
-        and total_height.
+        3. The order of the pieces is shuffled, and a single fancy-index picks every piece in its new order.
 
-        5. Now it defines width_multiplier as well as height with values of 0. These will be used to correctly position
-        squares (split pieces) onto the new_image canvas.
-
-        6. Similar to how in the split_image function, the program gets the root of number of images in the list.
-        In split_image function, it was the passed squares (number of squares) instead of a number of imgs in the
-        list that it got the square of here.
-
-        7. In the for loop, as it iterates, the program multiplies single_width by width_multiplier to correctly
-        position a square (split piece) width wise. It then proceeds to paste the newly positioned square (split piece)
-        onto the new_image. The program increases the width_multiplier by 1 every iteration so the image wouldn't get
-        pasted in the same spot and the positioning would move accordingly. It makes sure to increase the
-        width_multiplier before the check, which checks if the end of a row has been reached, -
-        (index + 1) % pieces == 0, so after it, if it was True, width_multiplier would have been reset to 0 (start of
-        the row). If the check returns True, the height gets increased by a single square's (split piece) height to
-        lower the positioning height wise and, as mentioned, the width_multiplier gets reset to 0 and width will
-        then be calculated from the start of the new row. The for loop finishes once all the squares (split pieces) were
-        positioned accordingly.
-
-        8. Finally, it returns the new_image, the randomized squares (split pieces) stitched back into the format of the
-        original image - user's PFP.
+        4. The shuffled pieces are laid back out in rows, the reverse of step 2, and stitched into the new image.
         """
-        random.shuffle(images)
-        single_img = images[0]
-
-        single_wdith = single_img.size[0]
-        single_height = single_img.size[1]
-
-        multiplier = int(math.sqrt(len(images)))
-
-        total_width = multiplier * single_wdith
-        total_height = multiplier * single_height
-
-        new_image = Image.new("RGBA", (total_width, total_height), (250, 250, 250))
-
-        width_multiplier = 0
-        height = 0
-
-        squares = math.sqrt(len(images))
+        pieces = math.isqrt(squares)
+        piece_width = image.width // pieces
+        piece_height = image.height // pieces
+
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        pixels = np.asarray(image)[:pieces * piece_height, :pieces * piece_width]
+
+        tiles = (
+            pixels
+            .reshape(pieces, piece_height, pieces, piece_width, 4)
+            .swapaxes(1, 2)
+            .reshape(squares, piece_height, piece_width, 4)
+        )
 
-        for index, image in enumerate(images):
-            width = single_wdith * width_multiplier
+        order = list(range(squares))
+        random.shuffle(order)
 
-            new_image.paste(image, (width, height))
+        shuffled = (
+            tiles[order]
+            .reshape(pieces, pieces, piece_height, piece_width, 4)
+            .swapaxes(1, 2)
+            .reshape(pieces * piece_height, pieces * piece_width, 4)
+        )
+        return Image.fromarray(shuffled)
 
-            width_multiplier += 1
 
-            if (index + 1) % squares == 0:
-                width_multiplier = 0
-                height += single_height
+# The effects that can be applied by name with `PfpEffects.apply_effect`.
+EFFECTS: dict[str, Callable[..., Image.Image]] = {
+    "8bitify": PfpEffects.eight_bitify_effect,
+    "reverse": PfpEffects.flip_effect,
+    "easterify": PfpEffects.easterify_effect,
+    "pride": PfpEffects.pridify_effect,
+    "spookify": spookifications.get_random_effect,
+    "mosaic": PfpEffects.mosaic_effect,
+}
 
-        return new_image
+# The 8bit effect gives flat pixel art, the rest keep the look of the avatar they are applied to
+EFFECT_IMAGE_KINDS = {
+    "8bitify": ImageKind.FLAT,
+}
 
-    @staticmethod
-    def mosaic_effect(image: Image.Image, squares: int) -> Image.Image:
-        """
-        Applies a mosaic effect to the given image.
-
-        The "squares" argument specifies the number of squares to split
-        the image into. This should be a square number.
-        """
-        img_squares = PfpEffects.split_image(image, squares)
-        new_img = PfpEffects.join_images(img_squares)
 
-        return new_img
+def image_kind(effect: str) -> ImageKind:
+    """Returns the kind of image the named effect produces, which decides how it's encoded."""
+    return EFFECT_IMAGE_KINDS.get(effect, ImageKind.PHOTO)
@@ -1,11 +1,13 @@
 import asyncio
-import json
 import math
+import multiprocessing
 import string
 import unicodedata
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
+from collections.abc import Callable, Collection
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from types import NoneType
 from typing import TypeVar
 
 import discord
@@ -13,37 +15,43 @@ from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.constants import Colours, Emojis
-from bot.exts.avatar_modification._effects import PfpEffects
-from bot.utils.halloween import spookifications
+from bot.constants import AvatarEffects, Colours, Emojis
+from bot.exts.avatar_modification._effects import AnimationTooLargeError, PfpEffects, image_kind
+from bot.utils import resources
+from bot.utils.caching import ByteLRUCache
 
 log = get_logger(__name__)
 
-_EXECUTOR = ThreadPoolExecutor(10)
+_EXECUTOR = ThreadPoolExecutor(AvatarEffects.thread_pool_size)
 
-FILENAME_STRING = "{effect}_{author}.png"
+FILENAME_STRING = "{effect}_{author}"
 
 MAX_SQUARES = 10_000
 
-T = TypeVar("T")
+MAX_PIPELINE_STAGES = 6
 
-GENDER_OPTIONS = json.loads(Path("bot/resources/holidays/pride/gender_options.json").read_text("utf8"))
+T = TypeVar("T")
 
+# Effects that always give the same result for the same avatar and arguments, so their results can be cached
+DETERMINISTIC_EFFECTS = frozenset({"8bitify", "reverse", "easterify", "pride"})
+# Effects that keep animated avatars animated. The random effects would pick something different for every frame.
+ANIMATED_EFFECTS = DETERMINISTIC_EFFECTS
 
-async def in_executor(func: Callable[..., T], *args) -> T:
-    """
-    Runs the given synchronous function `func` in an executor.
+GENDER_OPTIONS = resources.load("holidays/pride/gender_options.json")
 
-    This is useful for running slow, blocking code within async
-    functions, so that they don't block the bot.
-    """
-    log.trace(f"Running {func.__name__} in an executor.")
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_EXECUTOR, func, *args)
+# The effects that can be chained with the pipeline command, and the arguments they are applied with
+PIPELINE_STAGES = {
+    "8bitify": (),
+    "reverse": (),
+    "easterify": (None,),
+    "pride": (64, GENDER_OPTIONS["lgbt"]),
+    "spookify": (),
+    "mosaic": (16,),
+}
 
 
 def file_safe_name(effect: str, display_name: str) -> str:
-    """Returns a file safe filename based on the given effect and display name."""
+    """Returns a file safe filename, without an extension, based on the given effect and display name."""
     valid_filename_chars = f"-_. {string.ascii_letters}{string.digits}"
 
     file_name = FILENAME_STRING.format(effect=effect, author=display_name)
@@ -64,6 +72,120 @@ class AvatarModify(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self._process_pool: ProcessPoolExecutor | None = None
+
+        # Downloaded avatars keyed by (avatar hash, size), and
+        # rendered PNGs keyed by (avatar hash, size, effect, arguments)
+        self.avatar_cache = ByteLRUCache("avatar_cache", AvatarEffects.avatar_cache_bytes)
+        self.result_cache = ByteLRUCache("avatar_result_cache", AvatarEffects.result_cache_bytes)
+
+    async def cog_unload(self) -> None:
+        """Shut down the effect worker processes, if they were started."""
+        self._shutdown_process_pool()
+
+    def _shutdown_process_pool(self) -> None:
+        """Shut down the effect worker processes without waiting for them, so a new pool can be started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def _get_executor(self, effects: Collection[str]) -> Executor:
+        """
+        Returns the executor the given effects should be rendered in.
+
+        With the process backend, the effects listed in `AvatarEffects.process_effects` are rendered in
+        worker processes so that they don't hold the GIL, while the cheap effects stay on the thread pool.
+        The worker processes are spawned rather than forked, as forking the bot's threads isn't safe.
+        """
+        if AvatarEffects.executor_backend != "process" or not set(effects) & set(AvatarEffects.process_effects):
+            return _EXECUTOR
+
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                AvatarEffects.process_pool_size,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+    async def _read_avatar(self, user: discord.User, size: int) -> bytes:
+        """Reads the user's avatar at the given size, using the avatar cache when the same avatar was read before."""
+        key = (user.display_avatar.key, size)
+        image_bytes = self.avatar_cache.get(key)
+        if image_bytes is None:
+            image_bytes = await user.display_avatar.replace(size=size).read()
+            self.avatar_cache.set(key, image_bytes)
+        return image_bytes
+
+    async def render_effect(
+        self,
+        effect: str,
+        user: discord.User,
+        filename: str,
+        *args,
+        avatar_size: int = 1024,
+    ) -> discord.File:
+        """
+        Applies the named effect to the user's avatar in an executor, returning the result as a file.
+
+        This is useful for running slow, blocking code within async
+        functions, so that they don't block the bot.
+
+        The file is given the extension of the format the effect's result was encoded in.
+        Animated avatars stay animated for the `ANIMATED_EFFECTS`, as long as they are within the animation
+        budget, in which case the returned file is a GIF.
+
+        Results of deterministic effects with simple arguments are cached by the avatar's hash,
+        so repeating a command on an unchanged avatar doesn't render it again.
+        """
+        if effect in ANIMATED_EFFECTS and user.display_avatar.is_animated():
+            try:
+                return await self._render(
+                    effect, user, f"{filename}.gif", args, AvatarEffects.animated_size, animated=True
+                )
+            except AnimationTooLargeError as e:
+                log.info(f"Only rendering the first frame of {user.display_avatar.key}, {e}.")
+
+        filename = f"{filename}.{image_kind(effect).extension}"
+        return await self._render(effect, user, filename, args, avatar_size, animated=False)
+
+    async def _render(
+        self,
+        effect: str,
+        user: discord.User,
+        filename: str,
+        args: tuple,
+        avatar_size: int,
+        *,
+        animated: bool,
+    ) -> discord.File:
+        """Renders the effect on the user's avatar, either as a still image or frame by frame as a GIF."""
+        cache_key = None
+        if effect in DETERMINISTIC_EFFECTS and all(isinstance(arg, int | str | NoneType) for arg in args):
+            cache_key = (user.display_avatar.key, avatar_size, animated, effect, args)
+            if (image := self.result_cache.get(cache_key)) is not None:
+                log.trace(f"Using the cached {effect} render for {user.display_avatar.key}.")
+                return discord.File(BytesIO(image), filename=filename)
+
+        image_bytes = await self._read_avatar(user, avatar_size)
+        apply = PfpEffects.apply_animated_effect if animated else PfpEffects.apply_effect
+        image = await self._run_in_executor((effect,), apply, image_bytes, effect, *args)
+
+        if cache_key is not None:
+            self.result_cache.set(cache_key, image)
+        return discord.File(BytesIO(image), filename=filename)
+
+    async def _run_in_executor(self, effects: Collection[str], func: Callable[..., T], *args) -> T:
+        """Runs `func`, which applies the given effects, in the executor configured for those effects."""
+        executor = self._get_executor(effects)
+        log.trace(f"Running {', '.join(effects)} in a {type(executor).__name__}.")
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            log.exception(f"The effect worker processes died while running {', '.join(effects)}, using a thread.")
+            self._shutdown_process_pool()
+            return await loop.run_in_executor(_EXECUTOR, func, *args)
 
     async def _fetch_user(self, user_id: int) -> discord.User | None:
         """
@@ -100,22 +222,16 @@ class AvatarModify(commands.Cog):
                 await ctx.send(f"{Emojis.cross_mark} Could not get user info.")
                 return
 
-            image_bytes = await user.display_avatar.replace(size=1024).read()
             file_name = file_safe_name("eightbit_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.eight_bitify_effect,
-                file_name
-            )
+            file = await self.render_effect("8bitify", user, file_name)
 
             embed = discord.Embed(
                 title="Your 8-bit avatar",
                 description="Here is your avatar. I think it looks all cool and 'retro'."
             )
 
-            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}.", icon_url=user.display_avatar.url)
 
         await ctx.send(embed=embed, file=file)
@@ -137,22 +253,16 @@ class AvatarModify(commands.Cog):
                 await ctx.send(f"{Emojis.cross_mark} Could not get user info.")
                 return
 
-            image_bytes = await user.display_avatar.replace(size=1024).read()
             filename = file_safe_name("reverse_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.flip_effect,
-                filename
-            )
+            file = await self.render_effect("reverse", user, filename)
 
             embed = discord.Embed(
                 title="Your reversed avatar.",
                 description="Here is your reversed avatar. I think it is a spitting image of you."
             )
 
-            embed.set_image(url=f"attachment://{filename}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}.", icon_url=user.display_avatar.url)
 
             await ctx.send(embed=embed, file=file)
@@ -194,30 +304,23 @@ class AvatarModify(commands.Cog):
                     return
                 ctx.send = send_message  # Reassigns ctx.send
 
-            image_bytes = await user.display_avatar.replace(size=256).read()
             file_name = file_safe_name("easterified_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.easterify_effect,
-                file_name,
-                egg
-            )
+            file = await self.render_effect("easterify", user, file_name, egg, avatar_size=256)
 
             embed = discord.Embed(
                 title="Your Lovely Easterified Avatar!",
                 description="Here is your lovely avatar, all bright and colourful\nwith Easter pastel colours. Enjoy :D"
             )
-            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}.", icon_url=user.display_avatar.url)
 
         await ctx.send(file=file, embed=embed)
 
-    @staticmethod
     async def send_pride_image(
+        self,
         ctx: commands.Context,
-        image_bytes: bytes,
+        user: discord.User,
         pixels: int,
         flag: str,
         option: str
@@ -226,20 +329,13 @@ class AvatarModify(commands.Cog):
         async with ctx.typing():
             file_name = file_safe_name("pride_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.pridify_effect,
-                file_name,
-                pixels,
-                flag
-            )
+            file = await self.render_effect("pride", user, file_name, pixels, flag)
 
             embed = discord.Embed(
                 title="Your Lovely Pride Avatar!",
                 description=f"Here is your lovely avatar, surrounded by\n a beautiful {option} flag. Enjoy :D"
             )
-            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}.", icon_url=ctx.author.display_avatar.url)
             await ctx.send(file=file, embed=embed)
 
@@ -269,8 +365,7 @@ class AvatarModify(commands.Cog):
             if not user:
                 await ctx.send(f"{Emojis.cross_mark} Could not get user info.")
                 return
-            image_bytes = await user.display_avatar.replace(size=1024).read()
-            await self.send_pride_image(ctx, image_bytes, pixels, flag, option)
+            await self.send_pride_image(ctx, user, pixels, flag, option)
 
     @prideavatar.command()
     async def flags(self, ctx: commands.Context) -> None:
@@ -297,22 +392,15 @@ class AvatarModify(commands.Cog):
             return
 
         async with ctx.typing():
-            image_bytes = await user.display_avatar.replace(size=1024).read()
-
             file_name = file_safe_name("spooky_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                spookifications.get_random_effect,
-                file_name
-            )
+            file = await self.render_effect("spookify", user, file_name)
 
             embed = discord.Embed(
                 title="Is this you or am I just really paranoid?",
                 colour=Colours.soft_red
             )
-            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}.", icon_url=ctx.author.display_avatar.url)
 
             await ctx.send(file=file, embed=embed)
@@ -336,15 +424,7 @@ class AvatarModify(commands.Cog):
 
             file_name = file_safe_name("mosaic_avatar", ctx.author.display_name)
 
-            img_bytes = await user.display_avatar.replace(size=1024).read()
-
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                img_bytes,
-                PfpEffects.mosaic_effect,
-                file_name,
-                squares,
-            )
+            file = await self.render_effect("mosaic", user, file_name, squares)
 
             if squares == 1:
                 title = "Hooh... that was a lot of work"
@@ -362,11 +442,59 @@ class AvatarModify(commands.Cog):
                 colour=Colours.blue
             )
 
-            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_image(url=f"attachment://{file.filename}")
             embed.set_footer(text=f"Made by {ctx.author.display_name}", icon_url=user.display_avatar.url)
 
             await ctx.send(file=file, embed=embed)
 
+    @avatar_modify.command(name="pipeline", aliases=("chain",))
+    async def pipeline_command(self, ctx: commands.Context, *effects: str) -> None:
+        """
+        Applies several effects to your avatar, one after the other.
+
+        The effects that can be chained are 8bitify, reverse, easterify, pride, spookify and mosaic.
+        Pride uses the LGBT flag with a 64px border, and mosaic uses 16 squares.
+        Your avatar is only downloaded and converted once, however many effects are applied.
+        """
+        effects = [effect.lower() for effect in effects]
+        if not 1 <= len(effects) <= MAX_PIPELINE_STAGES:
+            raise commands.BadArgument(f"You must give between 1 and {MAX_PIPELINE_STAGES} effects to apply.")
+
+        if unknown := [effect for effect in effects if effect not in PIPELINE_STAGES]:
+            raise commands.BadArgument(
+                f"I don't know the effect(s) {', '.join(unknown)}. "
+                f"Choose from {', '.join(PIPELINE_STAGES)}."
+            )
+
+        async with ctx.typing():
+            user = await self._fetch_user(ctx.author.id)
+            if not user:
+                await ctx.send(f"{Emojis.cross_mark} Could not get user info.")
+                return
+
+            file_name = file_safe_name("pipeline_avatar", ctx.author.display_name)
+            file_name = f"{file_name}.{image_kind(effects[-1]).extension}"
+            image_bytes = await self._read_avatar(user, 1024)
+
+            stages = [(effect, PIPELINE_STAGES[effect]) for effect in effects]
+            image, timings = await self._run_in_executor(effects, PfpEffects.apply_pipeline, image_bytes, stages)
+
+            timings_text = ", ".join(f"{stage} {seconds * 1000:.0f}ms" for stage, seconds in timings)
+            log.debug(f"Avatar pipeline for {ctx.author} took {timings_text}.")
+
+            embed = discord.Embed(
+                title="Your avatar, several times over",
+                description=f"Here is your avatar with {' → '.join(effects)} applied.",
+                colour=Colours.blue
+            )
+            embed.set_image(url=f"attachment://{file_name}")
+            embed.set_footer(
+                text=f"Made by {ctx.author.display_name}. {timings_text}",
+                icon_url=user.display_avatar.url
+            )
+
+            await ctx.send(file=discord.File(BytesIO(image), filename=file_name), embed=embed)
+
 
 async def setup(bot: Bot) -> None:
     """Load the AvatarModify cog."""
@@ -11,7 +11,7 @@ from bot.bot import Bot
 from bot.constants import Channels, Colours, ERROR_REPLIES, NEGATIVE_REPLIES
 from bot.utils.commands import get_command_suggestions
 from bot.utils.decorators import InChannelCheckFailure, InMonthCheckFailure
-from bot.utils.exceptions import APIError, MovedCommandError, UserNotPlayingError
+from bot.utils.exceptions import APIError, GitHubRateLimitError, MovedCommandError, UserNotPlayingError
 
 log = get_logger(__name__)
 
@@ -124,6 +124,15 @@ class CommandErrorHandler(commands.Cog):
             await ctx.send("Game not found.")
             return
 
+        if isinstance(error, GitHubRateLimitError):
+            await ctx.send(
+                embed=self.error_embed(
+                    f"The bot has run out of GitHub API requests, please try again <t:{math.ceil(error.reset)}:R>.",
+                    NEGATIVE_REPLIES
+                )
+            )
+            return
+
         if isinstance(error, APIError):
             await ctx.send(
                 embed=self.error_embed(
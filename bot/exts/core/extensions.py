@@ -146,7 +146,11 @@ class Extensions(commands.Cog):
         Get a list of all extensions, including their loaded status.
 
         Grey indicates that the extension is unloaded.
+        Yellow indicates that the extension will be loaded when one of its commands or listeners is first used.
         Green indicates that the extension is currently loaded.
+
+        Extensions that have been loaded show how long their import, `setup()` and `cog_load` took,
+        and how much memory they allocated if memory was being traced at the time.
         """
         embed = Embed(colour=Colour.og_blurple())
         embed.set_author(
@@ -174,6 +178,8 @@ class Extensions(commands.Cog):
         for ext in self.bot.all_extensions:
             if ext in self.bot.extensions:
                 status = Emojis.status_online
+            elif ext in self.bot.lazy_extensions:
+                status = Emojis.status_idle
             else:
                 status = Emojis.status_offline
 
@@ -183,7 +189,11 @@ class Extensions(commands.Cog):
             else:
                 category = "uncategorised"
 
-            categories.setdefault(category, []).append(f"{status}  {path[-1]}")
+            line = f"{status}  {path[-1]}"
+            if profile := self.bot.extension_profiles.get(ext):
+                line += f" · {profile.summary()}"
+
+            categories.setdefault(category, []).append(line)
 
         return categories
 
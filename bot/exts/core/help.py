@@ -11,8 +11,9 @@ from pydis_core.utils.logging import get_logger
 
 from bot import constants
 from bot.bot import Bot
-from bot.utils.commands import get_command_suggestions
+from bot.utils.commands import get_command_params, get_command_suggestions
 from bot.utils.decorators import whitelist_override
+from bot.utils.lazy_extensions import LazyCommand
 from bot.utils.pagination import LinePaginator, PAGINATION_EMOJI
 
 REACTIONS = {
@@ -241,6 +242,8 @@ class HelpSession:
 
         A zero width space is used as a prefix for results with no cogs to force them last in ordering.
         """
+        if isinstance(cmd, LazyCommand):
+            return f"**{cmd.category}**"
         if cmd.cog:
             try:
                 if cmd.cog.category:
@@ -256,32 +259,9 @@ class HelpSession:
         Returns the command usage signature.
 
         This is a custom implementation of `command.signature` in order to format the command
-        signature without aliases.
+        signature without aliases. The parameters of lazily loaded commands come from the extension manifest.
         """
-        results = []
-        for name, param in cmd.clean_params.items():
-
-            # if argument has a default value
-            if param.default is not param.empty:
-
-                if isinstance(param.default, str):
-                    show_default = param.default
-                else:
-                    show_default = param.default is not None
-
-                # if default is not an empty string or None
-                if show_default:
-                    results.append(f"[{name}={param.default}]")
-                else:
-                    results.append(f"[{name}]")
-
-            # if variable length argument
-            elif param.kind == param.VAR_POSITIONAL:
-                results.append(f"[{name}...]")
-
-            # if required
-            else:
-                results.append(f"<{name}>")
+        results = cmd.signature_params if isinstance(cmd, LazyCommand) else get_command_params(cmd)
         return " ".join([cmd.qualified_name, *results])
 
     async def build_pages(self) -> None:
@@ -511,6 +491,10 @@ class Help(DiscordCog):
     @whitelist_override(allow_dm=True)
     async def new_help(self, ctx: Context, *commands) -> None:
         """Shows Command Help."""
+        # The listing of every command is built from the manifest, but a queried command or category
+        # can't be described in full until its extension is loaded
+        if commands:
+            await ctx.bot.load_lazy_extensions(" ".join(commands))
         try:
             await HelpSession.start(ctx, *commands)
         except HelpQueryNotFoundError as error:
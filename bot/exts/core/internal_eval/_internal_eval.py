@@ -179,3 +179,27 @@ class InternalEval(commands.Cog):
         """Reset the context and locals of the eval session."""
         self.locals = {}
         await ctx.send("The evaluation context was reset.")
+
+    @internal_group.command(name="handlers", aliases=("router",))
+    @with_role(Roles.admins)
+    async def handlers(self, ctx: commands.Context) -> None:
+        """Show how often each message handler was run and how long it took."""
+        await self._send_output(ctx, self.bot.message_router.format_stats())
+
+    @internal_group.command(name="seasonal", aliases=("schedule",))
+    @with_role(Roles.admins)
+    async def seasonal(self, ctx: commands.Context) -> None:
+        """Show when each seasonal task next runs."""
+        await self._send_output(ctx, self.bot.seasonal_scheduler.format_upcoming())
+
+    @internal_group.command(name="http", aliases=("cache",))
+    @with_role(Roles.admins)
+    async def http(self, ctx: commands.Context) -> None:
+        """Show how often each host's responses were served from the HTTP cache, and how fast the host is."""
+        await self._send_output(ctx, self.bot.http_cache.format_stats())
+
+    @internal_group.command(name="github", aliases=("gh", "ratelimits"))
+    @with_role(Roles.admins)
+    async def github(self, ctx: commands.Context) -> None:
+        """Show what's left of each GitHub API rate limit budget, and how many requests were refused to keep it."""
+        await self._send_output(ctx, self.bot.github.format_budgets())
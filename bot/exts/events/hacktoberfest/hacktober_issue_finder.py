@@ -1,24 +1,19 @@
 import random
-from datetime import UTC, datetime
+import time
 
 import discord
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.constants import Month, Tokens
+from bot.constants import Month
 from bot.utils.decorators import in_month
 
 log = get_logger(__name__)
 
 URL = "https://api.github.com/search/issues?per_page=100&q=is:issue+label:hacktoberfest+language:python+state:open"
-
-REQUEST_HEADERS = {
-    "User-Agent": "Python Discord Hacktoberbot",
-    "Accept": "application / vnd.github.v3 + json"
-}
-if GITHUB_TOKEN := Tokens.github.get_secret_value():
-    REQUEST_HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
+# How long a page of issues is reused for, to stay within the GitHub search rate limit
+CACHE_TTL = 60
 
 
 class HacktoberIssues(commands.Cog):
@@ -26,10 +21,12 @@ class HacktoberIssues(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.cache_normal = None
-        self.cache_timer_normal = datetime(1, 1, 1, tzinfo=UTC)
-        self.cache_beginner = None
-        self.cache_timer_beginner = datetime(1, 1, 1, tzinfo=UTC)
+        self.bot.http_cache.register(URL.partition("?")[0], ttl=CACHE_TTL)
+        # The number of issues GitHub last reported, by option, to pick a random page of them
+        self.total_counts: dict[str, int] = {}
+        # The URL of the page each option is using and when it was picked. A page is kept until its
+        # cached response expires, so each option makes at most one search request every `CACHE_TTL`.
+        self.pages: dict[str, tuple[str, float]] = {}
 
     @in_month(Month.OCTOBER)
     @commands.command()
@@ -50,49 +47,33 @@ class HacktoberIssues(commands.Cog):
 
     async def get_issues(self, ctx: commands.Context, option: str) -> dict | None:
         """Get a list of the python issues with the label 'hacktoberfest' from the Github api."""
-        if option == "beginner":
-            if (ctx.message.created_at.replace(tzinfo=None) - self.cache_timer_beginner).seconds <= 60:
-                log.debug("using cache")
-                return self.cache_beginner
-        elif (ctx.message.created_at.replace(tzinfo=None) - self.cache_timer_normal).seconds <= 60:
-            log.debug("using cache")
-            return self.cache_normal
-
-        if option == "beginner":
-            url = URL + '+label:"good first issue"'
-            if self.cache_beginner is not None:
-                page = random.randint(1, min(1000, self.cache_beginner["total_count"]) // 100)
-                url += f"&page={page}"
-        else:
-            url = URL
-            if self.cache_normal is not None:
-                page = random.randint(1, min(1000, self.cache_normal["total_count"]) // 100)
+        option = "beginner" if option == "beginner" else "normal"
+        url, picked_at = self.pages.get(option, (None, 0.0))
+        if url is None or time.monotonic() - picked_at >= CACHE_TTL:
+            url = URL + '+label:"good first issue"' if option == "beginner" else URL
+            if option in self.total_counts:
+                page = random.randint(1, max(1, min(1000, self.total_counts[option]) // 100))
                 url += f"&page={page}"
+            self.pages[option] = (url, time.monotonic())
 
         log.debug(f"making api request to url: {url}")
-        async with self.bot.http_session.get(url, headers=REQUEST_HEADERS) as response:
-            if response.status != 200:
-                log.error(f"expected 200 status (got {response.status}) by the GitHub api.")
-                await ctx.send(
-                    f"ERROR: expected 200 status (got {response.status}) by the GitHub api.\n"
-                    f"{await response.text()}"
-                )
-                return None
-            data = await response.json()
-
-            if len(data["items"]) == 0:
-                log.error(f"no issues returned by GitHub API, with url: {response.url}")
-                await ctx.send(f"ERROR: no issues returned by GitHub API, with url: {response.url}")
-                return None
-
-            if option == "beginner":
-                self.cache_beginner = data
-                self.cache_timer_beginner = ctx.message.created_at.replace(tzinfo=None)
-            else:
-                self.cache_normal = data
-                self.cache_timer_normal = ctx.message.created_at.replace(tzinfo=None)
-
-            return data
+        response = await self.bot.github.get(url)
+        if response.status != 200:
+            log.error(f"expected 200 status (got {response.status}) by the GitHub api.")
+            await ctx.send(
+                f"ERROR: expected 200 status (got {response.status}) by the GitHub api.\n"
+                f"{await response.text()}"
+            )
+            return None
+        data = await response.json()
+
+        if len(data["items"]) == 0:
+            log.error(f"no issues returned by GitHub API, with url: {response.url}")
+            await ctx.send(f"ERROR: no issues returned by GitHub API, with url: {response.url}")
+            return None
+
+        self.total_counts[option] = data["total_count"]
+        return data
 
     @staticmethod
     def format_embed(issue: dict) -> discord.Embed:
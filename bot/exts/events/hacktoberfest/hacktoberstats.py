@@ -19,12 +19,8 @@ CURRENT_YEAR = datetime.now(tz=UTC).year  # Used to construct GH API query
 PRS_FOR_SHIRT = 4  # Minimum number of PRs before a shirt is awarded
 REVIEW_DAYS = 14  # number of days needed after PR can be mature
 
-REQUEST_HEADERS = {"User-Agent": "Python Discord Hacktoberbot"}
 # using repo topics API during preview period requires an accept header
 GITHUB_TOPICS_ACCEPT_HEADER = {"Accept": "application/vnd.github.mercy-preview+json"}
-if GITHUB_TOKEN := Tokens.github:
-    REQUEST_HEADERS["Authorization"] = f"token {GITHUB_TOKEN.get_secret_value()}"
-    GITHUB_TOPICS_ACCEPT_HEADER["Authorization"] = f"token {GITHUB_TOKEN.get_secret_value()}"
 
 GITHUB_NONEXISTENT_USER_MESSAGE = (
     "The listed users cannot be searched either because the users do not exist "
@@ -225,7 +221,7 @@ class HacktoberStats(commands.Cog):
 
         log.debug(f"GitHub query parameters generated: {query_params}")
 
-        jsonresp = await self._fetch_url(base_url, REQUEST_HEADERS, {"q": query_params})
+        jsonresp = await self._fetch_url(base_url, params={"q": query_params})
         if "message" in jsonresp:
             # One of the parameters is invalid, short circuit for now
             api_message = jsonresp["errors"][0]["message"]
@@ -281,7 +277,7 @@ class HacktoberStats(commands.Cog):
             # Fetch topics for the PR's repo
             topics_query_url = f"https://api.github.com/repos/{shortname}/topics"
             log.debug(f"Fetching repo topics for {shortname} with url: {topics_query_url}")
-            jsonresp2 = await self._fetch_url(topics_query_url, GITHUB_TOPICS_ACCEPT_HEADER)
+            jsonresp2 = await self._fetch_url(topics_query_url, headers=GITHUB_TOPICS_ACCEPT_HEADER)
             if jsonresp2.get("names") is None:
                 log.error(f"Error fetching topics for {shortname}: {jsonresp2['message']}")
                 continue  # Assume the repo doesn't have the `hacktoberfest` topic if API  request errored
@@ -293,10 +289,10 @@ class HacktoberStats(commands.Cog):
                 outlist.append(itemdict)
         return outlist
 
-    async def _fetch_url(self, url: str, headers: dict, params: dict) -> dict:
+    async def _fetch_url(self, url: str, *, headers: dict | None = None, params: dict | None = None) -> dict:
         """Retrieve API response from URL."""
-        async with self.bot.http_session.get(url, headers=headers, params=params) as resp:
-            return await resp.json()
+        resp = await self.bot.github.get(url, headers=headers, params=params)
+        return await resp.json()
 
     @staticmethod
     def _has_label(pr: dict, labels: list[str] | str) -> bool:
@@ -319,7 +315,7 @@ class HacktoberStats(commands.Cog):
         """Check if a PR is merged, approved, or labelled hacktoberfest-accepted."""
         # checking for merge status
         query_url = f"https://api.github.com/repos/{pr['repo_shortname']}/pulls/{pr['number']}"
-        jsonresp = await self._fetch_url(query_url, REQUEST_HEADERS)
+        jsonresp = await self._fetch_url(query_url)
 
         if message := jsonresp.get("message"):
             log.error(f"Error fetching PR stats for #{pr['number']} in repo {pr['repo_shortname']}:\n{message}")
@@ -334,7 +330,7 @@ class HacktoberStats(commands.Cog):
 
         # checking approval
         query_url += "/reviews"
-        jsonresp2 = await self._fetch_url(query_url, REQUEST_HEADERS)
+        jsonresp2 = await self._fetch_url(query_url)
         if isinstance(jsonresp2, dict):
             # if API request is unsuccessful it will be a dict with the error in 'message'
             log.error(
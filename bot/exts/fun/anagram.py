@@ -1,7 +1,5 @@
 import asyncio
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,14 +7,15 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
+from bot.utils.message_router import message_handler
 
 log = get_logger(__name__)
 
 TIME_LIMIT = 60
 
 # anagram.json file contains all the anagrams
-with open(Path("bot/resources/fun/anagram.json")) as f:
-    ANAGRAMS_ALL = json.load(f)
+ANAGRAMS_ALL = resources.load("fun/anagram.json")
 
 
 class AnagramGame:
@@ -91,17 +90,11 @@ class Anagram(commands.Cog):
         # Game is finished, let's remove it from the dict
         self.games.pop(ctx.channel.id)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """Check a message for an anagram attempt and pass to an ongoing game."""
-        if message.author.bot or not message.guild:
-            return
-
-        game = self.games.get(message.channel.id)
-        if not game:
-            return
-
-        await game.message_creation(message)
+    @message_handler(guild_only=True, active_in="games")
+    async def check_answer(self, message: discord.Message) -> None:
+        """Pass a message in a channel with an ongoing game to the game, as an anagram attempt."""
+        if game := self.games.get(message.channel.id):
+            await game.message_creation(message)
 
 
 async def setup(bot: Bot) -> None:
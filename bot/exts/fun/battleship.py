@@ -241,7 +241,7 @@ class Game:
         await self.next.user.send("Their turn", delete_after=3.0)
         while True:
             try:
-                await self.bot.wait_for("message", check=self.predicate, timeout=60.0)
+                await self.bot.waiters.wait_for("message", user=self.turn.user.id, check=self.predicate, timeout=60.0)
             except TimeoutError:
                 await self.turn.user.send("You took too long. Game over!")
                 await self.next.user.send(f"{self.turn.user} took too long. Game over!")
@@ -391,8 +391,9 @@ class Battleship(commands.Cog):
         await announcement.add_reaction(CROSS_EMOJI)
 
         try:
-            reaction, user = await self.bot.wait_for(
+            reaction, user = await self.bot.waiters.wait_for(
                 "reaction_add",
+                message=announcement.id,
                 check=partial(self.predicate, ctx, announcement),
                 timeout=60.0
             )
@@ -129,7 +129,9 @@ class Game:
         player_num = 1 if self.player_active == self.player1 else 2
         while True:
             try:
-                reaction, user = await self.bot.wait_for("reaction_add", check=self.predicate, timeout=30.0)
+                reaction, user = await self.bot.waiters.wait_for(
+                    "reaction_add", message=self.message.id, check=self.predicate, timeout=30.0
+                )
             except TimeoutError:
                 await self.channel.send(f"{self.player_active.mention}, you took too long. Game over!")
                 return None
@@ -398,8 +400,9 @@ class ConnectFour(commands.Cog):
         await announcement.add_reaction(CROSS_EMOJI)
 
         try:
-            reaction, user = await self.bot.wait_for(
+            reaction, user = await self.bot.waiters.wait_for(
                 "reaction_add",
+                message=announcement.id,
                 check=partial(self.get_player, ctx, announcement),
                 timeout=60.0
             )
@@ -2,7 +2,6 @@ import asyncio
 import random
 import re
 from collections import defaultdict
-from io import BytesIO
 from itertools import product
 from pathlib import Path
 
@@ -13,6 +12,8 @@ from discord.ext import commands
 from bot.bot import Bot
 from bot.constants import MODERATION_ROLES
 from bot.utils.decorators import with_role
+from bot.utils.images import ImageKind, image_file
+from bot.utils.message_router import message_handler
 
 DECK = list(product(*[(0, 1, 2)]*4))
 
@@ -207,17 +208,14 @@ class DuckGamesDirector(commands.Cog):
             except KeyError:
                 pass
 
-    @commands.Cog.listener()
-    async def on_message(self, msg: discord.Message) -> None:
-        """Listen for messages and process them as answers if appropriate."""
-        if msg.author.bot:
-            return
-
+    @message_handler(active_in="current_games")
+    async def check_answer(self, msg: discord.Message) -> None:
+        """Process messages in channels with a running game as answers if appropriate."""
         channel = msg.channel
-        if channel.id not in self.current_games:
+        # The game may have ended since the message was routed here
+        if not (game := self.current_games.get(channel.id)):
             return
 
-        game = self.current_games[channel.id]
         if msg.content.strip().lower() == "goose":
             # If all of the solutions have been claimed, i.e. the "goose" call is correct.
             if len(game.solutions) == len(game.claimed_answers):
@@ -256,15 +254,12 @@ class DuckGamesDirector(commands.Cog):
     async def send_board_embed(self, ctx: commands.Context, game: DuckGame) -> discord.Message:
         """Create and send an embed to display the board."""
         image = assemble_board_image(game.board, game.rows, game.columns)
-        with BytesIO() as image_stream:
-            image.save(image_stream, format="png")
-            image_stream.seek(0)
-            file = discord.File(fp=image_stream, filename="board.png")
+        file = image_file(image, ImageKind.FLAT, "board")
         embed = discord.Embed(
             title="Duck Duck Duck Goose!",
             color=discord.Color.dark_purple(),
         )
-        embed.set_image(url="attachment://board.png")
+        embed.set_image(url=f"attachment://{file.filename}")
         return await ctx.send(embed=embed, file=file)
 
     async def send_found_embed(self, ctx: commands.Context) -> discord.Message:
@@ -1,7 +1,5 @@
-import json
 import random
 from collections.abc import Iterable
-from pathlib import Path
 from typing import Literal
 
 import pyjokes
@@ -13,7 +11,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Client, Colours, Emojis
-from bot.utils import helpers, messages
+from bot.utils import helpers, messages, resources
 
 log = get_logger(__name__)
 
@@ -43,7 +41,7 @@ class Fun(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self._caesar_cipher_embed = json.loads(Path("bot/resources/fun/caesar_info.json").read_text("UTF-8"))
+        self._caesar_cipher_embed = resources.load("fun/caesar_info.json")
 
     @staticmethod
     def _get_random_die() -> str:
@@ -16,6 +16,7 @@ from pydis_core.utils.paste_service import PasteFile, PasteTooLongError, PasteUp
 from bot.bot import Bot
 from bot.constants import Channels, WHITELISTED_CHANNELS
 from bot.utils.decorators import whitelist_override
+from bot.utils.images import ImageKind, encode_image
 
 log = get_logger(__name__)
 FORMATTED_CODE_REGEX = re.compile(
@@ -62,7 +63,7 @@ def _process_image(data: bytes, out_file: BinaryIO) -> None:
     # when an RGBA image is passed as the mask, its alpha band is used.
     # this has the effect of skipping pasting the pixels where the image is transparent.
     background.paste(image, (PAD, PAD), image)
-    background.save(out_file)
+    out_file.write(encode_image(background, ImageKind.FLAT))
 
 
 class InvalidLatexError(Exception):
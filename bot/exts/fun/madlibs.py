@@ -1,5 +1,3 @@
-import json
-from pathlib import Path
 from random import choice
 from typing import TypedDict
 
@@ -8,6 +6,8 @@ from discord.ext import commands
 
 from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
+from bot.utils import resources
+from bot.utils.message_router import message_handler
 
 TIMEOUT = 60.0
 
@@ -27,14 +27,12 @@ class Madlibs(commands.Cog):
         self.bot = bot
         self.templates = self._load_templates()
         self.edited_content = {}
-        self.checks = set()
+        # The channel and author IDs of the games being played
+        self.players = set()
 
     @staticmethod
     def _load_templates() -> list[MadlibsTemplate]:
-        madlibs_stories = Path("bot/resources/fun/madlibs_templates.json")
-
-        with open(madlibs_stories) as file:
-            return json.load(file)
+        return resources.load("fun/madlibs_templates.json")
 
     @staticmethod
     def madlibs_embed(part_of_speech: str, number_of_inputs: int) -> discord.Embed:
@@ -50,15 +48,11 @@ class Madlibs(commands.Cog):
 
         return madlibs_embed
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, _: discord.Message, after: discord.Message) -> None:
-        """A listener that checks for message edits from the user."""
-        for check in self.checks:
-            if check(after):
-                break
-        else:
-            return
-
+    @message_handler(
+        "message_edit", active_in="players", active_key=lambda message: (message.channel.id, message.author.id)
+    )
+    async def record_edit(self, after: discord.Message) -> None:
+        """A handler that records message edits from players."""
         self.edited_content[after.id] = after.content
 
     @commands.command()
@@ -76,7 +70,8 @@ class Madlibs(commands.Cog):
         def author_check(message: discord.Message) -> bool:
             return message.channel.id == ctx.channel.id and message.author.id == ctx.author.id
 
-        self.checks.add(author_check)
+        player = (ctx.channel.id, ctx.author.id)
+        self.players.add(player)
 
         loading_embed = discord.Embed(
             title="Madlibs", description="Loading your Madlibs game...", color=Colours.python_blue
@@ -92,7 +87,9 @@ class Madlibs(commands.Cog):
             await original_message.edit(embed=madlibs_embed)
 
             try:
-                message = await self.bot.wait_for("message", check=author_check, timeout=TIMEOUT)
+                message = await self.bot.waiters.wait_for(
+                    "message", channel=ctx.channel.id, check=author_check, timeout=TIMEOUT
+                )
             except TimeoutError:
                 timeout_embed = discord.Embed(
                     title=choice(NEGATIVE_REPLIES),
@@ -105,7 +102,7 @@ class Madlibs(commands.Cog):
                 for msg_id in submitted_words:
                     self.edited_content.pop(msg_id, submitted_words[msg_id])
 
-                self.checks.remove(author_check)
+                self.players.discard(player)
 
                 return
 
@@ -113,7 +110,7 @@ class Madlibs(commands.Cog):
 
         blanks = [self.edited_content.pop(msg_id, submitted_words[msg_id]) for msg_id in submitted_words]
 
-        self.checks.remove(author_check)
+        self.players.discard(player)
 
         story = []
         for value, blank in zip(random_template["value"], blanks, strict=True):
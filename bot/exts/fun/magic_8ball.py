@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-ANSWERS = json.loads(Path("bot/resources/fun/magic8ball.json").read_text("utf8"))
+ANSWERS = resources.load("fun/magic8ball.json")
 
 
 class Magic8ball(commands.Cog):
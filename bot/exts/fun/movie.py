@@ -2,7 +2,6 @@ import random
 from enum import Enum
 from typing import Any
 
-from aiohttp import ClientSession
 from discord import Embed
 from discord.ext.commands import Cog, Context, group
 from pydis_core.utils.logging import get_logger
@@ -10,6 +9,7 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Tokens
 from bot.utils.exceptions import APIError
+from bot.utils.http_cache import HTTPCache
 from bot.utils.pagination import ImagePaginator
 
 logger = get_logger(__name__)
@@ -58,7 +58,8 @@ class Movie(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.http_session: ClientSession = bot.http_session
+        self.http: HTTPCache = bot.http_cache
+        self.http.register(BASE_URL, ttl=60 * 60, stale_ttl=24 * 60 * 60)
 
     @group(name="movies", aliases=("movie",), invoke_without_command=True)
     async def movies(self, ctx: Context, genre: str = "", amount: int = 5) -> None:
@@ -80,7 +81,7 @@ class Movie(Cog):
         # Capitalize genre for getting data from Enum, get random page, send help when genre don't exist.
         genre = genre.capitalize()
         try:
-            result = await self.get_movies_data(self.http_session, MovieGenres[genre].value, 1)
+            result = await self.get_movies_data(self.http, MovieGenres[genre].value, 1)
         except KeyError:
             await self.bot.invoke_help_command(ctx)
             return
@@ -89,10 +90,10 @@ class Movie(Cog):
         page = random.randint(1, min(result["total_pages"], MAX_PAGES))
 
         # Get movies list from TMDB, check if results key in result. When not, raise error.
-        movies = await self.get_movies_data(self.http_session, MovieGenres[genre].value, page)
+        movies = await self.get_movies_data(self.http, MovieGenres[genre].value, page)
 
         # Get all pages and embed
-        pages = await self.get_pages(self.http_session, movies, amount)
+        pages = await self.get_pages(self.http, movies, amount)
         embed = await self.get_embed(genre)
 
         await ImagePaginator.paginate(pages, ctx, embed)
@@ -102,7 +103,7 @@ class Movie(Cog):
         """Show all currently available genres for .movies command."""
         await ctx.send(f"Current available genres: {', '.join('`' + genre.name + '`' for genre in MovieGenres)}")
 
-    async def get_movies_data(self, client: ClientSession, genre_id: str, page: int) -> list[dict[str, Any]]:
+    async def get_movies_data(self, client: HTTPCache, genre_id: str, page: int) -> list[dict[str, Any]]:
         """Return JSON of TMDB discover request."""
         # Define params of request
         params = {
@@ -132,7 +133,7 @@ class Movie(Cog):
                 raise APIError("TMDB API", status, err_msg)
             return result
 
-    async def get_pages(self, client: ClientSession, movies: dict[str, Any], amount: int) -> list[tuple[str, str]]:
+    async def get_pages(self, client: HTTPCache, movies: dict[str, Any], amount: int) -> list[tuple[str, str]]:
         """Fetch all movie pages from movies dictionary. Return list of pages."""
         pages = []
 
@@ -145,7 +146,7 @@ class Movie(Cog):
 
         return pages
 
-    async def get_movie(self, client: ClientSession, movie: int) -> dict[str, Any]:
+    async def get_movie(self, client: HTTPCache, movie: int) -> dict[str, Any]:
         """Get Movie by movie ID from TMDB. Return result dictionary."""
         if not isinstance(movie, int):
             raise ValueError("Error while fetching movie from TMDB, movie argument must be integer. ")
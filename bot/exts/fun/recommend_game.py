@@ -1,5 +1,3 @@
-import json
-from pathlib import Path
 from random import shuffle
 
 import discord
@@ -7,13 +5,14 @@ from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 game_recs = []
 
 # Populate the list `game_recs` with resource files
-for rec_path in Path("bot/resources/fun/game_recs").glob("*.json"):
-    data = json.loads(rec_path.read_text("utf8"))
+for rec_path in (resources.RESOURCES_DIRECTORY / "fun/game_recs").glob("*.json"):
+    data = resources.load(rec_path)
     game_recs.append(data)
 shuffle(game_recs)
 
@@ -1,4 +1,3 @@
-import json
 import random
 from collections.abc import Iterable
 
@@ -8,7 +7,7 @@ from pydis_core.utils.logging import get_logger
 from rapidfuzz import fuzz
 
 from bot.exts.fun.snakes._utils import SNAKE_RESOURCES
-from bot.utils import disambiguate
+from bot.utils import disambiguate, resources
 
 log = get_logger(__name__)
 
@@ -63,10 +62,10 @@ class Snake(Converter):
         """Build list of snakes from the static snake resources."""
         # Get all the snakes
         if cls.snakes is None:
-            cls.snakes = json.loads((SNAKE_RESOURCES / "snake_names.json").read_text("utf8"))
+            cls.snakes = resources.load(SNAKE_RESOURCES / "snake_names.json")
         # Get the special cases
         if cls.special_cases is None:
-            special_cases = json.loads((SNAKE_RESOURCES / "special_snakes.json").read_text("utf8"))
+            special_cases = resources.load(SNAKE_RESOURCES / "special_snakes.json")
             cls.special_cases = {snake["name"].lower(): snake for snake in special_cases}
 
     @classmethod
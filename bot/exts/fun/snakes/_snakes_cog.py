@@ -22,6 +22,7 @@ from bot.constants import ERROR_REPLIES, Tokens
 from bot.exts.fun.snakes import _utils as utils
 from bot.exts.fun.snakes._converter import Snake
 from bot.utils.decorators import locked
+from bot.utils.images import ImageKind, encode_image, image_file
 
 log = get_logger(__name__)
 
@@ -248,11 +249,7 @@ class Snakes(Cog):
             offset += bottom - top + 4
 
         # Get the image contents as a BufferIO object
-        buffer = BytesIO()
-        full_image.save(buffer, "PNG")
-        buffer.seek(0)
-
-        return buffer
+        return BytesIO(encode_image(full_image, ImageKind.PHOTO))
 
     @staticmethod
     def _snakify(message: str) -> str:
@@ -282,7 +279,7 @@ class Snakes(Cog):
         if params is None:
             params = {}
 
-        async with self.bot.http_session.get(url, params=params, timeout=ClientTimeout(total=10)) as response:
+        async with self.bot.http_cache.get(url, params=params, timeout=ClientTimeout(total=10)) as response:
             return await response.json()
 
     def _get_random_long_message(self, messages: list[str], retries: int = 10) -> str:
@@ -421,7 +418,9 @@ class Snakes(Cog):
 
         # Validate the answer
         try:
-            reaction, _ = await ctx.bot.wait_for("reaction_add", timeout=45.0, check=predicate)
+            reaction, _ = await ctx.bot.waiters.wait_for(
+                "reaction_add", message=message.id, timeout=45.0, check=predicate
+            )
         except TimeoutError:
             await ctx.send(f"You took too long. The correct answer was **{options[answer]}**.")
             await message.clear_reactions()
@@ -514,8 +513,8 @@ class Snakes(Cog):
         # Begin main game loop
         while not win and antidote_tries < 10:
             try:
-                reaction, user = await ctx.bot.wait_for(
-                    "reaction_add", timeout=300, check=predicate)
+                reaction, user = await ctx.bot.waiters.wait_for(
+                    "reaction_add", message=board_id.id, timeout=300, check=predicate)
             except TimeoutError:
                 log.debug("Antidote timed out waiting for a reaction")
                 break  # We're done, no reactions for the last 5 minutes
@@ -625,8 +624,7 @@ class Snakes(Cog):
                 text_color=text_color,
                 bg_color=bg_color
             )
-            png_bytes = utils.frame_to_png_bytes(image_frame)
-            file = File(png_bytes, filename="snek.png")
+            file = image_file(image_frame, ImageKind.FLAT, "snek")
             await ctx.send(file=file)
 
     @snakes_group.command(name="get")
@@ -1021,7 +1019,7 @@ class Snakes(Cog):
         # Send it!
         await ctx.send(
             f"A wild {content['name'].title()} appears!",
-            file=File(final_buffer, filename=content["name"].replace(" ", "") + ".png")
+            file=File(final_buffer, filename=content["name"].replace(" ", "") + f".{ImageKind.PHOTO.extension}")
         )
 
     @snakes_group.command(name="fact")
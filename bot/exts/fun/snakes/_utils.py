@@ -1,5 +1,4 @@
 import io
-import json
 import math
 import random
 from itertools import product
@@ -12,6 +11,8 @@ from discord.ext.commands import Cog, Context
 from pydis_core.utils.logging import get_logger
 
 from bot.constants import Emojis, MODERATION_ROLES
+from bot.utils import resources
+from bot.utils.images import ImageKind, image_file
 
 SNAKE_RESOURCES = Path("bot/resources/fun/snakes").absolute()
 
@@ -117,7 +118,7 @@ ANGLE_RANGE = math.pi * 2
 
 def get_resource(file: str) -> list[dict]:
     """Load Snake resources JSON."""
-    return json.loads((SNAKE_RESOURCES / f"{file}.json").read_text("utf-8"))
+    return resources.load(SNAKE_RESOURCES / f"{file}.json")
 
 
 def smoothstep(t: float) -> float:
@@ -346,14 +347,6 @@ def create_snek_frame(
     return image
 
 
-def frame_to_png_bytes(image: Image) -> io.BytesIO:
-    """Convert image to byte stream."""
-    stream = io.BytesIO()
-    image.save(stream, format="PNG")
-    stream.seek(0)
-    return stream
-
-
 log = get_logger(__name__)
 START_EMOJI = Emojis.check
 CANCEL_EMOJI = Emojis.cross_mark
@@ -431,8 +424,9 @@ class SnakeAndLaddersGame:
 
         while not self.started:
             try:
-                reaction, user = await self.ctx.bot.wait_for(
+                reaction, user = await self.ctx.bot.waiters.wait_for(
                     "reaction_add",
+                    message=startup.id,
                     timeout=300,
                     check=startup_event_check
                 )
@@ -561,22 +555,8 @@ class SnakeAndLaddersGame:
         self.state = "roll"
         for user in self.players:
             self.round_has_rolled[user.id] = False
-        board_img = Image.open(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg")
-        player_row_size = math.ceil(MAX_PLAYERS / 2)
-
-        for i, player in enumerate(self.players):
-            tile = self.player_tiles[player.id]
-            tile_coordinates = self._board_coordinate_from_index(tile)
-            x_offset = BOARD_MARGIN[0] + tile_coordinates[0] * BOARD_TILE_SIZE
-            y_offset = \
-                BOARD_MARGIN[1] + (
-                    (10 * BOARD_TILE_SIZE) - (9 - tile_coordinates[1]) * BOARD_TILE_SIZE - BOARD_PLAYER_SIZE)
-            x_offset += BOARD_PLAYER_SIZE * (i % player_row_size)
-            y_offset -= BOARD_PLAYER_SIZE * math.floor(i / player_row_size)
-            board_img.paste(self.avatar_images[player.id],
-                            box=(x_offset, y_offset))
 
-        board_file = File(frame_to_png_bytes(board_img), filename="Board.jpg")
+        board_file = image_file(self.render_board(), ImageKind.PHOTO, "Board")
         player_list = "\n".join((user.mention + ": Tile " + str(self.player_tiles[user.id])) for user in self.players)
 
         # Store and send new messages
@@ -609,8 +589,9 @@ class SnakeAndLaddersGame:
         is_surrendered = False
         while True:
             try:
-                reaction, user = await self.ctx.bot.wait_for(
+                reaction, user = await self.ctx.bot.waiters.wait_for(
                     "reaction_add",
+                    message=self.positions.id,
                     timeout=300,
                     check=game_event_check
                 )
@@ -640,6 +621,25 @@ class SnakeAndLaddersGame:
         if not is_surrendered:
             await self._complete_round()
 
+    def render_board(self) -> Image.Image:
+        """Draw every player's avatar on their current tile of the board."""
+        board_img = Image.open(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg")
+        player_row_size = math.ceil(MAX_PLAYERS / 2)
+
+        for i, player in enumerate(self.players):
+            tile = self.player_tiles[player.id]
+            tile_coordinates = self._board_coordinate_from_index(tile)
+            x_offset = BOARD_MARGIN[0] + tile_coordinates[0] * BOARD_TILE_SIZE
+            y_offset = \
+                BOARD_MARGIN[1] + (
+                    (10 * BOARD_TILE_SIZE) - (9 - tile_coordinates[1]) * BOARD_TILE_SIZE - BOARD_PLAYER_SIZE)
+            x_offset += BOARD_PLAYER_SIZE * (i % player_row_size)
+            y_offset -= BOARD_PLAYER_SIZE * math.floor(i / player_row_size)
+            board_img.paste(self.avatar_images[player.id],
+                            box=(x_offset, y_offset))
+
+        return board_img
+
     async def player_roll(self, user: User | Member) -> None:
         """Handle the player's roll."""
         if user.id not in self.player_tiles:
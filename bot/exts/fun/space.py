@@ -25,7 +25,9 @@ class Space(Cog):
     """Space Cog contains commands, that show images, facts or other information about space."""
 
     def __init__(self, bot: Bot):
-        self.http_session = bot.http_session
+        self.http = bot.http_cache
+        for base in (NASA_BASE_URL, NASA_IMAGES_BASE_URL, NASA_EPIC_BASE_URL):
+            self.http.register(base, ttl=60 * 60, stale_ttl=24 * 60 * 60)
         self.bot = bot
 
         self.rovers = {}
@@ -214,7 +216,7 @@ class Space(Cog):
         if additional_params is not None:
             params.update(additional_params)
 
-        async with self.http_session.get(url=f"{base}/{endpoint}?{urlencode(params)}") as resp:
+        async with self.http.get(url=f"{base}/{endpoint}?{urlencode(params)}") as resp:
             return await resp.json()
 
     def create_nasa_embed(self, title: str, description: str, image: str, footer: str | None = "") -> Embed:
@@ -1,15 +1,14 @@
-import json
-from pathlib import Path
 from random import choice
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-LINKS = json.loads(Path("bot/resources/fun/speedrun_links.json").read_text("utf8"))
+LINKS = resources.load("fun/speedrun_links.json")
 
 
 class Speedrun(commands.Cog):
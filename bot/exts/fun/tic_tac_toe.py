@@ -57,7 +57,9 @@ class Player:
             )
 
         try:
-            react, _ = await self.ctx.bot.wait_for("reaction_add", timeout=30.0, check=check_for_move)
+            react, _ = await self.ctx.bot.waiters.wait_for(
+                "reaction_add", message=msg.id, timeout=30.0, check=check_for_move
+            )
         except TimeoutError:
             return True, None
         else:
@@ -156,8 +158,9 @@ class Game:
             )
 
         try:
-            reaction, _ = await self.ctx.bot.wait_for(
+            reaction, _ = await self.ctx.bot.waiters.wait_for(
                 "reaction_add",
+                message=confirm_message.id,
                 timeout=60.0,
                 check=confirm_check
             )
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import operator
 import random
 import re
@@ -8,7 +7,6 @@ from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
 import discord
 from discord.ext import commands, tasks
@@ -17,6 +15,7 @@ from rapidfuzz import fuzz
 
 from bot.bot import Bot
 from bot.constants import Client, Colours, MODERATION_ROLES, NEGATIVE_REPLIES
+from bot.utils import resources
 
 logger = get_logger(__name__)
 
@@ -297,9 +296,7 @@ class TriviaQuiz(commands.Cog):
     @staticmethod
     def load_questions() -> dict:
         """Load the questions from the JSON file."""
-        p = Path("bot", "resources", "fun", "trivia_quiz.json")
-
-        return json.loads(p.read_text(encoding="utf-8"))
+        return resources.load("fun/trivia_quiz.json")
 
     @commands.group(name="quiz", aliases=("trivia", "triviaquiz"), invoke_without_command=True)
     async def quiz_game(self, ctx: commands.Context, category: str | None, questions: int | None) -> None:
@@ -435,7 +432,9 @@ class TriviaQuiz(commands.Cog):
                 return contains_correct_answer
 
             try:
-                msg = await self.bot.wait_for("message", check=check_func(quiz_entry.var_tol), timeout=10)
+                msg = await self.bot.waiters.wait_for(
+                    "message", channel=ctx.channel.id, check=check_func(quiz_entry.var_tol), timeout=10
+                )
             except TimeoutError:
                 # In case of TimeoutError and the game has been stopped, then do nothing.
                 if not self.game_status[ctx.channel.id]:
@@ -1,21 +1,19 @@
 import random
-from pathlib import Path
 
-import yaml
 from discord.ext.commands import Cog, Context, command
 
 from bot.bot import Bot
+from bot.utils import resources
 
 
 class WonderTwins(Cog):
     """Cog for a Wonder Twins inspired command."""
 
     def __init__(self):
-        with open(Path.cwd() / "bot" / "resources" / "fun" / "wonder_twins.yaml", encoding="utf-8") as f:
-            info = yaml.safe_load(f)
-            self.water_types = info["water_types"]
-            self.objects = info["objects"]
-            self.adjectives = info["adjectives"]
+        info = resources.load("fun/wonder_twins.yaml")
+        self.water_types = info["water_types"]
+        self.objects = info["objects"]
+        self.adjectives = info["adjectives"]
 
     @staticmethod
     def append_onto(phrase: str, insert_word: str) -> str:
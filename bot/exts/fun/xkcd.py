@@ -21,6 +21,9 @@ class XKCD(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.latest_comic_info: dict[str, str | int] = {}
+        # Published comics don't change, but the latest comic is revalidated on every request
+        self.bot.http_cache.register(BASE_URL, ttl=24 * 60 * 60, stale_ttl=7 * 24 * 60 * 60)
+        self.bot.http_cache.register(f"{BASE_URL}/info.0.json", ttl=0)
         self.get_latest_comic_info.start()
 
     def cog_unload(self) -> None:
@@ -30,7 +33,7 @@ class XKCD(Cog):
     @tasks.loop(minutes=30)
     async def get_latest_comic_info(self) -> None:
         """Refreshes latest comic's information ever 30 minutes. Also used for finding a random comic."""
-        async with self.bot.http_session.get(f"{BASE_URL}/info.0.json") as resp:
+        async with self.bot.http_cache.get(f"{BASE_URL}/info.0.json") as resp:
             if resp.status == 200:
                 self.latest_comic_info = await resp.json()
             else:
@@ -57,7 +60,7 @@ class XKCD(Cog):
         if comic == "latest":
             info = self.latest_comic_info
         else:
-            async with self.bot.http_session.get(f"{BASE_URL}/{comic}/info.0.json") as resp:
+            async with self.bot.http_cache.get(f"{BASE_URL}/{comic}/info.0.json") as resp:
                 if resp.status == 200:
                     info = await resp.json()
                 else:
@@ -1,13 +1,12 @@
-import json
-from pathlib import Path
 
 from discord import Embed
 from discord.ext import commands
 
 from bot.bot import Bot
+from bot.utils import resources
 from bot.utils.randomization import RandomCycle
 
-EMBED_DATA = RandomCycle(json.loads(Path("bot/resources/holidays/earth_day/save_the_planet.json").read_text("utf8")))
+EMBED_DATA = RandomCycle(resources.load("holidays/earth_day/save_the_planet.json"))
 
 
 class SaveThePlanet(commands.Cog):
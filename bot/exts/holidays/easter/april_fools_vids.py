@@ -1,15 +1,14 @@
 import random
-from json import loads
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-ALL_VIDS = loads(Path("bot/resources/holidays/easter/april_fools_vids.json").read_text("utf-8"))
+ALL_VIDS = resources.load("holidays/easter/april_fools_vids.json")
 
 
 class AprilFoolVideos(commands.Cog):
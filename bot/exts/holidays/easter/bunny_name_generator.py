@@ -1,16 +1,15 @@
-import json
 import random
 import re
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-BUNNY_NAMES = json.loads(Path("bot/resources/holidays/easter/bunny_names.json").read_text("utf8"))
+BUNNY_NAMES = resources.load("holidays/easter/bunny_names.json")
 
 
 class BunnyNameGenerator(commands.Cog):
@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-RIDDLE_QUESTIONS = loads(Path("bot/resources/holidays/easter/easter_riddle.json").read_text("utf8"))
+RIDDLE_QUESTIONS = resources.load("holidays/easter/easter_riddle.json")
 
 TIMELIMIT = 10
 
@@ -61,8 +60,9 @@ class EasterRiddle(commands.Cog):
         winner = None
         while hint_number < 3:
             try:
-                response = await self.bot.wait_for(
+                response = await self.bot.waiters.wait_for(
                     "message",
+                    channel=ctx.channel.id,
                     check=lambda m: m.channel == ctx.channel
                     and m.author != self.bot.user
                     and m.content.lower() == correct.lower(),
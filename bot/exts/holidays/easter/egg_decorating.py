@@ -1,22 +1,25 @@
-import json
+import functools
 import random
+from asyncio import to_thread
 from contextlib import suppress
 from io import BytesIO
 from pathlib import Path
 
 import discord
+import numpy as np
 from PIL import Image
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.utils import helpers
+from bot.utils import helpers, resources
+from bot.utils.images import ImageKind, encode_image
 
 log = get_logger(__name__)
 
-HTML_COLOURS = json.loads(Path("bot/resources/fun/html_colours.json").read_text("utf8"))
+HTML_COLOURS = resources.load("fun/html_colours.json")
 
-XKCD_COLOURS = json.loads(Path("bot/resources/fun/xkcd_colours.json").read_text("utf8"))
+XKCD_COLOURS = resources.load("fun/xkcd_colours.json")
 
 COLOURS = [
     (255, 0, 0, 255), (255, 128, 0, 255), (255, 255, 0, 255), (0, 255, 0, 255),
@@ -27,6 +30,48 @@ IRREPLACEABLE = [
     (0, 0, 0, 0), (0, 0, 0, 255)
 ]  # Colours that are meant to stay the same - Transparent and Black
 
+EGG_DESIGNS_DIRECTORY = Path("bot/resources/holidays/easter/easter_eggs")
+
+
+def _load_design(number: int) -> Image.Image:
+    """
+    Loads an egg design as a palette image.
+
+    The palette starts with the `IRREPLACEABLE` colours, followed by the colours of the design
+    that are to be replaced, in the order they appear in `COLOURS`.
+    """
+    with Image.open(EGG_DESIGNS_DIRECTORY / f"design{number}.png") as image:
+        pixels = np.asarray(image.convert("RGBA"))
+
+    design_colours = {tuple(map(int, colour)) for colour in np.unique(pixels.reshape(-1, 4), axis=0)}
+    replaceable = sorted(design_colours.difference(IRREPLACEABLE), key=COLOURS.index)
+
+    indices = np.zeros(pixels.shape[:2], dtype=np.uint8)
+    for index, colour in enumerate(IRREPLACEABLE + replaceable):
+        indices[(pixels == colour).all(axis=-1)] = index
+
+    design = Image.frombytes("P", (pixels.shape[1], pixels.shape[0]), indices.tobytes())
+    design.putpalette([channel for colour in IRREPLACEABLE + replaceable for channel in colour], rawmode="RGBA")
+    return design
+
+
+DESIGNS = {number: _load_design(number) for number in range(1, 7)}
+
+
+@functools.lru_cache(maxsize=64)
+def decorate_egg(design: int, colours: tuple[tuple[int, int, int], ...]) -> tuple[Image.Image, bytes]:
+    """
+    Decorates the given egg design with the given colours, returning the egg and its PNG encoding.
+
+    Decorating is just a swap of the design's palette. Results are cached, so the returned egg must not be modified.
+    """
+    egg = DESIGNS[design].copy()
+    # Any of the `COLOURS` the design doesn't use end up as unused palette entries
+    palette = IRREPLACEABLE + [(*colour, 255) for colour in colours]
+    egg.putpalette([channel for colour in palette for channel in colour], rawmode="RGBA")
+    egg = egg.convert("RGBA")
+    return egg, encode_image(egg, ImageKind.FLAT)
+
 
 class EggDecorating(commands.Cog):
     """Decorate some easter eggs!"""
@@ -79,29 +124,12 @@ class EggDecorating(commands.Cog):
                 q, r = divmod(8, colours_n)
                 colours = colours * q + colours[:r]
             num = random.randint(1, 6)
-            im = Image.open(Path(f"bot/resources/holidays/easter/easter_eggs/design{num}.png"))
-            data = list(im.getdata())
-
-            replaceable = {x for x in data if x not in IRREPLACEABLE}
-            replaceable = sorted(replaceable, key=COLOURS.index)
-
-            replacing_colours = {colour: colours[i] for i, colour in enumerate(replaceable)}
-            new_data = []
-            for x in data:
-                if x in replacing_colours:
-                    new_data.append((*replacing_colours[x].to_rgb(), 255))
-                    # Also ensures that the alpha channel has a value
-                else:
-                    new_data.append(x)
-            new_im = Image.new(im.mode, im.size)
-            new_im.putdata(new_data)
-
-            bufferedio = BytesIO()
-            new_im.save(bufferedio, format="PNG")
-
-            bufferedio.seek(0)
+            # The designs only use the 8 `COLOURS`, so any colours after them would never be seen
+            new_im, egg_bytes = await to_thread(
+                decorate_egg, num, tuple(colour.to_rgb() for colour in colours[:len(COLOURS)])
+            )
 
-            file = discord.File(bufferedio, filename="egg.png")  # Creates file to be used in embed
+            file = discord.File(BytesIO(egg_bytes), filename="egg.png")  # Creates file to be used in embed
             embed = discord.Embed(
                 title="Your Colourful Easter Egg",
                 description="Here is your pretty little egg. Hope you like it!"
@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,11 +6,12 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, Colours, Month
-from bot.utils.decorators import seasonal_task
+from bot.utils import resources
+from bot.utils.seasonal import seasonal_task
 
 log = get_logger(__name__)
 
-EGG_FACTS = loads(Path("bot/resources/holidays/easter/easter_egg_facts.json").read_text("utf8"))
+EGG_FACTS = resources.load("holidays/easter/easter_egg_facts.json")
 
 
 class EasterFacts(commands.Cog):
@@ -24,7 +23,6 @@ class EasterFacts(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.daily_fact_task = self.bot.loop.create_task(self.send_egg_fact_daily())
 
     @seasonal_task(Month.APRIL)
     async def send_egg_fact_daily(self) -> None:
@@ -1,7 +1,5 @@
 import asyncio
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,10 +7,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-EGGHEAD_QUESTIONS = loads(Path("bot/resources/holidays/easter/egghead_questions.json").read_text("utf8"))
+EGGHEAD_QUESTIONS = resources.load("holidays/easter/egghead_questions.json")
 
 
 EMOJIS = [
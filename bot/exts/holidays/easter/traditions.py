@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-traditions = json.loads(Path("bot/resources/holidays/easter/traditions.json").read_text("utf8"))
+traditions = resources.load("holidays/easter/traditions.json")
 
 
 class Traditions(commands.Cog):
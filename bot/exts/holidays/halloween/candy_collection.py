@@ -8,6 +8,7 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Month
 from bot.utils.decorators import in_month
+from bot.utils.message_router import message_handler
 
 log = get_logger(__name__)
 
@@ -43,20 +44,9 @@ class CandyCollection(commands.Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
-    @in_month(Month.OCTOBER)
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    @message_handler(guild_only=True, channels=(Channels.sir_lancebot_playground,), months=(Month.OCTOBER,))
+    async def add_random_reaction(self, message: discord.Message) -> None:
         """Randomly adds candy or skull reaction to non-bot messages in the Event channel."""
-        # Ignore messages in DMs
-        if not message.guild:
-            return
-        # make sure its a human message
-        if message.author.bot:
-            return
-        # ensure it's hacktober channel
-        if message.channel.id != Channels.sir_lancebot_playground:
-            return
-
         # do random check for skull first as it has the lower chance
         if random.randint(1, ADD_SKULL_REACTION_CHANCE) == 1:
             await self.skull_messages.set(message.id, "skull")
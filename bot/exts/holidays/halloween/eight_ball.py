@@ -1,16 +1,15 @@
 import asyncio
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-RESPONSES = json.loads(Path("bot/resources/holidays/halloween/responses.json").read_text("utf8"))
+RESPONSES = resources.load("holidays/halloween/responses.json")
 
 
 class SpookyEightBall(commands.Cog):
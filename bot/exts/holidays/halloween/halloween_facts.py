@@ -1,13 +1,12 @@
-import json
 import random
 from datetime import timedelta
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
@@ -24,7 +23,7 @@ SPOOKY_EMOJIS = [
 PUMPKIN_ORANGE = 0xFF7518
 INTERVAL = timedelta(hours=6).total_seconds()
 
-FACTS = json.loads(Path("bot/resources/holidays/halloween/halloween_facts.json").read_text("utf8"))
+FACTS = resources.load("holidays/halloween/halloween_facts.json")
 FACTS = list(enumerate(FACTS))
 
 
@@ -1,5 +1,3 @@
-from json import loads
-from pathlib import Path
 from random import choice
 
 import discord
@@ -9,10 +7,11 @@ from discord.ext.commands import BucketType
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-HALLOWEENIFY_DATA = loads(Path("bot/resources/holidays/halloween/halloweenify.json").read_text("utf8"))
+HALLOWEENIFY_DATA = resources.load("holidays/halloween/halloweenify.json")
 
 
 class Halloweenify(commands.Cog):
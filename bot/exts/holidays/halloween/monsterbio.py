@@ -1,6 +1,4 @@
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,12 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-TEXT_OPTIONS = json.loads(
-    Path("bot/resources/holidays/halloween/monster.json").read_text("utf8")
-)  # Data for a mad-lib style generation of text
+TEXT_OPTIONS = resources.load("holidays/halloween/monster.json")  # Data for a mad-lib style generation of text
 
 
 class MonsterBio(commands.Cog):
@@ -9,12 +9,15 @@ from bot.constants import Colours, NEGATIVE_REPLIES, Tokens
 
 log = get_logger(__name__)
 
+TMDB_API = "https://api.themoviedb.org/3/"
+
 
 class ScaryMovie(commands.Cog):
     """Selects a random scary movie and embeds info into Discord chat."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.bot.http_cache.register(TMDB_API, ttl=60 * 60, stale_ttl=24 * 60 * 60)
 
     @commands.command(name="scarymovie", alias=["smovie"])
     async def random_movie(self, ctx: commands.Context) -> None:
@@ -34,7 +37,7 @@ class ScaryMovie(commands.Cog):
 
     async def select_movie(self) -> dict:
         """Selects a random movie and returns a JSON of movie details from TMDb."""
-        url = "https://api.themoviedb.org/3/discover/movie"
+        url = f"{TMDB_API}discover/movie"
         params = {
             "api_key": Tokens.tmdb.get_secret_value(),
             "with_genres": "27",
@@ -46,13 +49,13 @@ class ScaryMovie(commands.Cog):
         }
 
         # Get total page count of horror movies
-        async with self.bot.http_session.get(url=url, params=params, headers=headers) as response:
+        async with self.bot.http_cache.get(url=url, params=params, headers=headers) as response:
             data = await response.json()
             total_pages = data.get("total_pages")
 
         # Get movie details from one random result on a random page
         params["page"] = random.randint(1, min(total_pages, 500))
-        async with self.bot.http_session.get(url=url, params=params, headers=headers) as response:
+        async with self.bot.http_cache.get(url=url, params=params, headers=headers) as response:
             data = await response.json()
             if (results := data.get("results")) is None:
                 log.warning("Failed to select a movie - data returned from API has no 'results' key")
@@ -63,8 +66,8 @@ class ScaryMovie(commands.Cog):
                 return {}
 
         # Get full details and credits
-        async with self.bot.http_session.get(
-            url=f"https://api.themoviedb.org/3/movie/{selection_id}",
+        async with self.bot.http_cache.get(
+            url=f"{TMDB_API}movie/{selection_id}",
             params={"api_key": Tokens.tmdb.get_secret_value(), "append_to_response": "credits"}
         ) as selection:
 
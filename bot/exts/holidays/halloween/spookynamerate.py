@@ -4,7 +4,6 @@ import random
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from os import getenv
-from pathlib import Path
 
 from async_rediscache import RedisCache
 from discord import Embed, Reaction, TextChannel, User
@@ -15,6 +14,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, Client, Colours, Month
+from bot.utils import resolve_current_month, resources
 from bot.utils.decorators import InMonthCheckFailure
 
 logger = get_logger(__name__)
@@ -65,7 +65,7 @@ HELP_MESSAGE_DICT = {
 }
 
 # The names are from https://www.mockaroo.com/
-NAMES = json.loads(Path("bot/resources/holidays/halloween/spookynamerate_names.json").read_text("utf8"))
+NAMES = resources.load("holidays/halloween/spookynamerate_names.json")
 FIRST_NAMES = NAMES["first_names"]
 LAST_NAMES = NAMES["last_names"]
 
@@ -363,9 +363,7 @@ class SpookyNameRate(Cog):
         if SpookyNameRate.debug:
             return True
 
-        if not Client.month_override:
-            return datetime.now(tz=UTC).month == Month.OCTOBER
-        return Client.month_override == Month.OCTOBER
+        return resolve_current_month() == Month.OCTOBER
 
     def cog_check(self, ctx: Context) -> bool:
         """A command to check whether the command is being called in October."""
@@ -1,7 +1,5 @@
 import bisect
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,12 +7,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-data: dict[str, dict[str, str]] = json.loads(
-    Path("bot/resources/holidays/halloween/spooky_rating.json").read_text("utf8")
-)
+data: dict[str, dict[str, str]] = resources.load("holidays/halloween/spooky_rating.json")
 SPOOKY_DATA = sorted((int(key), value) for key, value in data.items())
 
 
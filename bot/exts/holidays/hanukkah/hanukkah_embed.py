@@ -21,6 +21,7 @@ class HanukkahEmbed(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.bot.http_cache.register(HEBCAL_URL, ttl=24 * 60 * 60, stale_ttl=7 * 24 * 60 * 60)
         self.hanukkah_dates: list[date] = []
 
     def _parse_time_to_datetime(self, date: list[str]) -> datetime:
@@ -36,7 +37,7 @@ class HanukkahEmbed(commands.Cog):
         """Gets the dates for hanukkah festival."""
         # clear the datetime objects to prevent a memory link
         self.hanukkah_dates = []
-        async with self.bot.http_session.get(HEBCAL_URL) as response:
+        async with self.bot.http_cache.get(HEBCAL_URL) as response:
             json_data = await response.json()
         festivals = json_data["items"]
         for festival in festivals:
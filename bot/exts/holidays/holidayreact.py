@@ -1,3 +1,4 @@
+import asyncio
 import random
 import re
 from typing import NamedTuple
@@ -7,9 +8,9 @@ from discord.ext.commands import Cog
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.constants import Month
+from bot.constants import Client, Month
 from bot.utils import resolve_current_month
-from bot.utils.decorators import in_month
+from bot.utils.message_router import message_handler
 
 log = get_logger(__name__)
 
@@ -99,62 +100,64 @@ MONTHS_TO_REACT = {
 }
 
 
+class TriggerMatcher(NamedTuple):
+    """A single pattern matching any of a month's triggers, with a named group for each trigger."""
+
+    pattern: re.Pattern
+    triggers: dict[str, tuple[str, Trigger]]
+
+
+def compile_matcher(triggers: list[tuple[str, Trigger]]) -> TriggerMatcher:
+    """Compile the named triggers into one alternation, so a message is only searched once."""
+    groups = {f"trigger{index}": named_trigger for index, named_trigger in enumerate(triggers)}
+    pattern = "|".join(f"(?P<{group}>{trigger.regex})" for group, (_, trigger) in groups.items())
+    return TriggerMatcher(re.compile(pattern, re.IGNORECASE), groups)
+
+
+MATCHERS = {
+    month: compile_matcher([
+        named_trigger
+        for holiday in HOLIDAYS_TO_REACT if month in holiday.months
+        for named_trigger in holiday.triggers.items()
+    ])
+    for month in MONTHS_TO_REACT
+}
+# Matches a trigger of any month, so messages without one are filtered out before the handler runs
+ANY_TRIGGER = compile_matcher([
+    named_trigger for holiday in HOLIDAYS_TO_REACT for named_trigger in holiday.triggers.items()
+]).pattern
+
+
 class HolidayReact(Cog):
     """A cog that makes the bot react to message triggers."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
 
-    @in_month(*MONTHS_TO_REACT)
-    @Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
-        """Triggered when the bot sees a message in a holiday month."""
-        # Check message for bot replies and/or command invocations
-        # Short circuit if they're found, logging is handled in _short_circuit_check
-        if await self._short_circuit_check(message):
+    @message_handler(months=MONTHS_TO_REACT, pattern=ANY_TRIGGER)
+    async def react_to_triggers(self, message: discord.Message) -> None:
+        """Triggered when the bot sees a message with a trigger in a holiday month."""
+        matcher = MATCHERS.get(resolve_current_month())
+        if matcher is None:
             return
 
-        for holiday in HOLIDAYS_TO_REACT:
-            await self._check_message(message, holiday)
-
-    async def _check_message(self, message: discord.Message, holiday: Holiday) -> None:
-        """
-        Check if message is reactable.
-
-        React to message if:
-          * month is valid
-          * message contains reaction regex triggers
-        """
-        if resolve_current_month() not in holiday.months:
+        if self._is_command_invocation(message):
+            log.debug(f"Ignoring reactions on command invocation. Message ID: {message.id}")
             return
 
-        for name, trigger in holiday.triggers.items():
-            trigger_test = re.search(trigger.regex, message.content, flags=re.IGNORECASE)
-            if trigger_test:
-                await message.add_reaction(random.choice(trigger.reaction))
-                log.info(f"Added {name!r} reaction to message ID: {message.id}")
-
-    async def _short_circuit_check(self, message: discord.Message) -> bool:
-        """
-        Short-circuit helper check.
-
-        Return True if:
-          * author is a bot
-          * prefix is not None
-        """
-        # Check if message author is a bot
-        if message.author.bot:
-            log.debug(f"Ignoring reactions on bot message. Message ID: {message.id}")
-            return True
-
-        # Check for command invocation
-        # Because on_message doesn't give a full Context object, generate one first
-        ctx = await self.bot.get_context(message)
-        if ctx.prefix:
-            log.debug(f"Ignoring reactions on command invocation. Message ID: {message.id}")
-            return True
+        triggered = {match.lastgroup for match in matcher.pattern.finditer(message.content)}
+        await asyncio.gather(*(self._react(message, *matcher.triggers[group]) for group in triggered))
+
+    @staticmethod
+    async def _react(message: discord.Message, name: str, trigger: Trigger) -> None:
+        """React to the message with one of the trigger's reactions."""
+        await message.add_reaction(random.choice(trigger.reaction))
+        log.info(f"Added {name!r} reaction to message ID: {message.id}")
 
-        return False
+    def _is_command_invocation(self, message: discord.Message) -> bool:
+        """Return whether the message starts with one of the bot's prefixes, without building a context."""
+        prefixes = (Client.prefix, f"<@{self.bot.user.id}> ", f"<@!{self.bot.user.id}> ")
+        return message.content.startswith(prefixes)
 
 
 async def setup(bot: Bot) -> None:
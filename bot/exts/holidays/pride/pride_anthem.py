@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-VIDEOS = json.loads(Path("bot/resources/holidays/pride/anthems.json").read_text("utf8"))
+VIDEOS = resources.load("holidays/pride/anthems.json")
 
 
 class PrideAnthem(commands.Cog):
@@ -1,7 +1,5 @@
-import json
 import random
 from datetime import UTC, datetime
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,11 +7,12 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, Colours, Month
-from bot.utils.decorators import seasonal_task
+from bot.utils import resources
+from bot.utils.seasonal import seasonal_task
 
 log = get_logger(__name__)
 
-FACTS = json.loads(Path("bot/resources/holidays/pride/facts.json").read_text("utf8"))
+FACTS = resources.load("holidays/pride/facts.json")
 
 
 class PrideFacts(commands.Cog):
@@ -21,7 +20,6 @@ class PrideFacts(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.daily_fact_task = self.bot.loop.create_task(self.send_pride_fact_daily())
 
     @seasonal_task(Month.JUNE)
     async def send_pride_fact_daily(self) -> None:
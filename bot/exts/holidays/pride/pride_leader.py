@@ -1,6 +1,4 @@
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,10 +7,11 @@ from rapidfuzz import fuzz
 
 from bot import constants
 from bot.bot import Bot
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-PRIDE_RESOURCE = json.loads(Path("bot/resources/holidays/pride/prideleader.json").read_text("utf8"))
+PRIDE_RESOURCE = resources.load("holidays/pride/prideleader.json")
 MINIMUM_FUZZ_RATIO = 40
 
 
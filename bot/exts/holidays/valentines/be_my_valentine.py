@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,6 +6,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, Colours, Month, PYTHON_PREFIX, Roles
+from bot.utils import resources
 from bot.utils.decorators import in_month
 from bot.utils.exceptions import MovedCommandError
 
@@ -28,8 +27,7 @@ class BeMyValentine(commands.Cog):
     @staticmethod
     def load_json() -> dict:
         """Load Valentines messages from the static resources."""
-        p = Path("bot/resources/holidays/valentines/bemyvalentine_valentines.json")
-        return loads(p.read_text("utf8"))
+        return resources.load("holidays/valentines/bemyvalentine_valentines.json")
 
     @in_month(Month.FEBRUARY)
     @commands.command(name="lovefest", help=f"NOTE: This command has been moved to {MOVED_COMMAND}")
@@ -1,9 +1,7 @@
 import bisect
 import hashlib
-import json
 import random
 from collections.abc import Coroutine
-from pathlib import Path
 
 import discord
 from discord import Member
@@ -13,11 +11,12 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, Month, PYTHON_PREFIX, Roles
+from bot.utils import resources
 from bot.utils.decorators import in_month
 
 log = get_logger(__name__)
 
-LOVE_DATA = json.loads(Path("bot/resources/holidays/valentines/love_matches.json").read_text("utf8"))
+LOVE_DATA = resources.load("holidays/valentines/love_matches.json")
 LOVE_DATA = sorted((int(key), value) for key, value in LOVE_DATA.items())
 
 
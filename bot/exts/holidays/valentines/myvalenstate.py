@@ -1,6 +1,4 @@
 import collections
-import json
-from pathlib import Path
 from random import choice
 
 import discord
@@ -9,10 +7,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-STATES = json.loads(Path("bot/resources/holidays/valentines/valenstates.json").read_text("utf8"))
+STATES = resources.load("holidays/valentines/valenstates.json")
 
 
 class MyValenstate(commands.Cog):
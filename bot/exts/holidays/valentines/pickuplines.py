@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-PICKUP_LINES = loads(Path("bot/resources/holidays/valentines/pickup_lines.json").read_text("utf8"))
+PICKUP_LINES = resources.load("holidays/valentines/pickup_lines.json")
 
 
 class PickupLine(commands.Cog):
@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,12 +6,13 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
 HEART_EMOJIS = [":heart:", ":gift_heart:", ":revolving_hearts:", ":sparkling_heart:", ":two_hearts:"]
 
-VALENTINES_DATES = loads(Path("bot/resources/holidays/valentines/date_ideas.json").read_text("utf8"))
+VALENTINES_DATES = resources.load("holidays/valentines/date_ideas.json")
 
 
 class SaveTheDate(commands.Cog):
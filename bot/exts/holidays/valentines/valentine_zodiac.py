@@ -1,8 +1,6 @@
 import calendar
-import json
 import random
 from datetime import UTC, datetime
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -10,6 +8,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
@@ -26,16 +25,13 @@ class ValentineZodiac(commands.Cog):
     @staticmethod
     def load_comp_json() -> tuple[dict, dict]:
         """Load zodiac compatibility from static JSON resource."""
-        explanation_file = Path("bot/resources/holidays/valentines/zodiac_explanation.json")
-        compatibility_file = Path("bot/resources/holidays/valentines/zodiac_compatibility.json")
-
-        zodiac_fact = json.loads(explanation_file.read_text("utf8"))
+        zodiac_fact = resources.load("holidays/valentines/zodiac_explanation.json")
 
         for zodiac_data in zodiac_fact.values():
             zodiac_data["start_at"] = datetime.fromisoformat(zodiac_data["start_at"])
             zodiac_data["end_at"] = datetime.fromisoformat(zodiac_data["end_at"])
 
-        zodiacs = json.loads(compatibility_file.read_text("utf8"))
+        zodiacs = resources.load("holidays/valentines/zodiac_compatibility.json")
 
         return zodiacs, zodiac_fact
 
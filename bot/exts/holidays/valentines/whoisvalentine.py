@@ -1,5 +1,3 @@
-import json
-from pathlib import Path
 from random import choice
 
 import discord
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils import resources
 
 log = get_logger(__name__)
 
-FACTS = json.loads(Path("bot/resources/holidays/valentines/valentine_facts.json").read_text("utf8"))
+FACTS = resources.load("holidays/valentines/valentine_facts.json")
 
 
 class ValentineFacts(commands.Cog):
@@ -1,9 +1,6 @@
 import colorsys
-import json
-import pathlib
 import random
 import string
-from io import BytesIO
 
 import discord
 import rapidfuzz
@@ -12,7 +9,9 @@ from discord.ext import commands
 
 from bot import constants
 from bot.bot import Bot
+from bot.utils import resources
 from bot.utils.decorators import whitelist_override
+from bot.utils.images import ImageKind, image_file
 
 THUMBNAIL_SIZE = (80, 80)
 
@@ -22,9 +21,8 @@ class Colour(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        with open(pathlib.Path("bot/resources/utilities/ryanzec_colours.json")) as f:
-            self.colour_mapping = json.load(f)
-            del self.colour_mapping["_"]  # Delete source credit entry
+        self.colour_mapping = resources.load("utilities/ryanzec_colours.json")
+        del self.colour_mapping["_"]  # Delete source credit entry
 
     async def send_colour_response(self, ctx: commands.Context, rgb: tuple[int, int, int]) -> None:
         """Create and send embed from user given colour information."""
@@ -67,13 +65,9 @@ class Colour(commands.Cog):
                 inline=True
             )
 
-        thumbnail = Image.new("RGB", THUMBNAIL_SIZE, color=rgb)
-        buffer = BytesIO()
-        thumbnail.save(buffer, "PNG")
-        buffer.seek(0)
-        thumbnail_file = discord.File(buffer, filename="colour.png")
+        thumbnail_file = self.create_thumbnail(rgb)
 
-        colour_embed.set_thumbnail(url="attachment://colour.png")
+        colour_embed.set_thumbnail(url=f"attachment://{thumbnail_file.filename}")
 
         await ctx.send(file=thumbnail_file, embed=colour_embed)
 
@@ -182,6 +176,12 @@ class Colour(commands.Cog):
         hex_tuple = ImageColor.getrgb(f"#{hex_colour}")
         await self.send_colour_response(ctx, hex_tuple)
 
+    @staticmethod
+    def create_thumbnail(rgb: tuple[int, int, int]) -> discord.File:
+        """Create a thumbnail filled with the colour."""
+        thumbnail = Image.new("RGB", THUMBNAIL_SIZE, color=rgb)
+        return image_file(thumbnail, ImageKind.THUMBNAIL, "colour")
+
     def get_colour_conversions(self, rgb: tuple[int, int, int]) -> dict[str, tuple[int, ...] | str]:
         """Create a dictionary mapping of colour types and their values."""
         colour_name = self._rgb_to_name(rgb)
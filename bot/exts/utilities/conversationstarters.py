@@ -1,30 +1,27 @@
 from contextlib import suppress
 from functools import partial
-from pathlib import Path
 
 import discord
-import yaml
 from discord.ext import commands
 
 from bot.bot import Bot
 from bot.constants import MODERATION_ROLES, WHITELISTED_CHANNELS
+from bot.utils import resources
 from bot.utils.decorators import whitelist_override
 from bot.utils.randomization import RandomCycle
 
 SUGGESTION_FORM = "https://forms.gle/zw6kkJqv8U43Nfjg9"
 
-with Path("bot/resources/utilities/starter.yaml").open("r", encoding="utf8") as f:
-    STARTERS = yaml.safe_load(f)
+STARTERS = resources.load("utilities/starter.yaml")
 
-with Path("bot/resources/utilities/py_topics.yaml").open("r", encoding="utf8") as f:
-    # First ID is #python-general and the rest are top to bottom categories of Topical Chat/Help.
-    PY_TOPICS = yaml.safe_load(f)
+# First ID is #python-general and the rest are top to bottom categories of Topical Chat/Help.
+PY_TOPICS = resources.load("utilities/py_topics.yaml")
 
-    # Removing `None` from lists of topics, if not a list, it is changed to an empty one.
-    PY_TOPICS = {k: [i for i in v if i] if isinstance(v, list) else [] for k, v in PY_TOPICS.items()}
+# Removing `None` from lists of topics, if not a list, it is changed to an empty one.
+PY_TOPICS = {k: [i for i in v if i] if isinstance(v, list) else [] for k, v in PY_TOPICS.items()}
 
-    # All the allowed channels that the ".topic" command is allowed to be executed in.
-    ALL_ALLOWED_CHANNELS = list(PY_TOPICS.keys()) + list(WHITELISTED_CHANNELS)
+# All the allowed channels that the ".topic" command is allowed to be executed in.
+ALL_ALLOWED_CHANNELS = list(PY_TOPICS.keys()) + list(WHITELISTED_CHANNELS)
 
 # Putting all topics into one dictionary and shuffling lists to reduce same-topic repetitions.
 ALL_TOPICS = {"default": STARTERS, **PY_TOPICS}
@@ -88,8 +85,9 @@ class ConvoStarters(commands.Cog):
         await message.add_reaction("🔄")
         while True:
             try:
-                reaction, user = await self.bot.wait_for(
+                reaction, user = await self.bot.waiters.wait_for(
                     "reaction_add",
+                    message=message.id,
                     check=partial(self._predicate, command_invoker, message),
                     timeout=60.0
                 )
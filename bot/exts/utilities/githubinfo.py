@@ -1,3 +1,4 @@
+import asyncio
 import random
 import re
 from dataclasses import dataclass
@@ -5,28 +6,23 @@ from datetime import UTC, datetime
 from urllib.parse import quote
 
 import discord
-from aiohttp import ClientResponse
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.constants import Colours, ERROR_REPLIES, Emojis, NEGATIVE_REPLIES, Tokens
+from bot.constants import Colours, ERROR_REPLIES, Emojis, GitHub, NEGATIVE_REPLIES, Tokens
+from bot.utils.exceptions import GitHubRateLimitError
+from bot.utils.http_cache import CachedResponse
+from bot.utils.message_router import message_handler
 
 log = get_logger(__name__)
 
 GITHUB_API_URL = "https://api.github.com"
 
-REQUEST_HEADERS = {
-    "Accept": "application/vnd.github.v3+json"
-}
-
 REPOSITORY_ENDPOINT = "https://api.github.com/orgs/{org}/repos?per_page=100&type=public"
 ISSUE_ENDPOINT = "https://api.github.com/repos/{user}/{repository}/issues/{number}"
 PR_ENDPOINT = "https://api.github.com/repos/{user}/{repository}/pulls/{number}"
 
-if Tokens.github:
-    REQUEST_HEADERS["Authorization"] = f"token {Tokens.github.get_secret_value()}"
-
 CODE_BLOCK_RE = re.compile(
     r"^`([^`\n]+)`"   # Inline codeblock
     r"|```(.+?)```",  # Multiline codeblock
@@ -35,6 +31,15 @@ CODE_BLOCK_RE = re.compile(
 
 # Maximum number of issues in one message
 MAXIMUM_ISSUES = 5
+# How many of the issues in one message are fetched at the same time
+ISSUE_FETCH_CONCURRENCY = 3
+
+# The fields of an issue or pull request a GraphQL query asks for
+GRAPHQL_ISSUE_FIELDS = """
+    __typename
+    ... on Issue { title url state stateReason }
+    ... on PullRequest { title url state isDraft merged }
+"""
 
 # Regex used when looking for automatic linking in messages
 # regex101 of current regex https://regex101.com/r/V2ji8M/6
@@ -87,7 +92,9 @@ class GithubInfo(commands.Cog):
         self,
         number: int,
         repository: str,
-        user: str
+        user: str,
+        *,
+        background: bool = False
     ) -> IssueState | FetchError:
         """
         Retrieve an issue from a GitHub repository.
@@ -97,7 +104,7 @@ class GithubInfo(commands.Cog):
         url = ISSUE_ENDPOINT.format(user=user, repository=repository, number=number)
         pulls_url = PR_ENDPOINT.format(user=user, repository=repository, number=number)
 
-        json_data, r = await self.fetch_data(url)
+        json_data, r = await self.fetch_data(url, background=background)
 
         if r.status == 403:
             if r.headers.get("X-RateLimit-Remaining") == "0":
@@ -124,7 +131,7 @@ class GithubInfo(commands.Cog):
         # we know that a PR has been requested and a call to the pulls API endpoint is necessary
         # to get the desired information for the PR.
         else:
-            pull_data, _ = await self.fetch_data(pulls_url)
+            pull_data, _ = await self.fetch_data(pulls_url, background=background)
             if pull_data["draft"]:
                 emoji = Emojis.pull_request_draft
             elif pull_data["state"] == "open":
@@ -139,6 +146,93 @@ class GithubInfo(commands.Cog):
 
         return IssueState(repository, number, issue_url, json_data.get("title", ""), emoji)
 
+    async def fetch_issues(
+        self, issues: list[FoundIssue], *, background: bool = False
+    ) -> list[IssueState | FetchError]:
+        """
+        Retrieve every issue, in the same order.
+
+        With GraphQL batching enabled, they're fetched in a single query. Otherwise, or if the query fails,
+        they're fetched concurrently from the REST API, a few at a time.
+
+        Issues fetched in the background aren't fetched while the rate limit budget is kept for commands.
+        """
+        if (
+            GitHub.graphql_batching
+            and Tokens.github
+            and (results := await self.fetch_issues_graphql(issues, background=background))
+        ):
+            return results
+
+        semaphore = asyncio.Semaphore(ISSUE_FETCH_CONCURRENCY)
+
+        async def fetch(issue: FoundIssue) -> IssueState | FetchError:
+            async with semaphore:
+                try:
+                    return await self.fetch_issue(
+                        int(issue.number), issue.repository, issue.organisation or "python-discord",
+                        background=background
+                    )
+                except GitHubRateLimitError:
+                    return FetchError(403, "Ratelimit reached, please retry in a few minutes.")
+
+        return await asyncio.gather(*(fetch(issue) for issue in issues))
+
+    async def fetch_issues_graphql(
+        self, issues: list[FoundIssue], *, background: bool = False
+    ) -> list[IssueState | FetchError] | None:
+        """Retrieve every issue with a single GraphQL query, returning None if the query fails."""
+        selections = []
+        variables = {}
+        for i, issue in enumerate(issues):
+            selections.append(
+                f"i{i}: repository(owner: $owner{i}, name: $name{i}) "
+                f"{{ issueOrPullRequest(number: $number{i}) {{ {GRAPHQL_ISSUE_FIELDS} }} }}"
+            )
+            variables |= {
+                f"owner{i}": issue.organisation or "python-discord",
+                f"name{i}": issue.repository,
+                f"number{i}": int(issue.number),
+            }
+        parameters = ", ".join(f"$owner{i}: String!, $name{i}: String!, $number{i}: Int!" for i in range(len(issues)))
+        query = f"query({parameters}) {{ {' '.join(selections)} }}"
+
+        log.trace(f"Querying GH GraphQL API for {len(issues)} issues.")
+        try:
+            data = await self.bot.github.graphql(query, variables, background=background)
+        except GitHubRateLimitError:
+            log.info("GraphQL rate limit budget is kept for commands, falling back to the REST API.")
+            return None
+        # Issues that can't be found are null in the data, but the whole query failed if there's no data
+        if data is None:
+            log.info("GraphQL query for issues returned no data, falling back to the REST API.")
+            return None
+
+        results = []
+        for i, issue in enumerate(issues):
+            node = (data.get(f"i{i}") or {}).get("issueOrPullRequest")
+            if node is None:
+                results.append(FetchError(404, "Issue not found."))
+                continue
+
+            if node["__typename"] == "Issue":
+                emoji = Emojis.issue_open
+                if node["state"] == "CLOSED":
+                    emoji = Emojis.issue_completed
+                if node["stateReason"] == "NOT_PLANNED":
+                    emoji = Emojis.issue_not_planned
+            elif node["isDraft"]:
+                emoji = Emojis.pull_request_draft
+            elif node["state"] == "OPEN":
+                emoji = Emojis.pull_request_open
+            elif node["merged"]:
+                emoji = Emojis.pull_request_merged
+            else:
+                emoji = Emojis.pull_request_closed
+
+            results.append(IssueState(issue.repository, int(issue.number), node["url"], node["title"], emoji))
+        return results
+
     @staticmethod
     def format_embed(
         results: list[IssueState | FetchError]
@@ -169,17 +263,13 @@ class GithubInfo(commands.Cog):
         if ctx.invoked_subcommand is None:
             await self.bot.invoke_help_command(ctx)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    @message_handler(guild_only=True, pattern=AUTOMATIC_REGEX)
+    async def auto_link_issues(self, message: discord.Message) -> None:
         """
         Automatic issue linking.
 
-        Listener to retrieve issue(s) from a GitHub repository using automatic linking if matching <org>/<repo>#<issue>.
+        Handler to retrieve issue(s) from a GitHub repository using automatic linking if matching <org>/<repo>#<issue>.
         """
-        # Ignore bots
-        if message.author.bot:
-            return
-
         issues = [
             FoundIssue(*match.group("org", "repo", "number"))
             for match in AUTOMATIC_REGEX.finditer(self.remove_codeblocks(message.content))
@@ -187,10 +277,6 @@ class GithubInfo(commands.Cog):
         links = []
 
         if issues:
-            # Block this from working in DMs
-            if not message.guild:
-                return
-
             log.trace(f"Found {issues = }")
             # Remove duplicates
             issues = list(dict.fromkeys(issues))
@@ -204,14 +290,9 @@ class GithubInfo(commands.Cog):
                 await message.channel.send(embed=embed, delete_after=5)
                 return
 
-            for repo_issue in issues:
-                result = await self.fetch_issue(
-                    int(repo_issue.number),
-                    repo_issue.repository,
-                    repo_issue.organisation or "python-discord"
-                )
-                if isinstance(result, IssueState):
-                    links.append(result)
+            links = [
+                result for result in await self.fetch_issues(issues, background=True) if isinstance(result, IssueState)
+            ]
 
         if not links:
             return
@@ -219,11 +300,11 @@ class GithubInfo(commands.Cog):
         resp = self.format_embed(links)
         await message.channel.send(embed=resp)
 
-    async def fetch_data(self, url: str) -> tuple[dict[str], ClientResponse]:
+    async def fetch_data(self, url: str, *, background: bool = False) -> tuple[dict[str], CachedResponse]:
         """Retrieve data as a dictionary and the response in a tuple."""
         log.trace(f"Querying GH issues API: {url}")
-        async with self.bot.http_session.get(url, headers=REQUEST_HEADERS) as r:
-            return await r.json(), r
+        r = await self.bot.github.get(url, background=background)
+        return await r.json(), r
 
     @github_group.command(name="user", aliases=("userinfo",))
     async def github_user_info(self, ctx: commands.Context, username: str) -> None:
@@ -27,6 +27,7 @@ class RealPython(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.bot.http_cache.register(API_ROOT, ttl=60 * 60, stale_ttl=24 * 60 * 60)
 
     @commands.command(aliases=["rp"])
     @commands.cooldown(1, 10, commands.cooldowns.BucketType.user)
@@ -56,7 +57,7 @@ class RealPython(commands.Cog):
             return
 
         params = {"q": user_search, "limit": amount, "kind": "article"}
-        async with self.bot.http_session.get(url=API_ROOT, params=params) as response:
+        async with self.bot.http_cache.get(url=API_ROOT, params=params) as response:
             if response.status != 200:
                 logger.error(
                     f"Unexpected status code {response.status} from Real Python"
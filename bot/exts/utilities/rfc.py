@@ -11,7 +11,10 @@ from bot.utils.decorators import whitelist_override
 
 logger = get_logger(__name__)
 
-API_URL = "https://datatracker.ietf.org/doc/rfc{rfc_id}/doc.json"
+API_ROOT = "https://datatracker.ietf.org/doc/"
+API_URL = API_ROOT + "rfc{rfc_id}/doc.json"
+# Published RFCs don't change, so their documents are cached for a long time
+CACHE_TTL = 7 * 24 * 60 * 60
 DOCUMENT_URL = "https://datatracker.ietf.org/doc/rfc{rfc_id}"
 
 
@@ -29,14 +32,11 @@ class Rfc(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.cache: dict[int, RfcDocument] = {}
+        self.bot.http_cache.register(API_ROOT, ttl=CACHE_TTL, stale_ttl=4 * CACHE_TTL)
 
     async def retrieve_data(self, rfc_id: int) -> RfcDocument | None:
-        """Retrieves the RFC from the cache or API, and adds to the cache if it does not exist."""
-        if rfc_id in self.cache:
-            return self.cache[rfc_id]
-
-        async with self.bot.http_session.get(API_URL.format(rfc_id=rfc_id)) as resp:
+        """Retrieves the RFC through the bot's HTTP cache."""
+        async with self.bot.http_cache.get(API_URL.format(rfc_id=rfc_id)) as resp:
             if resp.status != 200:
                 return None
 
@@ -49,17 +49,13 @@ class Rfc(commands.Cog):
         raw_date = data["rev_history"][0]["published"]
         creation_date = datetime.datetime.strptime(raw_date, "%Y-%m-%dT%H:%M:%S%z")
 
-        document = RfcDocument(
+        return RfcDocument(
             title=data["title"],
             description=description,
             revisions=revisions,
             created=creation_date,
         )
 
-        self.cache[rfc_id] = document
-
-        return document
-
     @commands.cooldown(1, 5, commands.BucketType.user)
     @commands.command()
     @commands.guild_only()
@@ -32,13 +32,14 @@ class Stackoverflow(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.bot.http_cache.register(BASE_URL, ttl=10 * 60, stale_ttl=60 * 60)
 
     @commands.command(aliases=["so"])
     @commands.cooldown(1, 15, commands.cooldowns.BucketType.user)
     async def stackoverflow(self, ctx: commands.Context, *, search_query: str) -> None:
         """Sends the top 5 results of a search query from stackoverflow."""
         params = SO_PARAMS | {"q": search_query}
-        async with self.bot.http_session.get(url=BASE_URL, params=params) as response:
+        async with self.bot.http_cache.get(url=BASE_URL, params=params) as response:
             if response.status == 200:
                 data = await response.json()
             else:
@@ -41,11 +41,12 @@ class WikipediaSearch(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.bot.http_cache.register(SEARCH_API, ttl=60 * 60, stale_ttl=24 * 60 * 60)
 
     async def wiki_request(self, channel: TextChannel, search: str) -> list[str]:
         """Search wikipedia search string and return formatted first 10 pages found."""
         params = WIKI_PARAMS | {"srlimit": 10, "srsearch": search}
-        async with self.bot.http_session.get(url=SEARCH_API, params=params) as resp:
+        async with self.bot.http_cache.get(url=SEARCH_API, params=params) as resp:
             if resp.status != 200:
                 log.info(f"Unexpected response `{resp.status}` while searching wikipedia for `{search}`")
                 raise APIError("Wikipedia API", resp.status)
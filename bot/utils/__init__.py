@@ -3,7 +3,7 @@ import contextlib
 import re
 import string
 from collections.abc import Iterable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import discord
 from discord.ext.commands import BadArgument, Context
@@ -18,6 +18,47 @@ def human_months(months: Iterable[Month]) -> str:
     return ", ".join(str(m) for m in months)
 
 
+class MonthCache:
+    """
+    The current month, computed once and refreshed at the start of each UTC month.
+
+    The refresh is scheduled on the running event loop. Without one, the month is computed on every call instead.
+    """
+
+    def __init__(self):
+        self._month: Month | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> Month:
+        """Return the current month, computing it if it isn't cached."""
+        if self._month is None or (self._loop is not None and self._loop.is_closed()):
+            return self.refresh()
+        return self._month
+
+    def refresh(self) -> Month:
+        """Compute the current month and, unless it's overridden, schedule the next refresh."""
+        if Client.month_override is not None:
+            self._month = Month(Client.month_override)
+            return self._month
+
+        now = datetime.now(tz=UTC)
+        month = Month(now.month)
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._month = self._loop = None
+            return month
+
+        self._month = month
+        next_month = (now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=32)).replace(day=1)
+        # If the refresh runs a little early, the month hasn't changed yet and it's scheduled again for the boundary
+        self._loop.call_later((next_month - now).total_seconds(), self.refresh)
+        return month
+
+
+MONTH_CACHE = MonthCache()
+
+
 def resolve_current_month() -> Month:
     """
     Determine current month w.r.t. `Client.month_override` env var.
@@ -25,9 +66,7 @@ def resolve_current_month() -> Month:
     If the env variable was set, current month always resolves to the configured value.
     Otherwise, the current UTC month is given.
     """
-    if Client.month_override is not None:
-        return Month(Client.month_override)
-    return Month(datetime.now(tz=UTC).month)
+    return MONTH_CACHE.get()
 
 
 async def disambiguate(
@@ -72,7 +111,7 @@ async def disambiguate(
     )
 
     try:
-        message = await ctx.bot.wait_for("message", check=check, timeout=timeout)
+        message = await ctx.bot.waiters.wait_for("message", channel=ctx.channel.id, check=check, timeout=timeout)
     except TimeoutError:
         raise BadArgument("Timed out.")
 
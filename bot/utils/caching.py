@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class ByteLRUCache:
+    """
+    A least recently used cache of `bytes` values, bounded by the total size of the values rather than their count.
+
+    Hits, misses and evictions are counted so the effectiveness of the cache can be inspected.
+    """
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} {self.name!r} entries={len(self)} size={self.size}/{self.max_bytes} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+        )
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of lookups that were hits, or 0 if there haven't been any lookups yet."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the value stored under `key`, marking it as most recently used, or None if it isn't cached."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: bytes) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entries until it fits.
+
+        Values larger than the whole cache are not stored.
+        """
+        if len(value) > self.max_bytes:
+            log.trace(f"Not caching {len(value)} bytes in {self.name}, it is larger than the cache.")
+            return
+
+        self.pop(key)
+        self._entries[key] = value
+        self.size += len(value)
+
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> bytes | None:
+        """Remove and return the value stored under `key`, or None if it isn't cached."""
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self.size -= len(value)
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry from the cache, keeping the counters."""
+        self._entries.clear()
+        self.size = 0
@@ -1,3 +1,4 @@
+from discord.ext.commands import Command
 from rapidfuzz import process
 
 
@@ -5,3 +6,37 @@ def get_command_suggestions(all_commands: list[str], query: str, *, cutoff: int
     """Get similar command names."""
     results = process.extract(query, all_commands, score_cutoff=cutoff, limit=limit)
     return [result[0] for result in results]
+
+
+def get_command_params(command: Command) -> list[str]:
+    """
+    Returns the parameters of the command, formatted for its usage signature.
+
+    Parameters with a default are shown in square brackets along with the default, unless it's empty,
+    variable length parameters are shown in square brackets with an ellipsis, and required ones in angle brackets.
+    """
+    results = []
+    for name, param in command.clean_params.items():
+
+        # if argument has a default value
+        if param.default is not param.empty:
+
+            if isinstance(param.default, str):
+                show_default = param.default
+            else:
+                show_default = param.default is not None
+
+            # if default is not an empty string or None
+            if show_default:
+                results.append(f"[{name}={param.default}]")
+            else:
+                results.append(f"[{name}]")
+
+        # if variable length argument
+        elif param.kind == param.VAR_POSITIONAL:
+            results.append(f"[{name}...]")
+
+        # if required
+        else:
+            results.append(f"<{name}>")
+    return results
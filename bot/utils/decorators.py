@@ -1,8 +1,8 @@
-import asyncio
 import functools
 import random
 from asyncio import Lock
 from collections.abc import Callable, Container
+from dataclasses import dataclass
 from functools import wraps
 from weakref import WeakValueDictionary
 
@@ -13,9 +13,6 @@ from pydis_core.utils.logging import get_logger
 
 from bot.constants import Channels, ERROR_REPLIES, Month, WHITELISTED_CHANNELS
 from bot.utils import human_months, resolve_current_month
-from bot.utils.checks import in_whitelist_check
-
-ONE_DAY = 24 * 60 * 60
 
 log = get_logger(__name__)
 
@@ -28,37 +25,6 @@ class InMonthCheckFailure(CheckFailure):
     """Check failure for when a command is invoked outside of its allowed month."""
 
 
-def seasonal_task(*allowed_months: Month, sleep_time: float | int = ONE_DAY) -> Callable:
-    """
-    Perform the decorated method periodically in `allowed_months`.
-
-    This provides a convenience wrapper to avoid code repetition where some task shall
-    perform an operation repeatedly in a constant interval, but only in specific months.
-
-    The decorated function will be called once every `sleep_time` seconds while
-    the current UTC month is in `allowed_months`. Sleep time defaults to 24 hours.
-
-    The wrapped task is responsible for waiting for the bot to be ready, if necessary.
-    """
-    def decorator(task_body: Callable) -> Callable:
-        @functools.wraps(task_body)
-        async def decorated_task(*args, **kwargs) -> None:
-            """Call `task_body` once every `sleep_time` seconds in `allowed_months`."""
-            log.info(f"Starting seasonal task {task_body.__qualname__} ({human_months(allowed_months)})")
-
-            while True:
-                current_month = resolve_current_month()
-
-                if current_month in allowed_months:
-                    await task_body(*args, **kwargs)
-                else:
-                    log.debug(f"Seasonal task {task_body.__qualname__} sleeps in {current_month!s}")
-
-                await asyncio.sleep(sleep_time)
-        return decorated_task
-    return decorator
-
-
 def in_month_listener(*allowed_months: Month) -> Callable:
     """
     Shield a listener from being invoked outside of `allowed_months`.
@@ -182,52 +148,63 @@ def without_role(*role_ids: int) -> Callable:
     return commands.check(predicate)
 
 
-def whitelist_check(**default_kwargs: Container[int]) -> Callable[[Context], bool]:
+@dataclass(frozen=True)
+class WhitelistPolicy:
+    """The contexts a command may be used in, from the global whitelist merged with the command's overrides."""
+
+    channels: frozenset[int]
+    categories: frozenset[int]
+    roles: frozenset[int]
+    redirect: int | None
+    allow_dms: bool
+
+    def allows(self, ctx: Context) -> bool:
+        """Return whether the policy allows the command to be used in the context."""
+        if ctx.guild is None:
+            return self.allow_dms
+        if ctx.channel.id in self.channels or ctx.channel.id == self.redirect:
+            return True
+        if self.categories and getattr(ctx.channel, "category_id", None) in self.categories:
+            return True
+        return bool(self.roles) and not self.roles.isdisjoint(
+            role.id for role in getattr(ctx.author, "roles", ())
+        )
+
+
+class WhitelistCheck:
     """
     Checks if a message is sent in a whitelisted context.
 
-    All arguments from `in_whitelist_check` are supported, with the exception of "fail_silently".
-    If `whitelist_override` is present, it is added to the global whitelist.
+    The policy of each command is resolved when its cog is added to the bot and forgotten when the cog
+    is removed, so reloading an extension picks up changed overrides.
     """
-    def predicate(ctx: Context) -> bool:
-        kwargs = default_kwargs.copy()
-        allow_dms = False
 
-        # Determine which command's overrides we will use. Group commands will
-        # inherit from their parents if they don't define their own overrides
-        overridden_command: commands.Command | None = None
-        for command in [ctx.command, *ctx.command.parents]:
-            if hasattr(command.callback, "override"):
-                overridden_command = command
-                break
-        if overridden_command is not None:
-            log.debug(f"Command {overridden_command} has overrides")
-            if overridden_command is not ctx.command:
-                log.debug(
-                    f"Command '{ctx.command.qualified_name}' inherited overrides "
-                    "from parent command '{overridden_command.qualified_name}'"
-                )
+    def __init__(self, **default_kwargs: Container[int]):
+        self.default_kwargs = default_kwargs
+        self.policies: dict[commands.Command, WhitelistPolicy] = {}
+
+    def resolve(self, command: commands.Command) -> WhitelistPolicy:
+        """Merge the global whitelist with the overrides of the command, or of the nearest parent that has any."""
+        kwargs = self.default_kwargs.copy()
+        allow_dms = False
 
-        # Update kwargs based on override, if one exists
+        # Group commands will inherit from their parents if they don't define their own overrides
+        overridden_command = next(
+            (command for command in [command, *command.parents] if hasattr(command.callback, "override")), None
+        )
         if overridden_command:
-            # Handle DM invocations
             allow_dms = overridden_command.callback.override_dm
 
             # Remove default kwargs if reset is True
             if overridden_command.callback.override_reset:
                 kwargs = {}
-                log.debug(
-                    f"{ctx.author} called the '{ctx.command.name}' command and "
-                    f"overrode default checks."
-                )
 
             # Merge overwrites and defaults
-            for arg in overridden_command.callback.override:
+            for arg, new_value in overridden_command.callback.override.items():
                 default_value = kwargs.get(arg)
-                new_value = overridden_command.callback.override[arg]
 
                 # Skip values that don't need merging, or can't be merged
-                if default_value is None or isinstance(arg, int):
+                if default_value is None:
                     kwargs[arg] = new_value
 
                 # Merge containers
@@ -237,34 +214,41 @@ def whitelist_check(**default_kwargs: Container[int]) -> Callable[[Context], boo
                     else:
                         kwargs[arg] = new_value
 
-            log.debug(
-                f"Updated default check arguments for '{ctx.command.name}' "
-                f"invoked by {ctx.author}."
-            )
+        return WhitelistPolicy(
+            channels=frozenset(kwargs.get("channels") or ()),
+            categories=frozenset(kwargs.get("categories") or ()),
+            roles=frozenset(kwargs.get("roles") or ()),
+            redirect=kwargs.get("redirect", Channels.sir_lancebot_playground),
+            allow_dms=allow_dms,
+        )
 
-        if ctx.guild is None:
-            log.debug(f"{ctx.author} tried using the '{ctx.command.name}' command from a DM.")
-            result = allow_dms
-        else:
-            log.trace(f"Calling whitelist check for {ctx.author} for command {ctx.command.name}.")
-            result = in_whitelist_check(ctx, fail_silently=True, **kwargs)
+    def add_cog(self, cog: commands.Cog) -> None:
+        """Resolve the policies of the cog's commands."""
+        for command in cog.walk_commands():
+            self.policies[command] = self.resolve(command)
 
-        # Return if check passed
-        if result:
-            log.debug(
-                f"{ctx.author} tried to call the '{ctx.command.name}' command "
-                f"and the command was used in an overridden context."
-            )
-            return result
+    def remove_cog(self, cog: commands.Cog) -> None:
+        """Forget the policies of the cog's commands."""
+        for command in cog.walk_commands():
+            self.policies.pop(command, None)
 
-        log.debug(
-            f"{ctx.author} tried to call the '{ctx.command.name}' command. "
-            f"The whitelist check failed."
-        )
+    def __call__(self, ctx: Context) -> bool:
+        """Check the context against the command's policy, raising `InChannelCheckFailure` if it isn't allowed."""
+        policy = self.policies.get(ctx.command)
+        if policy is None:
+            # Commands added outside of a cog are resolved on their first use
+            policy = self.policies[ctx.command] = self.resolve(ctx.command)
+
+        if policy.allows(ctx):
+            return True
 
-        # Raise error if the check did not pass
-        channels = set(kwargs.get("channels") or {})
-        categories = kwargs.get("categories")
+        log.debug(f"{ctx.author} tried to call the '{ctx.command.name}' command. The whitelist check failed.")
+        raise InChannelCheckFailure(self.failure_message(ctx, policy))
+
+    @staticmethod
+    def failure_message(ctx: Context, policy: WhitelistPolicy) -> str:
+        """Describe where the command can be used instead."""
+        channels = set(policy.channels)
 
         # Only output override channels + sir_lancebot_playground
         if channels:
@@ -273,8 +257,8 @@ def whitelist_check(**default_kwargs: Container[int]) -> Callable[[Context], boo
             channels.difference_update(default_whitelist_channels)
 
         # Add all whitelisted category channels, but skip if we're in DMs
-        if categories and ctx.guild is not None:
-            for category_id in categories:
+        if policy.categories and ctx.guild is not None:
+            for category_id in policy.categories:
                 category = ctx.guild.get_channel(category_id)
                 if category is None:
                     continue
@@ -283,13 +267,18 @@ def whitelist_check(**default_kwargs: Container[int]) -> Callable[[Context], boo
 
         if channels:
             channels_str = ", ".join(f"<#{c_id}>" for c_id in channels)
-            message = f"Sorry, but you may only use this command within {channels_str}."
-        else:
-            message = "Sorry, but you may not use this command."
+            return f"Sorry, but you may only use this command within {channels_str}."
+        return "Sorry, but you may not use this command."
 
-        raise InChannelCheckFailure(message)
 
-    return predicate
+def whitelist_check(**default_kwargs: Container[int]) -> WhitelistCheck:
+    """
+    Checks if a message is sent in a whitelisted context.
+
+    All arguments from `in_whitelist_check` are supported, with the exception of "fail_silently".
+    If `whitelist_override` is present, it is added to the global whitelist.
+    """
+    return WhitelistCheck(**default_kwargs)
 
 
 def whitelist_override(bypass_defaults: bool = False, allow_dm: bool = False, **kwargs: Container[int]) -> Callable:
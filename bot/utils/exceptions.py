@@ -14,6 +14,15 @@ class APIError(Exception):
         self.error_msg = error_msg
 
 
+class GitHubRateLimitError(APIError):
+    """Raised instead of making a GitHub API request that the rate limit budget doesn't allow."""
+
+    def __init__(self, resource: str, reset: float):
+        super().__init__("GitHub API", 403, f"The {resource} rate limit budget is spent.")
+        self.resource = resource
+        self.reset = reset
+
+
 class MovedCommandError(Exception):
     """Raised when a command has moved locations."""
 
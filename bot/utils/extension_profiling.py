@@ -0,0 +1,86 @@
+import time
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import dataclass
+from importlib.abc import Loader
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+
+# The profile of the extension being loaded by the current task, so cogs can be attributed to it
+loading_extension: ContextVar["ExtensionProfile | None"] = ContextVar("loading_extension", default=None)
+
+
+@dataclass
+class ExtensionProfile:
+    """
+    How long loading an extension took, split into its phases, and how much memory it allocated.
+
+    Memory is only measured while `tracemalloc` is tracing.
+    """
+
+    import_seconds: float = 0.0
+    setup_seconds: float = 0.0
+    cog_load_seconds: float = 0.0
+    allocated_bytes: int | None = None
+    error: str | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        """The time taken to load the extension."""
+        return self.import_seconds + self.setup_seconds + self.cog_load_seconds
+
+    def summary(self) -> str:
+        """Summarise the profile on a single line."""
+        summary = (
+            f"{self.total_seconds * 1000:.0f} ms (import {self.import_seconds * 1000:.0f}, "
+            f"setup {self.setup_seconds * 1000:.0f}, cog_load {self.cog_load_seconds * 1000:.0f})"
+        )
+        if self.allocated_bytes is not None:
+            summary += f", {self.allocated_bytes / 2**20:.1f} MiB"
+        return summary
+
+
+class TimedLoader(Loader):
+    """Wrap the loader of an extension's module spec to time how long executing the module takes."""
+
+    def __init__(self, loader: Loader, profile: ExtensionProfile):
+        self.loader = loader
+        self.profile = profile
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        """Create the module with the wrapped loader."""
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Execute the module with the wrapped loader, which the module keeps as its own loader."""
+        module.__loader__ = module.__spec__.loader = self.loader
+
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profile.import_seconds = time.perf_counter() - start
+
+
+def traced_memory() -> int | None:
+    """Return the memory currently allocated according to `tracemalloc`, or None if it isn't tracing."""
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+def format_report(profiles: dict[str, ExtensionProfile]) -> str:
+    """Format the profiles as a table, with the slowest extensions first."""
+    lines = [
+        f"{'extension':<52} {'import':>8} {'setup':>8} {'cog_load':>9} {'total':>8} {'memory':>9}",
+    ]
+    for name, profile in sorted(profiles.items(), key=lambda item: item[1].total_seconds, reverse=True):
+        memory = "" if profile.allocated_bytes is None else f"{profile.allocated_bytes / 2**20:.1f} MiB"
+        lines.append(
+            f"{name:<52} {profile.import_seconds * 1000:>6.0f}ms {profile.setup_seconds * 1000:>6.0f}ms "
+            f"{profile.cog_load_seconds * 1000:>7.0f}ms {profile.total_seconds * 1000:>6.0f}ms {memory:>9}"
+            + (f"  failed: {profile.error}" if profile.error else "")
+        )
+
+    total = sum(profile.total_seconds for profile in profiles.values())
+    failures = sum(profile.error is not None for profile in profiles.values())
+    lines.append(f"\nProfiled {len(profiles)} extensions, {failures} of which failed, taking {total:.2f}s in total.")
+    return "\n".join(lines)
@@ -0,0 +1,218 @@
+"""
+Make requests to the GitHub API through one client that stays within the bot's rate limits.
+
+GitHub gives each token a budget of requests per resource, with search limited separately from the core API
+and GraphQL, and reports what's left of the budget in the `X-RateLimit-*` headers of every response.
+The client keeps track of each budget and stops sending requests to a resource before GitHub starts refusing them:
+
+- Background requests, like the issues the auto-linker resolves, stop once a budget is down to its reserved
+  share, which is kept for the commands people run.
+- No request is sent once a budget is spent, or while GitHub has asked for a secondary rate limit to be respected.
+
+In either case, `GitHubRateLimitError` is raised instead of sending the request. GET requests go through
+`Bot.http_cache`, so cached responses don't count against a budget, and neither do revalidated ones,
+because GitHub doesn't count 304 responses. The budgets are updated from every response the API sends
+through the cache, once per response however many requests were waiting on it.
+"""
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import aiohttp
+from multidict import CIMultiDictProxy
+from pydis_core.utils.logging import get_logger
+from yarl import URL
+
+from bot.constants import Client
+from bot.utils.exceptions import GitHubRateLimitError
+from bot.utils.http_cache import CachedResponse, HTTPCache
+
+log = get_logger(__name__)
+
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+
+# The resources GitHub limits separately that the bot uses
+RESOURCES = ("core", "search", "graphql")
+
+
+def resource_for(url: URL) -> str:
+    """Return the rate-limited resource a request to the URL counts against."""
+    if url.path == "/graphql":
+        return "graphql"
+    if url.path.startswith("/search/"):
+        return "search"
+    return "core"
+
+
+@dataclass
+class RateLimitBudget:
+    """What GitHub last reported is left of the requests allowed to a resource, until its budget resets."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    # When the budget resets, as a Unix timestamp
+    reset: float | None = None
+    # How many requests were sent and refused to stay within the budget
+    requests: int = 0
+    refused: int = 0
+    # The reset of the budget that running low was last warned about, to only warn once each time
+    warned_reset: float | None = None
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the budget from the rate limit headers of a response, if it has them."""
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        # Responses to concurrent requests can arrive out of order, and the budget only goes down until it resets
+        if reset == self.reset and self.remaining is not None:
+            remaining = min(remaining, self.remaining)
+        self.limit, self.remaining, self.reset = limit, remaining, reset
+
+    def left(self, now: float) -> int | None:
+        """Return how many requests are left, or None if GitHub hasn't reported the budget yet."""
+        if self.reset is not None and now >= self.reset:
+            return self.limit
+        return self.remaining
+
+    def reserve(self, share: float) -> int:
+        """Return how many requests of the budget the share keeps for interactive requests."""
+        return math.ceil(self.limit * share) if self.limit is not None else 0
+
+
+class GitHubClient:
+    """Make requests to the GitHub API with the bot's token, keeping within its rate limits."""
+
+    def __init__(
+        self, session: aiohttp.ClientSession, http_cache: HTTPCache, *, token: str = "", background_reserve: float
+    ):
+        self.session = session
+        self.http_cache = http_cache
+        self.background_reserve = background_reserve
+        self.headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": f"{Client.name} ({Client.github_repo})",
+        }
+        if token:
+            self.headers["Authorization"] = f"token {token}"
+        self.budgets = {resource: RateLimitBudget() for resource in RESOURCES}
+        # When GitHub's secondary rate limits allow requests again, as a Unix timestamp
+        self.retry_after = 0.0
+        http_cache.add_response_hook(URL(API_URL).host, self._on_response)
+
+    def _budget(self, resource: str) -> RateLimitBudget:
+        return self.budgets.setdefault(resource, RateLimitBudget())
+
+    async def get(
+        self,
+        url: str | URL,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        background: bool = False,
+    ) -> CachedResponse:
+        """
+        Make a GET request to the API through the HTTP cache, with the client's headers updated by `headers`.
+
+        Requests the bot makes without anyone waiting on them should set `background`, so they're refused while
+        the budget is low. Raises `GitHubRateLimitError` instead of making a request the budget doesn't allow.
+        """
+        url = URL(url)
+        resource = resource_for(url)
+        self._check(resource, background)
+        return await self.http_cache.get(url, params=params, headers=self.headers | dict(headers or {}))
+
+    async def graphql(self, query: str, variables: Mapping[str, Any], *, background: bool = False) -> dict | None:
+        """
+        Send a GraphQL query, returning its data, or None if the query failed.
+
+        Raises `GitHubRateLimitError` instead of sending a query the budget doesn't allow, like `get`.
+        """
+        self._check("graphql", background)
+        try:
+            async with self.session.post(
+                GRAPHQL_URL, json={"query": query, "variables": variables}, headers=self.headers
+            ) as response:
+                self._update("graphql", response.status, response.headers)
+                if response.status != 200:
+                    log.info(f"GitHub GraphQL query failed with status {response.status}.")
+                    return None
+                return (await response.json()).get("data")
+        except (aiohttp.ClientError, TimeoutError) as e:
+            log.info(f"GitHub GraphQL query failed: {e!r}")
+            return None
+
+    def _on_response(self, response: CachedResponse) -> None:
+        """Update the budget of the resource the response came from."""
+        self._update(resource_for(response.url), response.status, response.headers)
+
+    def _check(self, resource: str, background: bool) -> None:
+        """Raise `GitHubRateLimitError` if a request to the resource with the given priority has to wait."""
+        now = time.time()
+        if now < self.retry_after:
+            self._budget(resource).refused += 1
+            raise GitHubRateLimitError(resource, self.retry_after)
+
+        budget = self._budget(resource)
+        left = budget.left(now)
+        if left is None:
+            return
+
+        reserve = budget.reserve(self.background_reserve) if background else 0
+        if left <= reserve:
+            budget.refused += 1
+            log.debug(
+                f"Not sending a {'background' if background else 'interactive'} GitHub {resource} request, "
+                f"{left} of {budget.limit} requests are left until {_format_time(budget.reset)}."
+            )
+            raise GitHubRateLimitError(resource, budget.reset)
+
+    def _update(self, resource: str, status: int, headers: CIMultiDictProxy[str]) -> None:
+        """Update the resource's budget from a response, warning the first time it runs low before resetting."""
+        resource = headers.get("X-RateLimit-Resource", resource)
+        budget = self._budget(resource)
+        budget.requests += 1
+        budget.update(headers)
+
+        if status in (403, 429) and (retry_after := headers.get("Retry-After", "")).isdigit():
+            self.retry_after = time.time() + int(retry_after)
+            log.warning(f"GitHub asked for requests to stop for {retry_after}s to respect its secondary rate limits.")
+
+        if budget.remaining is None or budget.warned_reset == budget.reset:
+            return
+        if budget.remaining <= budget.reserve(self.background_reserve):
+            budget.warned_reset = budget.reset
+            log.warning(
+                f"The GitHub {resource} rate limit is down to {budget.remaining} of {budget.limit} requests "
+                f"until {_format_time(budget.reset)}, background requests are paused until then."
+            )
+
+    def format_budgets(self) -> str:
+        """Format what's left of each resource's budget as a table."""
+        now = time.time()
+        lines = [
+            f"{'resource':<10} {'left':>6} {'limit':>6} {'reserve':>7} {'resets (UTC)':>12} {'sent':>6} {'refused':>7}",
+        ]
+        for resource, budget in self.budgets.items():
+            left = budget.left(now)
+            resets = _format_time(budget.reset) if budget.reset is not None and budget.reset > now else "-"
+            lines.append(
+                f"{resource:<10} {'?' if left is None else left:>6} {budget.limit or '?':>6} "
+                f"{budget.reserve(self.background_reserve):>7} {resets:>12} {budget.requests:>6} {budget.refused:>7}"
+            )
+
+        lines.append(f"\nBackground requests stop with {self.background_reserve:.0%} of a budget left.")
+        if now < self.retry_after:
+            lines.append(f"Respecting secondary rate limits until {_format_time(self.retry_after)}.")
+        return "\n".join(lines)
+
+
+def _format_time(timestamp: float) -> str:
+    return f"{datetime.fromtimestamp(timestamp, tz=UTC):%H:%M:%S}"
@@ -0,0 +1,475 @@
+"""
+Cache the responses to GET requests that cogs make to the APIs they use.
+
+Cogs opt in by registering a `CachePolicy` for the URLs of an endpoint, and making their requests through
+`Bot.http_cache` instead of `Bot.http_session`. Requests to URLs without a policy are passed straight through.
+
+Responses are kept in memory, in a least recently used cache bounded by the size of their bodies.
+Once a response expires, it's revalidated with the ETag or Last-Modified header the API sent with it,
+so an unchanged response isn't downloaded again. During a policy's stale period, an expired response
+is served straight away while it's revalidated in the background.
+
+Identical requests made while one is already in flight, whether or not their URL has a policy,
+wait for its response instead of being sent again.
+
+With a Redis session, a `RedisTier` sits behind the in-memory cache. It keeps compressed responses
+across restarts and shares them between replicas, so a deploy doesn't download every response again.
+"""
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import time
+import uuid
+import zlib
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Generator, Mapping
+from dataclasses import dataclass, replace
+from types import TracebackType
+from typing import Any
+
+import aiohttp
+from async_rediscache import RedisSession
+from multidict import CIMultiDict, CIMultiDictProxy
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+from redis import RedisError
+from yarl import URL
+
+log = get_logger(__name__)
+
+# How long to wait before listening for invalidations again after losing the connection to Redis
+RESUBSCRIBE_DELAY = 10
+
+# A cache key is a hash of the method, the URL with its query and the request headers,
+# so the API keys and tokens they can contain aren't stored in Redis
+CacheKey = str
+
+
+def _cache_key(method: str, url: URL, headers: Mapping[str, str]) -> CacheKey:
+    """Hash the request, normalising the order of its query parameters and headers."""
+    url = url.with_query(sorted(url.query.items()))
+    request = "\n".join([method, str(url), *(f"{name.lower()}: {value}" for name, value in sorted(headers.items()))])
+    return hashlib.sha256(request.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How long responses from an endpoint are cached.
+
+    A response is fresh for `ttl` seconds, and then served while it's revalidated for another `stale_ttl` seconds.
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+    statuses: frozenset[int] = frozenset({200})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The parts of an `aiohttp.ClientResponse` cogs use, for a response whose body has already been read."""
+
+    url: URL
+    status: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status is below 400."""
+        return self.status < 400
+
+    async def read(self) -> bytes:
+        """Return the body of the response."""
+        return self.body
+
+    async def text(self, encoding: str | None = None) -> str:
+        """Decode the body of the response, with the charset it was sent with unless an encoding is given."""
+        if encoding is None:
+            mimetype = aiohttp.helpers.parse_mimetype(self.headers.get("Content-Type", ""))
+            encoding = mimetype.parameters.get("charset", "utf-8")
+        return self.body.decode(encoding)
+
+    async def json(self, *, loads: Callable[[str], Any] = json.loads, content_type: str | None = None) -> Any:
+        """Decode the body of the response as JSON, whatever its content type."""
+        return loads(await self.text())
+
+    async def __aenter__(self) -> "CachedResponse":
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        pass
+
+
+class _RequestContextManager:
+    """Let a request be used in an `async with` statement, like the requests of `aiohttp.ClientSession`."""
+
+    def __init__(self, request: Awaitable[CachedResponse]):
+        self._request = request
+
+    def __await__(self) -> Generator[Any, None, CachedResponse]:
+        return self._request.__await__()
+
+    async def __aenter__(self) -> CachedResponse:
+        return await self._request
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        pass
+
+
+@dataclass
+class _CacheEntry:
+    response: CachedResponse
+    fetched_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.response.body)
+
+    def age(self, now: float) -> float:
+        return now - self.fetched_at
+
+    def encode(self) -> str:
+        """Compress the entry into a string, which is how the Redis session stores values."""
+        metadata = {
+            "url": str(self.response.url),
+            "status": self.response.status,
+            "headers": list(self.response.headers.items()),
+            "fetched_at": self.fetched_at,
+        }
+        # JSON escapes newlines, so the first newline separates the metadata from the body
+        payload = json.dumps(metadata).encode() + b"\n" + self.response.body
+        return base64.b85encode(zlib.compress(payload)).decode("ascii")
+
+    @classmethod
+    def decode(cls, encoded: str) -> "_CacheEntry":
+        """Decompress an entry compressed by `encode`."""
+        metadata, _, body = zlib.decompress(base64.b85decode(encoded)).partition(b"\n")
+        metadata = json.loads(metadata)
+        headers = CIMultiDictProxy(CIMultiDict(metadata["headers"]))
+        response = CachedResponse(URL(metadata["url"]), metadata["status"], headers, body, from_cache=True)
+        return cls(response, metadata["fetched_at"])
+
+    def validators(self) -> dict[str, str]:
+        """Return the headers that make a request for this response conditional."""
+        headers = {}
+        if etag := self.response.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.response.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+@dataclass
+class HostStats:
+    """How the requests to a host were answered, and how long the host took to answer."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    # Hits that missed the memory but were found in Redis
+    redis_hits: int = 0
+    # Requests that waited for an identical request already in flight
+    coalesced: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    bypassed: int = 0
+    bytes_saved: int = 0
+    upstream_requests: int = 0
+    upstream_seconds: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        """How many requests cogs made to the host."""
+        return self.hits + self.stale_hits + self.misses + self.coalesced + self.bypassed
+
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of cacheable requests that were answered from the cache without waiting for the host."""
+        cacheable = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / cacheable if cacheable else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean time the host took to answer a request."""
+        return self.upstream_seconds / self.upstream_requests if self.upstream_requests else 0.0
+
+
+class RedisTier:
+    """
+    Keep cached responses in Redis, where they're shared by every replica and kept across restarts.
+
+    Responses are stored compressed, and expire once they're too old to be served.
+    When a replica caches a changed response, it announces it over pub/sub,
+    so the other replicas drop the copies they have in memory.
+    """
+
+    def __init__(self, redis_session: RedisSession, namespace: str = "HTTPCache"):
+        self.redis_session = redis_session
+        self.namespace = f"{redis_session.global_namespace}.{namespace}"
+        self.channel = f"{self.namespace}.invalidations"
+        # Identifies this replica's announcements, so it ignores them
+        self.origin = uuid.uuid4().hex
+
+    async def get(self, key: CacheKey) -> _CacheEntry | None:
+        """Return the cached entry for the key, or None if there isn't one or Redis can't be reached."""
+        try:
+            encoded = await self.redis_session.client.get(f"{self.namespace}.{key}")
+        except RedisError as e:
+            log.warning(f"Failed to read a cached response from Redis: {e!r}")
+            return None
+        if encoded is None:
+            return None
+
+        try:
+            return _CacheEntry.decode(encoded)
+        except (zlib.error, ValueError, KeyError, TypeError) as e:
+            # A corrupt value is treated as a miss, and replaced once the response is fetched again
+            log.warning(f"Ignoring a corrupt cached response in Redis: {e!r}")
+            return None
+
+    async def set(self, key: CacheKey, entry: _CacheEntry, expiry: float, *, changed: bool) -> None:
+        """Store the entry for `expiry` seconds, announcing it to the other replicas if the response `changed`."""
+        try:
+            name = f"{self.namespace}.{key}"
+            await self.redis_session.client.set(name, entry.encode(), px=max(1, int(expiry * 1000)))
+            if changed:
+                await self.redis_session.client.publish(self.channel, f"{self.origin}:{key}")
+        except RedisError as e:
+            log.warning(f"Failed to store a cached response in Redis: {e!r}")
+
+    async def listen(self, invalidate: Callable[[CacheKey], None]) -> None:
+        """Call `invalidate` with the key of every response another replica announces, resubscribing on errors."""
+        while True:
+            try:
+                async with self.redis_session.client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        origin, _, key = message["data"].partition(":")
+                        if origin != self.origin:
+                            invalidate(key)
+            except RedisError as e:
+                log.warning(f"Lost the subscription to HTTP cache invalidations, resubscribing: {e!r}")
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+
+class HTTPCache:
+    """Make GET requests through the bot's HTTP session, caching the responses of endpoints with a policy."""
+
+    def __init__(self, session: aiohttp.ClientSession, *, max_bytes: int, redis_tier: RedisTier | None = None):
+        self.session = session
+        self.max_bytes = max_bytes
+        self.redis_tier = redis_tier
+        self.policies: dict[str, CachePolicy] = {}
+        self.stats: dict[str, HostStats] = defaultdict(HostStats)
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._revalidating: set[CacheKey] = set()
+        self._in_flight: dict[CacheKey, asyncio.Task[CachedResponse]] = {}
+        self._response_hooks: dict[str, list[Callable[[CachedResponse], None]]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the bodies of the cached responses."""
+        return self._size
+
+    def register(self, url_prefix: str, *, ttl: float, stale_ttl: float = 0.0) -> None:
+        """
+        Cache the responses to requests for URLs starting with `url_prefix`.
+
+        When several prefixes match a URL, the policy of the longest one is used.
+        """
+        self.policies[str(URL(url_prefix))] = CachePolicy(ttl, stale_ttl)
+
+    def add_response_hook(self, host: str, hook: Callable[[CachedResponse], None]) -> None:
+        """
+        Call `hook` with every response the host sends, including 304s, before the cache handles it.
+
+        Responses served from the cache or shared with coalesced requests aren't passed to the hook again.
+        """
+        self._response_hooks[host].append(hook)
+
+    def policy_for(self, url: str) -> CachePolicy | None:
+        """Return the policy of the longest registered prefix of the URL, if any."""
+        matching = [prefix for prefix in self.policies if url.startswith(prefix)]
+        return self.policies[max(matching, key=len)] if matching else None
+
+    def get(
+        self,
+        url: str | URL,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        **kwargs,
+    ) -> _RequestContextManager:
+        """
+        Make a GET request, answering it from the cache if the URL has a policy.
+
+        The response can be awaited or used in an `async with` statement, and its body has always been read.
+        Other keyword arguments are passed to `aiohttp.ClientSession.get`.
+        """
+        return _RequestContextManager(self._get(URL(url), params or {}, dict(headers or {}), kwargs))
+
+    async def _get(self, url: URL, params: Mapping[str, Any], headers: dict[str, str], kwargs: dict) -> CachedResponse:
+        """Wait for an identical request in flight, or make the request."""
+        url = url.update_query({key: str(value) for key, value in params.items()}) if params else url
+        key = _cache_key("GET", url, headers)
+        if flight := self._in_flight.get(key):
+            self.stats[url.host].coalesced += 1
+        else:
+            flight = self._in_flight[key] = asyncio.create_task(self._get_uncoalesced(key, url, headers, kwargs))
+            flight.add_done_callback(functools.partial(self._land, key))
+        # Shielded so a waiter being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(flight)
+
+    def _land(self, key: CacheKey, flight: asyncio.Task[CachedResponse]) -> None:
+        """Forget the finished request, retrieving its exception in case every waiter was cancelled."""
+        self._in_flight.pop(key, None)
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _get_uncoalesced(
+        self, key: CacheKey, url: URL, headers: dict[str, str], kwargs: dict
+    ) -> CachedResponse:
+        """Answer the request from the cache if its URL has a policy, or make it."""
+        stats = self.stats[url.host]
+        policy = self.policy_for(str(url))
+        if policy is None:
+            stats.bypassed += 1
+            return await self._fetch(url, headers, kwargs)
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is None and self.redis_tier is not None and (entry := await self.redis_tier.get(key)):
+            stats.redis_hits += 1
+            self._store(key, entry)
+        if entry:
+            # An entry from Redis too large for the memory limit is served without being kept in memory
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            if entry.age(now) < policy.ttl:
+                stats.hits += 1
+                stats.bytes_saved += entry.size
+                return entry.response
+            if entry.age(now) < policy.ttl + policy.stale_ttl:
+                stats.stale_hits += 1
+                stats.bytes_saved += entry.size
+                if key not in self._revalidating:
+                    self._revalidating.add(key)
+                    scheduling.create_task(
+                        self._revalidate(key, policy, url, headers, kwargs), name=f"Revalidating {url}"
+                    )
+                return entry.response
+
+        stats.misses += 1
+        return await self._refresh(key, policy, url, headers, kwargs)
+
+    async def _revalidate(
+        self, key: CacheKey, policy: CachePolicy, url: URL, headers: dict[str, str], kwargs: dict
+    ) -> None:
+        """Refresh a stale response in the background, keeping it if the request fails."""
+        try:
+            await self._refresh(key, policy, url, headers, kwargs)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            log.info(f"Failed to revalidate the cached response from {url}: {e!r}")
+        finally:
+            self._revalidating.discard(key)
+
+    async def _refresh(
+        self, key: CacheKey, policy: CachePolicy, url: URL, headers: dict[str, str], kwargs: dict
+    ) -> CachedResponse:
+        """Fetch the response for the key, conditionally if a previous response is cached, and cache it."""
+        entry = self._entries.get(key)
+        conditional = headers | entry.validators() if entry else headers
+        response = await self._fetch(url, conditional, kwargs)
+
+        if entry and response.status == 304:
+            self.stats[url.host].revalidated += 1
+            self.stats[url.host].bytes_saved += entry.size
+            entry.fetched_at = time.time()
+            self._persist(key, entry, policy, changed=False)
+            return entry.response
+
+        if response.status in policy.statuses and "no-store" not in response.headers.get("Cache-Control", ""):
+            entry = _CacheEntry(replace(response, from_cache=True), time.time())
+            # Responses too large to keep in memory aren't cached at all, in Redis either
+            if entry.size <= self.max_bytes:
+                self._store(key, entry)
+                self._persist(key, entry, policy, changed=True)
+        return response
+
+    def _persist(self, key: CacheKey, entry: _CacheEntry, policy: CachePolicy, *, changed: bool) -> None:
+        """Store the entry in Redis in the background, for as long as it can be served."""
+        if self.redis_tier is not None and policy.ttl + policy.stale_ttl > 0:
+            scheduling.create_task(
+                self.redis_tier.set(key, entry, policy.ttl + policy.stale_ttl, changed=changed),
+                name=f"Persisting {entry.response.url}",
+            )
+
+    async def _fetch(self, url: URL, headers: dict[str, str], kwargs: dict) -> CachedResponse:
+        """Make the request and read its response, recording how long the host took to answer."""
+        start = time.perf_counter()
+        try:
+            async with self.session.get(url, headers=headers, **kwargs) as response:
+                body = await response.read()
+        finally:
+            stats = self.stats[url.host]
+            stats.upstream_requests += 1
+            stats.upstream_seconds += time.perf_counter() - start
+        cached = CachedResponse(response.url, response.status, CIMultiDictProxy(CIMultiDict(response.headers)), body)
+        for hook in self._response_hooks.get(url.host, ()):
+            hook(cached)
+        return cached
+
+    def _store(self, key: CacheKey, entry: _CacheEntry) -> None:
+        """Cache the entry, evicting the least recently used entries to keep within the size limit."""
+        self._discard(key)
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._size += entry.size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+    def _discard(self, key: CacheKey) -> None:
+        if entry := self._entries.pop(key, None):
+            self._size -= entry.size
+
+    async def listen_for_invalidations(self) -> None:
+        """Drop the responses other replicas announce they've replaced from memory, if there's a Redis tier."""
+        if self.redis_tier is not None:
+            await self.redis_tier.listen(self._discard)
+
+    def clear(self) -> None:
+        """Forget every cached response."""
+        self._entries.clear()
+        self._size = 0
+
+    def format_stats(self) -> str:
+        """Format the statistics of every host as a table, with the most requested first."""
+        lines = [
+            f"{'host':<28} {'hits':>6} {'stale':>6} {'redis':>6} {'misses':>6} {'joined':>6} {'304s':>5} "
+            f"{'bypass':>6} {'ratio':>6} {'saved':>9} {'latency':>9}",
+        ]
+        for host, stats in sorted(self.stats.items(), key=lambda item: item[1].requests, reverse=True):
+            lines.append(
+                f"{host:<28} {stats.hits:>6} {stats.stale_hits:>6} {stats.redis_hits:>6} {stats.misses:>6} "
+                f"{stats.coalesced:>6} {stats.revalidated:>5} {stats.bypassed:>6} {stats.hit_ratio:>6.0%} "
+                f"{stats.bytes_saved / 1024:>7.0f}kB {stats.mean_latency * 1000:>7.0f}ms"
+            )
+
+        lines.append(f"\nCaching {len(self)} responses in {self.size / 1024:.0f}kB of {self.max_bytes / 1024:.0f}kB.")
+        return "\n".join(lines)
@@ -0,0 +1,96 @@
+import enum
+import time
+from dataclasses import dataclass
+from io import BytesIO
+
+import discord
+import numpy as np
+from PIL import Image
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+WEBP_QUALITY = 90
+
+
+class ImageKind(enum.Enum):
+    """The kinds of images the bot generates, each of which is encoded in the way that suits it best."""
+
+    # Photographs and avatars, encoded as lossy WebP
+    PHOTO = enum.auto()
+    # Boards, cards and drawings with flat colours, encoded as an optimized palette PNG where possible
+    FLAT = enum.auto()
+    # Tiny images, encoded as PNG as quickly as possible
+    THUMBNAIL = enum.auto()
+
+    @property
+    def extension(self) -> str:
+        """The file extension of images of this kind."""
+        return "webp" if self is ImageKind.PHOTO else "png"
+
+
+@dataclass
+class EncoderStats:
+    """Running totals of the images encoded for one `ImageKind`."""
+
+    images: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+
+
+# Per-process totals, so images encoded in worker processes are counted in those processes
+ENCODER_STATS = {kind: EncoderStats() for kind in ImageKind}
+
+
+def _to_palette(image: Image.Image) -> Image.Image | None:
+    """Losslessly convert the image to a palette image, or return None if it has more than 256 colours."""
+    if image.getcolors(256) is None:
+        return None
+
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    pixels = np.asarray(image.convert("RGBA"))
+    colours, indices = np.unique(pixels.view(np.uint32).reshape(-1), return_inverse=True)
+
+    palette_image = Image.frombytes("P", image.size, indices.astype(np.uint8).tobytes())
+    palette = colours.view(np.uint8).reshape(-1, 4)
+    if has_alpha:
+        palette_image.putpalette(palette.tobytes(), rawmode="RGBA")
+    else:
+        palette_image.putpalette(palette[:, :3].tobytes())
+    return palette_image
+
+
+def encode_image(image: Image.Image, kind: ImageKind) -> bytes:
+    """
+    Encode the image in the format suited to its kind, recording how long it took and how large the result was.
+
+    The result should be sent with the `kind.extension` file extension.
+    """
+    start = time.perf_counter()
+    buffer = BytesIO()
+
+    if kind is ImageKind.PHOTO:
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        image.save(buffer, format="WEBP", quality=WEBP_QUALITY)
+    elif kind is ImageKind.FLAT:
+        palette_image = _to_palette(image)
+        (palette_image or image).save(buffer, format="PNG", optimize=True)
+    else:
+        image.save(buffer, format="PNG", compress_level=1)
+
+    data = buffer.getvalue()
+    seconds = time.perf_counter() - start
+
+    stats = ENCODER_STATS[kind]
+    stats.images += 1
+    stats.seconds += seconds
+    stats.bytes += len(data)
+    log.trace(f"Encoded a {image.width}x{image.height} {kind.name} image to {len(data)} bytes in {seconds:.3f}s.")
+
+    return data
+
+
+def image_file(image: Image.Image, kind: ImageKind, name: str) -> discord.File:
+    """Encode the image for its kind and wrap it in a file called `name`, with the extension for that kind."""
+    return discord.File(BytesIO(encode_image(image, kind)), filename=f"{name}.{kind.extension}")
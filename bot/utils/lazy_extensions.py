@@ -0,0 +1,235 @@
+"""
+Support for loading extensions lazily, on the first use of one of their commands or listeners.
+
+The bot can't know which commands and listeners an extension provides without importing it,
+so they are recorded in a manifest that is generated ahead of time by running this module:
+
+    uv run task manifest
+
+The filters of the extension's message handlers are recorded too, so only messages they want load it.
+"""
+import asyncio
+import importlib
+import inspect
+import json
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+import discord
+from discord.ext import commands, tasks
+from pydis_core.utils._extensions import walk_extensions
+from pydis_core.utils.logging import get_logger
+
+from bot.utils import resources
+from bot.utils.commands import get_command_params
+from bot.utils.message_router import MessageFilter, ROUTED_EVENTS, handler_filters
+from bot.utils.seasonal import seasonal_tasks
+
+if TYPE_CHECKING:
+    from bot.bot import Bot
+
+log = get_logger(__name__)
+
+MANIFEST_PATH = Path("bot/resources/extension_manifest.json")
+
+# Extensions in these packages manage the bot itself, so they are always loaded straight away
+EAGER_PACKAGES = ("bot.exts.core.",)
+# Names that show a cog's `__init__` starts work of its own, instead of waiting for commands and events
+EAGER_INIT_NAMES = frozenset({"create_task", "tree"})
+
+
+def _eager_reason(cog: type[commands.Cog]) -> str | None:
+    """Return why the cog has to be loaded at startup, or None if it can wait until it's first used."""
+    if cog.cog_load is not commands.Cog.cog_load:
+        return "has a cog_load hook"
+    if cog.__cog_app_commands__:
+        return "has app commands"
+    if any(isinstance(attribute, tasks.Loop) for attribute in vars(cog).values()):
+        return "has a background task"
+    if seasonal_tasks(cog):
+        return "has a seasonal task"
+    init_code = getattr(cog.__init__, "__code__", None)
+    if init_code and EAGER_INIT_NAMES & set(init_code.co_names):
+        return "starts work when initialised"
+    return None
+
+
+def _command_entry(cog: type[commands.Cog], command: commands.Command) -> dict[str, Any]:
+    """Describe a top-level command of the cog, with the root aliases of the whole command tree and its help."""
+    walked = [command, *command.walk_commands()] if isinstance(command, commands.Group) else [command]
+    return {
+        "name": command.name,
+        "aliases": list(command.aliases),
+        "root_aliases": sorted(alias for cmd in walked for alias in getattr(cmd, "root_aliases", ())),
+        "hidden": command.hidden,
+        # What the help command needs to list the command without loading its extension
+        "category": getattr(cog, "category", None) or cog.__cog_name__,
+        "brief": command.short_doc,
+        "params": get_command_params(command),
+    }
+
+
+def _extension_cogs(extension: str) -> list[type[commands.Cog]]:
+    """Find the cogs defined by the extension or, for a package, by its submodules."""
+    module = importlib.import_module(extension)
+    return [
+        value for value in vars(module).values()
+        if inspect.isclass(value) and issubclass(value, commands.Cog)
+        and (value.__module__ == extension or value.__module__.startswith(f"{extension}."))
+    ]
+
+
+def build_manifest() -> dict[str, dict[str, Any]]:
+    """Import every extension and record the cogs, commands and listeners it provides."""
+    from bot import exts
+
+    manifest = {}
+    for extension in sorted(walk_extensions(exts)):
+        cogs = _extension_cogs(extension)
+        if extension.startswith(EAGER_PACKAGES):
+            eager_reasons = {"is a core extension"}
+        elif not cogs:
+            eager_reasons = {"adds its cogs in setup"}
+        else:
+            eager_reasons = {reason for cog in cogs if (reason := _eager_reason(cog))}
+
+        manifest[extension] = {
+            "eager": ", ".join(sorted(eager_reasons)) or None,
+            "cogs": sorted(cog.__cog_name__ for cog in cogs),
+            "commands": [
+                _command_entry(cog, command)
+                for cog in cogs
+                for command in cog.__cog_commands__
+                if command.parent is None
+            ],
+            "listeners": sorted({name for cog in cogs for name, _ in cog.__cog_listeners__}),
+            "message_handlers": [
+                message_filter.to_entry() for cog in cogs for message_filter in handler_filters(cog).values()
+            ],
+            "dependencies": sorted({
+                dependency for cog in cogs for dependency in getattr(cog, "extension_dependencies", ())
+            }),
+        }
+
+    return manifest
+
+
+def read_manifest() -> dict[str, dict[str, Any]]:
+    """Read the manifest generated by `build_manifest`."""
+    return resources.load(MANIFEST_PATH)
+
+
+def write_manifest() -> None:
+    """Generate the manifest and write it to `MANIFEST_PATH`."""
+    MANIFEST_PATH.write_text(json.dumps(build_manifest(), indent=4) + "\n", "utf8")
+
+
+class LazyCommand(commands.Command):
+    """
+    A placeholder for a command whose extension hasn't been loaded yet.
+
+    The bot swaps in the real command before it creates a context for this one,
+    so the placeholder itself only runs when it's invoked directly. It carries the help category,
+    summary and parameters recorded in the manifest, so commands can be listed without being loaded.
+    """
+
+    def __init__(self, lazy_extension: "LazyExtension", entry: dict[str, Any]):
+        async def load_and_invoke(ctx: commands.Context) -> None:
+            await lazy_extension.load()
+            await ctx.bot.invoke(await ctx.bot.get_context(ctx.message))
+
+        super().__init__(
+            load_and_invoke,
+            name=entry["name"],
+            aliases=entry["aliases"],
+            hidden=entry["hidden"],
+            help=f"Loaded from `{lazy_extension.name}` when first used.",
+            brief=entry["brief"],
+            ignore_extra=True,
+        )
+        self.root_aliases = entry["root_aliases"]
+        self.category = entry["category"]
+        self.signature_params = entry["params"]
+        self.lazy_extension = lazy_extension
+
+    async def can_run(self, ctx: commands.Context) -> bool:
+        """Leave the checks to the real command."""
+        return True
+
+
+class LazyExtension:
+    """An extension that will be loaded when one of its commands or listeners is first used."""
+
+    def __init__(self, bot: "Bot", name: str, entry: dict[str, Any]):
+        self.bot = bot
+        self.name = name
+        self.cog_names = entry["cogs"]
+        # The names help can be asked about to list the extension's commands
+        self.categories = {*self.cog_names, *(command["category"] for command in entry["commands"])}
+        self.dependencies = entry["dependencies"]
+        self.commands = [LazyCommand(self, command) for command in entry["commands"]]
+        # Handlers that only want messages concerning what's active in their cog can't want any before it's loaded
+        self.message_filters = [
+            MessageFilter.from_entry(handler) for handler in entry["message_handlers"] if handler["active_in"] is None
+        ]
+        # The events the cogs listen to directly, which load the extension whatever they concern
+        self.cog_listeners = frozenset(entry["listeners"])
+        events = self.cog_listeners | {f"on_{message_filter.event}" for message_filter in self.message_filters}
+        self.listeners = {event: self._create_listener(event) for event in events}
+        self._load_task: asyncio.Task | None = None
+
+    def _wants(self, event: str, message: discord.Message) -> bool:
+        """Return whether one of the extension's message handlers wants the message."""
+        return any(
+            f"on_{message_filter.event}" == event and message_filter.matches(None, message)
+            for message_filter in self.message_filters
+        )
+
+    def _create_listener(self, event: str) -> Callable[..., Coroutine[Any, Any, None]]:
+        """Create a listener that loads the extension and then forwards the event to its cogs."""
+        async def load_and_dispatch(*args) -> None:
+            # The edited message is the last argument of an edit event
+            if event not in self.cog_listeners and not self._wants(event, args[-1]):
+                return
+            await self.load()
+            for cog_name in self.cog_names:
+                if not (cog := self.bot.get_cog(cog_name)):
+                    continue
+                if event in ROUTED_EVENTS:
+                    self.bot.message_router.route(ROUTED_EVENTS[event], args[-1], cog=cog)
+                for name, listener in cog.get_listeners():
+                    if name == event:
+                        await listener(*args)
+
+        return load_and_dispatch
+
+    def install(self) -> None:
+        """Register the placeholder commands and listeners with the bot."""
+        for command in self.commands:
+            self.bot.add_command(command)
+        for event, listener in self.listeners.items():
+            self.bot.add_listener(listener, event)
+
+    def uninstall(self) -> None:
+        """Remove the placeholder commands and listeners, so the real ones can take their place."""
+        for command in self.commands:
+            self.bot.remove_command(command.name)
+        for event, listener in self.listeners.items():
+            self.bot.remove_listener(listener, event)
+
+    async def load(self) -> None:
+        """Load the extension after any lazily loaded extensions it depends on, or wait for the load in progress."""
+        for dependency in self.dependencies:
+            if lazy_dependency := self.bot.lazy_extensions.get(dependency):
+                await lazy_dependency.load()
+
+        if self._load_task is None:
+            log.info(f"Loading {self.name} on first use.")
+            self._load_task = asyncio.create_task(self.bot.load_extension(self.name))
+        await self._load_task
+
+
+if __name__ == "__main__":
+    write_manifest()
+    log.info(f"Wrote the extension manifest to {MANIFEST_PATH}.")
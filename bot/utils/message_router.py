@@ -0,0 +1,250 @@
+"""
+Route message events to the cog handlers that want them.
+
+discord.py runs every `on_message` listener in a task of its own for every message the bot sees,
+even though most of them return straight away. Instead, cogs mark their handlers with `message_handler`,
+declaring which messages they want. The router checks those filters synchronously as messages arrive,
+and only starts tasks for the handlers whose filters match.
+"""
+import re
+import time
+from collections import defaultdict
+from collections.abc import Callable, Collection, Coroutine, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import discord
+from discord.ext import commands
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+
+from bot.constants import Channels, Month
+from bot.utils import resolve_current_month
+
+log = get_logger(__name__)
+
+# The events the router handles, and the name handlers use for them
+ROUTED_EVENTS = {"on_message": "message", "on_message_edit": "message_edit"}
+
+Handler = Callable[[discord.Message], Coroutine[Any, Any, None]]
+
+
+def _channel_id(message: discord.Message) -> int:
+    return message.channel.id
+
+
+@dataclass(frozen=True)
+class MessageFilter:
+    """
+    The messages a handler wants to receive.
+
+    `active_in` names an attribute of the cog, such as a mapping of channel IDs to running games,
+    which must contain the message's `active_key` for the handler to be run.
+    """
+
+    event: str
+    ignore_bots: bool = True
+    guild_only: bool = False
+    channels: frozenset[int] | None = None
+    months: frozenset[Month] | None = None
+    pattern: re.Pattern | None = None
+    active_in: str | None = None
+    active_key: Callable[[discord.Message], Hashable] = _channel_id
+
+    def to_entry(self) -> dict[str, Any]:
+        """
+        Describe the filter for the extension manifest, so messages can be checked against it before its cog is loaded.
+
+        Channels are recorded by the name of their constant where they have one, so they follow the configuration
+        the bot runs with rather than the one the manifest was generated with.
+        """
+        channel_names = {}
+        for name, channel_id in Channels:
+            channel_names.setdefault(channel_id, name)
+
+        return {
+            "event": self.event,
+            "ignore_bots": self.ignore_bots,
+            "guild_only": self.guild_only,
+            "channels": None if self.channels is None else [
+                channel_names.get(channel_id, channel_id) for channel_id in sorted(self.channels)
+            ],
+            "months": None if self.months is None else sorted(int(month) for month in self.months),
+            "pattern": None if self.pattern is None else self.pattern.pattern,
+            "pattern_flags": None if self.pattern is None else self.pattern.flags,
+            "active_in": self.active_in,
+        }
+
+    @classmethod
+    def from_entry(cls, entry: dict[str, Any]) -> "MessageFilter":
+        """Recreate a filter described by `to_entry`, apart from the key its `active_in` attribute is checked with."""
+        channels = entry["channels"]
+        return cls(
+            event=entry["event"],
+            ignore_bots=entry["ignore_bots"],
+            guild_only=entry["guild_only"],
+            channels=None if channels is None else frozenset(
+                getattr(Channels, channel) if isinstance(channel, str) else channel for channel in channels
+            ),
+            months=None if entry["months"] is None else frozenset(Month(month) for month in entry["months"]),
+            pattern=None if entry["pattern"] is None else re.compile(entry["pattern"], entry["pattern_flags"]),
+            active_in=entry["active_in"],
+        )
+
+    def matches(self, cog: commands.Cog | None, message: discord.Message) -> bool:
+        """
+        Return whether the message passes the filter, checking the cheapest conditions first.
+
+        The cog is only needed to check `active_in`, so filters without it can be checked before the cog is loaded.
+        """
+        if self.ignore_bots and message.author.bot:
+            return False
+        if self.guild_only and not message.guild:
+            return False
+        if self.channels is not None and message.channel.id not in self.channels:
+            return False
+        if self.active_in is not None and self.active_key(message) not in getattr(cog, self.active_in):
+            return False
+        if self.months is not None and resolve_current_month() not in self.months:
+            return False
+        return self.pattern is None or self.pattern.search(message.content) is not None
+
+
+def message_handler(
+    event: str = "message",
+    *,
+    ignore_bots: bool = True,
+    guild_only: bool = False,
+    channels: Collection[int] | None = None,
+    months: Collection[Month] | None = None,
+    pattern: str | re.Pattern | None = None,
+    active_in: str | None = None,
+    active_key: Callable[[discord.Message], Hashable] = _channel_id,
+) -> Callable[[Handler], Handler]:
+    """
+    Mark a cog method as a handler of `event`, either "message" or "message_edit", for the messages it wants.
+
+    The handler is only run for messages that pass every filter given. Edit handlers receive the edited message.
+    A pattern is searched for case-insensitively when it's given as a string.
+    """
+    if event not in ROUTED_EVENTS.values():
+        raise ValueError(f"Message handlers can't handle {event!r} events.")
+
+    message_filter = MessageFilter(
+        event=event,
+        ignore_bots=ignore_bots,
+        guild_only=guild_only,
+        channels=None if channels is None else frozenset(channels),
+        months=None if months is None else frozenset(months),
+        pattern=re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern,
+        active_in=active_in,
+        active_key=active_key,
+    )
+
+    def decorator(handler: Handler) -> Handler:
+        handler.__message_filter__ = message_filter
+        return handler
+    return decorator
+
+
+def handler_filters(cog: type[commands.Cog]) -> dict[str, MessageFilter]:
+    """Find the message handlers of the cog class, by the names of their methods."""
+    filters = {}
+    for base in reversed(cog.__mro__):
+        for name, value in vars(base).items():
+            if message_filter := getattr(value, "__message_filter__", None):
+                filters[name] = message_filter
+    return filters
+
+
+@dataclass
+class HandlerStats:
+    """How many messages a handler was run for, and how long it took to handle them."""
+
+    matched: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """The mean time the handler took to handle a message."""
+        return self.total_seconds / self.matched if self.matched else 0.0
+
+
+@dataclass
+class _RegisteredHandler:
+    cog: commands.Cog
+    callback: Handler
+    filter: MessageFilter
+    stats: HandlerStats = field(default_factory=HandlerStats)
+
+    @property
+    def name(self) -> str:
+        return self.callback.__qualname__
+
+
+class MessageRouter:
+    """Dispatch message events to the handlers of loaded cogs whose filters match."""
+
+    def __init__(self):
+        self.handlers: dict[str, list[_RegisteredHandler]] = defaultdict(list)
+        # How many messages were routed for each event
+        self.routed: dict[str, int] = defaultdict(int)
+
+    def add_cog(self, cog: commands.Cog) -> None:
+        """Register the cog's message handlers."""
+        for name, message_filter in handler_filters(type(cog)).items():
+            self.handlers[message_filter.event].append(_RegisteredHandler(cog, getattr(cog, name), message_filter))
+            log.trace(f"Routing {message_filter.event} events to {type(cog).__name__}.{name}.")
+
+    def remove_cog(self, cog: commands.Cog) -> None:
+        """Stop routing messages to the cog's handlers."""
+        for event, handlers in self.handlers.items():
+            self.handlers[event] = [handler for handler in handlers if handler.cog is not cog]
+
+    def route(self, event: str, message: discord.Message, *, cog: commands.Cog | None = None) -> None:
+        """Start a task for every handler of `event` whose filter the message passes, optionally only for `cog`."""
+        self.routed[event] += 1
+        for handler in self.handlers[event]:
+            if (cog is None or handler.cog is cog) and handler.filter.matches(handler.cog, message):
+                scheduling.create_task(self._run(handler, message), name=f"{handler.name} for {message.id}")
+
+    async def _run(self, handler: _RegisteredHandler, message: discord.Message) -> None:
+        """Run the handler, recording how long it took and whether it failed."""
+        handler.stats.matched += 1
+        start = time.perf_counter()
+        try:
+            await handler.callback(message)
+        except Exception:
+            handler.stats.failed += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            handler.stats.total_seconds += elapsed
+            handler.stats.max_seconds = max(handler.stats.max_seconds, elapsed)
+
+    async def on_message(self, message: discord.Message) -> None:
+        """Route a new message."""
+        self.route("message", message)
+
+    async def on_message_edit(self, _: discord.Message, after: discord.Message) -> None:
+        """Route an edited message."""
+        self.route("message_edit", after)
+
+    def format_stats(self) -> str:
+        """Format the statistics of every handler as a table, with the most frequently run first."""
+        lines = [
+            f"{'handler':<40} {'event':<12} {'matched':>8} {'failed':>7} {'mean':>9} {'max':>9}",
+        ]
+        handlers = [handler for event_handlers in self.handlers.values() for handler in event_handlers]
+        for handler in sorted(handlers, key=lambda handler: handler.stats.matched, reverse=True):
+            stats = handler.stats
+            lines.append(
+                f"{handler.name:<40} {handler.filter.event:<12} {stats.matched:>8} {stats.failed:>7} "
+                f"{stats.mean_seconds * 1000:>7.1f}ms {stats.max_seconds * 1000:>7.1f}ms"
+            )
+
+        routed = ", ".join(f"{count} {event} events" for event, count in self.routed.items()) or "no events"
+        lines.append(f"\nRouted {routed}.")
+        return "\n".join(lines)
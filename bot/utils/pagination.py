@@ -161,7 +161,9 @@ class ImagePaginator(Paginator):
         while True:
             # Start waiting for reactions
             try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check_event)
+                reaction, user = await ctx.bot.waiters.wait_for(
+                    "reaction_add", message=message.id, timeout=timeout, check=check_event
+                )
             except TimeoutError:
                 log.debug("Timed out waiting for a reaction")
                 break  # We're done, no reactions for the last 5 minutes
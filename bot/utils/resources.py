@@ -0,0 +1,161 @@
+"""
+Load the JSON and YAML resources in `bot/resources`.
+
+For production, the resources are compiled ahead of time into a single bundle by running this module:
+
+    uv run task resources
+
+The bundle is memory-mapped, and each resource is only decoded from it when it's loaded.
+Resources that aren't in the bundle, or whose source file has changed since it was built,
+are read from their source file instead, so development doesn't need the bundle at all.
+"""
+import functools
+import json
+import marshal
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+RESOURCES_DIRECTORY = Path("bot/resources")
+BUNDLE_PATH = RESOURCES_DIRECTORY / "resources.bundle"
+SOURCE_SUFFIXES = frozenset({".json", ".yaml", ".yml"})
+
+# The marshal format can change between Python versions, so the version that built the bundle is in its header
+BUNDLE_MAGIC = b"SLRB" + bytes(sys.version_info[:2])
+# The header is the magic followed by the length of the marshalled index
+HEADER = struct.Struct(f"<{len(BUNDLE_MAGIC)}sI")
+
+
+def _parse_source(path: Path) -> Any:
+    """Parse a resource from its source file."""
+    text = path.read_text("utf8")
+    if path.suffix == ".json":
+        return json.loads(text)
+    return yaml.safe_load(text)
+
+
+class _Bundle:
+    """A memory-mapped bundle of compiled resources."""
+
+    def __init__(self, path: Path):
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = HEADER.unpack_from(self._map)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"{path} was built by a different version of Python.")
+
+        # Maps resource names to (offset, length, source modification time, source size)
+        self.index: dict[str, tuple[int, int, int, int]] = marshal.loads(  # noqa: S302
+            self._map[HEADER.size:HEADER.size + index_length]
+        )
+
+    def get(self, name: str) -> Any:
+        """Decode the named resource, or return None if the bundle doesn't have an up to date copy of it."""
+        if name not in self.index:
+            return None
+
+        offset, length, mtime, size = self.index[name]
+        try:
+            stat = (RESOURCES_DIRECTORY / name).stat()
+        except FileNotFoundError:
+            pass
+        else:
+            if (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+                log.debug(f"The source of {name} changed after the resource bundle was built.")
+                return None
+
+        return marshal.loads(self._map[offset:offset + length])  # noqa: S302
+
+
+@functools.cache
+def _open_bundle() -> _Bundle | None:
+    """Open the resource bundle, or return None if there isn't a usable one."""
+    if not BUNDLE_PATH.exists():
+        log.debug(f"There is no resource bundle at {BUNDLE_PATH}, resources will be read from their source files.")
+        return None
+
+    try:
+        return _Bundle(BUNDLE_PATH)
+    except (ValueError, EOFError, struct.error) as e:
+        log.warning(f"Ignoring the resource bundle at {BUNDLE_PATH}: {e}")
+        return None
+
+
+def _resource_name(path: str | Path) -> str:
+    """
+    Return the name of a resource given its path.
+
+    The path can be relative to the resources directory or to the repo, or absolute.
+    """
+    path = Path(path)
+    if path.is_absolute() and path.is_relative_to(RESOURCES_DIRECTORY.absolute()):
+        path = path.relative_to(RESOURCES_DIRECTORY.absolute())
+    elif path.is_relative_to(RESOURCES_DIRECTORY):
+        path = path.relative_to(RESOURCES_DIRECTORY)
+    return path.as_posix()
+
+
+def load(path: str | Path) -> Any:
+    """
+    Load the JSON or YAML resource at `path`, which is relative to the resources directory.
+
+    Every call returns a new copy of the resource, so callers are free to modify it.
+    """
+    name = _resource_name(path)
+    if (bundle := _open_bundle()) and (resource := bundle.get(name)) is not None:
+        return resource
+    return _parse_source(RESOURCES_DIRECTORY / name)
+
+
+def build_bundle() -> int:
+    """Compile every JSON and YAML resource into the bundle at `BUNDLE_PATH`, returning how many were compiled."""
+    index = {}
+    payloads = []
+    offset = 0
+
+    for path in sorted(RESOURCES_DIRECTORY.rglob("*")):
+        if path.suffix not in SOURCE_SUFFIXES:
+            continue
+
+        try:
+            payload = marshal.dumps(_parse_source(path))
+        except ValueError:
+            # YAML can produce objects marshal can't encode, such as dates
+            log.warning(f"Can't compile {path} into the resource bundle, it will be read from its source file.")
+            continue
+
+        stat = path.stat()
+        index[path.relative_to(RESOURCES_DIRECTORY).as_posix()] = (offset, len(payload), stat.st_mtime_ns, stat.st_size)
+        payloads.append(payload)
+        offset += len(payload)
+
+    # Offsets are stored relative to the payloads, and made absolute once the size of the index is known.
+    # The index has to be marshalled twice, as making the offsets absolute can change its size.
+    start = 0
+    while True:
+        absolute = {name: (start + offset, *rest) for name, (offset, *rest) in index.items()}
+        encoded_index = marshal.dumps(absolute)
+        if HEADER.size + len(encoded_index) == start:
+            break
+        start = HEADER.size + len(encoded_index)
+
+    with BUNDLE_PATH.open("wb") as bundle:
+        bundle.write(HEADER.pack(BUNDLE_MAGIC, len(encoded_index)))
+        bundle.write(encoded_index)
+        for payload in payloads:
+            bundle.write(payload)
+
+    return len(index)
+
+
+if __name__ == "__main__":
+    count = build_bundle()
+    log.info(f"Compiled {count} resources into {BUNDLE_PATH}.")
@@ -0,0 +1,197 @@
+"""
+Run cog methods periodically in the months they're meant for.
+
+Seasonal tasks used to each run a loop of their own, which woke up every day all year to check whether the
+month was allowed. Instead, cogs mark their tasks with `seasonal_task`, and the bot's `SeasonalScheduler`
+computes when each schedule next runs. Out of season, it sleeps until the start of the next allowed month
+in one go, and tasks that share a schedule are run by a single wakeup. Tasks added in season are also run
+once straight away, like the loops did, so a run missed while the bot was down isn't skipped.
+"""
+import math
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from discord.ext import commands
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+
+from bot.constants import Client, Month
+from bot.utils import human_months
+
+ONE_DAY = 24 * 60 * 60
+
+log = get_logger(__name__)
+
+Task = Callable[[], Coroutine[Any, Any, None]]
+
+
+def _month_start(time: datetime) -> datetime:
+    return time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month_start(time: datetime) -> datetime:
+    return _month_start(_month_start(time) + timedelta(days=32))
+
+
+@dataclass(frozen=True)
+class SeasonalSchedule:
+    """
+    Run every `interval` seconds in `months`.
+
+    Runs are counted from the start of each allowed UTC month, so a daily task runs at midnight UTC.
+    """
+
+    months: frozenset[Month]
+    interval: float
+
+    def __str__(self) -> str:
+        return f"every {timedelta(seconds=self.interval)} in {human_months(sorted(self.months))}"
+
+    def in_season(self, time: datetime) -> bool:
+        """Return whether the schedule runs in the month of the given time."""
+        if Client.month_override is not None:
+            return Month(Client.month_override) in self.months
+        return Month(time.month) in self.months
+
+    def next_run(self, after: datetime) -> datetime | None:
+        """Return the first run after the given time, or None if the schedule never runs."""
+        if Client.month_override is not None:
+            # The month never changes, so the schedule either always runs or never does
+            if Month(Client.month_override) not in self.months:
+                return None
+            allowed = set(Month)
+        else:
+            allowed = self.months
+
+        start = _month_start(after)
+        # Every month is checked once, and the current month again a year later if its runs are over
+        for _ in range(13):
+            if Month(start.month) in allowed:
+                elapsed = (after - start).total_seconds()
+                run = start + timedelta(seconds=self.interval * (math.floor(elapsed / self.interval) + 1))
+                if elapsed < 0:
+                    run = start
+                if run < _next_month_start(start):
+                    return run
+            start = _next_month_start(start)
+        return None
+
+
+def seasonal_task(*allowed_months: Month, sleep_time: float = ONE_DAY) -> Callable[[Task], Task]:
+    """
+    Run the decorated cog method every `sleep_time` seconds in `allowed_months`, once its cog is added.
+
+    Sleep time defaults to a day. Runs are counted from the start of each month in UTC,
+    so by default the task runs at midnight UTC on each day of its months. If the cog is added in one of its
+    months, the task is also run once straight away.
+    """
+    schedule = SeasonalSchedule(frozenset(allowed_months), sleep_time)
+
+    def decorator(task: Task) -> Task:
+        task.__seasonal_schedule__ = schedule
+        return task
+    return decorator
+
+
+def seasonal_tasks(cog: type[commands.Cog]) -> dict[str, SeasonalSchedule]:
+    """Find the seasonal tasks of the cog class, by the names of their methods."""
+    schedules = {}
+    for base in reversed(cog.__mro__):
+        for name, value in vars(base).items():
+            if schedule := getattr(value, "__seasonal_schedule__", None):
+                schedules[name] = schedule
+    return schedules
+
+
+@dataclass
+class _RegisteredTask:
+    cog: commands.Cog
+    callback: Task
+    runs: int = 0
+    last_run: datetime | None = None
+
+    @property
+    def name(self) -> str:
+        return self.callback.__qualname__
+
+
+class SeasonalScheduler:
+    """Run the seasonal tasks of loaded cogs, waking once for all the tasks that share a schedule."""
+
+    def __init__(self):
+        self.tasks: dict[SeasonalSchedule, list[_RegisteredTask]] = defaultdict(list)
+        # When each schedule next runs, which is also the ID of its scheduled wakeup
+        self.next_runs: dict[SeasonalSchedule, datetime] = {}
+        # How many times the scheduler woke up to run tasks
+        self.wakeups = 0
+        self._scheduler = scheduling.Scheduler(type(self).__name__)
+
+    def add_cog(self, cog: commands.Cog) -> None:
+        """Schedule the cog's seasonal tasks, running the ones in season once straight away."""
+        now = datetime.now(tz=UTC)
+        for name, schedule in seasonal_tasks(type(cog)).items():
+            task = _RegisteredTask(cog, getattr(cog, name))
+            self.tasks[schedule].append(task)
+            log.info(f"Scheduled seasonal task {type(cog).__name__}.{name} to run {schedule}.")
+            # Runs are only due at the schedule's boundaries, so without this a run missed while the bot was down
+            # would be skipped, and nothing would run after a restart until the next boundary
+            if schedule.in_season(now):
+                self._start(task, now)
+            if schedule not in self.next_runs:
+                self._schedule_next(schedule, now)
+
+    def remove_cog(self, cog: commands.Cog) -> None:
+        """Stop running the cog's seasonal tasks, cancelling the wakeups of schedules left without tasks."""
+        for schedule, tasks in list(self.tasks.items()):
+            self.tasks[schedule] = [task for task in tasks if task.cog is not cog]
+            if not self.tasks[schedule]:
+                del self.tasks[schedule]
+                if (run := self.next_runs.pop(schedule, None)) is not None:
+                    self._scheduler.cancel((schedule, run))
+
+    def _schedule_next(self, schedule: SeasonalSchedule, after: datetime) -> None:
+        """Schedule the wakeup for the schedule's first run after the given time, if it ever runs again."""
+        run = schedule.next_run(after)
+        if run is None:
+            log.info(f"Seasonal tasks that run {schedule} won't run in {Month(Client.month_override)!s}.")
+            self.next_runs.pop(schedule, None)
+            return
+
+        self.next_runs[schedule] = run
+        self._scheduler.schedule_at(run, (schedule, run), self._run(schedule, run))
+
+    async def _run(self, schedule: SeasonalSchedule, run: datetime) -> None:
+        """Start every task of the schedule, then schedule its next run."""
+        self.wakeups += 1
+        # Sleeping can end a moment before the run was due, which mustn't lead to running it twice
+        self._schedule_next(schedule, max(datetime.now(tz=UTC), run))
+
+        for task in self.tasks.get(schedule, ()):
+            self._start(task, run)
+
+    @staticmethod
+    def _start(task: _RegisteredTask, run: datetime) -> None:
+        task.runs += 1
+        task.last_run = run
+        scheduling.create_task(task.callback(), name=f"{task.name} at {run:%Y-%m-%d %H:%M}")
+
+    def upcoming(self) -> list[tuple[datetime, SeasonalSchedule, list[str]]]:
+        """Return when each schedule next runs, with the names of its tasks, soonest first."""
+        return sorted(
+            ((run, schedule, [task.name for task in self.tasks[schedule]]) for schedule, run in self.next_runs.items()),
+            key=lambda upcoming: upcoming[0],
+        )
+
+    def format_upcoming(self) -> str:
+        """Format the upcoming runs of every schedule as a table, soonest first."""
+        lines = [f"{'next run (UTC)':<16} {'schedule':<40} tasks"]
+        for run, schedule, names in self.upcoming():
+            lines.append(f"{run:%Y-%m-%d %H:%M} {schedule!s:<40} {', '.join(names)}")
+
+        for schedule in sorted(set(self.tasks) - set(self.next_runs), key=str):
+            lines.append(f"{'never':<16} {schedule!s:<40} {', '.join(task.name for task in self.tasks[schedule])}")
+        lines.append(f"\nWoke up {self.wakeups} times to run seasonal tasks.")
+        return "\n".join(lines)
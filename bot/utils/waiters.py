@@ -0,0 +1,112 @@
+"""
+Wait for events that concern a particular message, channel or user.
+
+`Bot.wait_for` checks the predicate of every pending wait against every event of its type,
+so with many games running, every reaction costs a check per game. Waits registered here are
+indexed by what they concern instead, and an event is only checked against the waits for the
+message, channel and user it concerns.
+"""
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+# The keys of the waits an event is checked against, by event
+EVENT_KEYS: dict[str, Callable[..., tuple[tuple[str, int], ...]]] = {
+    "message": lambda message: (
+        ("channel", message.channel.id),
+        ("user", message.author.id),
+    ),
+    "reaction_add": lambda reaction, user: (
+        ("message", reaction.message.id),
+        ("channel", reaction.message.channel.id),
+        ("user", user.id),
+    ),
+    "reaction_remove": lambda reaction, user: (
+        ("message", reaction.message.id),
+        ("channel", reaction.message.channel.id),
+        ("user", user.id),
+    ),
+}
+
+
+class _Waiter:
+    __slots__ = ("check", "future")
+
+    def __init__(self, future: asyncio.Future, check: Callable[..., bool] | None):
+        self.future = future
+        self.check = check
+
+
+class WaiterRegistry:
+    """Resolve the waits for each event by the message, channel and user the event concerns."""
+
+    def __init__(self):
+        self._waiters: dict[tuple[str, str, int], list[_Waiter]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def wait_for(
+        self,
+        event: str,
+        *,
+        message: int | None = None,
+        channel: int | None = None,
+        user: int | None = None,
+        check: Callable[..., bool] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Wait for an `event` concerning the message, channel or user with the given ID that passes `check`.
+
+        Exactly one of `message`, `channel` and `user` must be given. A message event concerns its channel
+        and its author, and a reaction event concerns the message reacted to, that message's channel and the
+        reacting user. Otherwise this behaves like `Bot.wait_for`, including raising `TimeoutError`.
+        """
+        if event not in EVENT_KEYS:
+            raise ValueError(f"Can't wait for {event!r} events by their message, channel or user.")
+
+        keys = [
+            (kind, id_) for kind, id_ in (("message", message), ("channel", channel), ("user", user))
+            if id_ is not None
+        ]
+        if len(keys) != 1:
+            raise TypeError("Exactly one of message, channel and user must be given.")
+        key = (event, *keys[0])
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), check)
+        self._waiters[key].append(waiter)
+        try:
+            return await asyncio.wait_for(waiter.future, timeout)
+        finally:
+            self._remove(key, waiter)
+
+    def _remove(self, key: tuple[str, str, int], waiter: _Waiter) -> None:
+        """Remove the waiter if it's still registered, dropping its key once nothing waits on it."""
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        if waiter in waiters:
+            waiters.remove(waiter)
+        if not waiters:
+            del self._waiters[key]
+
+    def dispatch(self, event: str, *args: Any) -> None:
+        """Resolve the waits concerning what the event concerns whose checks pass."""
+        if not self._waiters or event not in EVENT_KEYS:
+            return
+
+        result = args[0] if len(args) == 1 else args
+        for kind, id_ in EVENT_KEYS[event](*args):
+            key = (event, kind, id_)
+            for waiter in list(self._waiters.get(key, ())):
+                if waiter.future.done():
+                    continue
+                try:
+                    if waiter.check is None or waiter.check(*args):
+                        waiter.future.set_result(result)
+                        self._remove(key, waiter)
+                except Exception as e:
+                    waiter.future.set_exception(e)
+                    self._remove(key, waiter)